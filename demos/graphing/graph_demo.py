@@ -6,7 +6,7 @@ style before adding to the scene using chainable style methods.
 """
 
 from manim import *
-from robo_manim_add_ons import graph, style
+from robo_manim_add_ons import graph, graph_many, style
 
 # Set white background for all scenes
 config.background_color = WHITE
@@ -86,6 +86,20 @@ class MultipleGraphsDemo(Scene):
         self.add(axes, plot1, plot2, label_sin, label_cos)
 
 
+class GraphManyDemo(Scene):
+    """Demo showing a family of graphs built in one call with graph_many()."""
+
+    def construct(self):
+        # One axes, one shared x-grid, one VGroup of plots
+        axes, plots = graph_many(
+            ["x", "x**2 / 2", "x**3 / 6", "exp(x) - 1"],
+            x_range=[-2, 2], y_range=[-2, 4],
+            colors=[RED, BLUE, GREEN_D, ORANGE]
+        )
+
+        self.add(axes, plots)
+
+
 class StyledAxesDemo(Scene):
     """Demo showing various axes styling options."""
 
@@ -5,21 +5,24 @@ Robo Manim Add-ons: A collection of utilities and extensions for Manim Community
 __version__ = "0.1.0"
 
 from .geometry_utils import perp, parallel, project, reflect, extended_line, pll, xl
-from .label_utils import vertex_labels, edge_labels
+from .label_utils import vertex_labels, edge_labels, TrackingLabels, tracking_vertex_labels, tracking_edge_labels, label_cache_info, clear_label_cache, configure_label_cache
+from .placement_utils import LabelPlacer
 from .annotation_utils import distance_marker, label, hatched_region, dm, hatch
-from .intersection_utils import intersect_lines, intersect_line_circle, ill, ilc
+from .intersection_utils import intersect_lines, intersect_line_circle, ill, ilc, segments_array, line_intersections, line_circle_intersections, intersection_points, intersection_cloud, segment_intersections, bezier_array, bezier_intersections, intersect_curves, icc, intersect, InfiniteLine, Ray, geometry_kind, register_geometry_kind, register_intersection, intersection_handler, IntersectionMarkers, live_intersections
 from .vector_utils import VectorUtils, addv, subv, sclv
-from .point_utils import PointUtils, addp
+from .point_utils import PointUtils, PointRef, addp
 from .text_utils import TextUtils, text, text2
 from .transform_utils import translated, rotated, scaled
 from .arrow_utils import ArrowUtil
 from .custom_objects import ArcDashedVMobject, ArcArrow
 from .exp_utils import Exp, x, y, st, ed, mid, mag, uv, vec, ang, slope, val, pt, m2v, v2m, x2v, vl, hl, lra, vra, r2p, ln, vt, tri, aa, aa2, rect, cr, sss, sas, ssa
-from .graph_utils import GraphUtils, graph
+from .graph_utils import GraphUtils, graph, graph_many
+from .calculus_utils import CalculusUtils, roots, extrema, derivative, tangent, area
+from .reactive_utils import Expr, ReactiveExp, rx, reactive, live
 from .style_utils import stroke, fill, sopacity, fopacity, sw, Style, style
 from .rogebra_scene import RogebraScene
 
-__all__ = ["perp", "parallel", "project", "reflect", "extended_line", "pll", "xl", "vertex_labels", "edge_labels", "distance_marker", "label", "hatched_region", "dm", "hatch", "intersect_lines", "intersect_line_circle", "ill", "ilc", "VectorUtils", "addv", "subv", "sclv", "PointUtils", "addp", "TextUtils", "text", "text2", "translated", "rotated", "scaled", "ArrowUtil", "ArcDashedVMobject", "ArcArrow", "Exp", "x", "y", "st", "ed", "mid", "mag", "uv", "vec", "ang", "slope", "val", "pt", "m2v", "v2m", "x2v", "vl", "hl", "lra", "vra", "r2p", "ln", "vt", "tri", "aa", "aa2", "rect", "cr", "sss", "sas", "ssa", "GraphUtils", "graph", "stroke", "fill", "sopacity", "fopacity", "sw", "Style", "style", "RogebraScene", "show_usage"]
+__all__ = ["perp", "parallel", "project", "reflect", "extended_line", "pll", "xl", "vertex_labels", "edge_labels", "TrackingLabels", "tracking_vertex_labels", "tracking_edge_labels", "label_cache_info", "clear_label_cache", "configure_label_cache", "LabelPlacer", "distance_marker", "label", "hatched_region", "dm", "hatch", "intersect_lines", "intersect_line_circle", "ill", "ilc", "segments_array", "line_intersections", "line_circle_intersections", "intersection_points", "intersection_cloud", "segment_intersections", "bezier_array", "bezier_intersections", "intersect_curves", "icc", "intersect", "InfiniteLine", "Ray", "geometry_kind", "register_geometry_kind", "register_intersection", "intersection_handler", "IntersectionMarkers", "live_intersections", "VectorUtils", "addv", "subv", "sclv", "PointUtils", "PointRef", "addp", "TextUtils", "text", "text2", "translated", "rotated", "scaled", "ArrowUtil", "ArcDashedVMobject", "ArcArrow", "Exp", "x", "y", "st", "ed", "mid", "mag", "uv", "vec", "ang", "slope", "val", "pt", "m2v", "v2m", "x2v", "vl", "hl", "lra", "vra", "r2p", "ln", "vt", "tri", "aa", "aa2", "rect", "cr", "sss", "sas", "ssa", "GraphUtils", "graph", "graph_many", "CalculusUtils", "roots", "extrema", "derivative", "tangent", "area", "Expr", "ReactiveExp", "rx", "reactive", "live", "stroke", "fill", "sopacity", "fopacity", "sw", "Style", "style", "RogebraScene", "show_usage"]
 
 
 def show_usage():
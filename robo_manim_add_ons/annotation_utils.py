@@ -5,7 +5,9 @@ This module provides utilities to create annotations like distance markers.
 """
 
 import numpy as np
-from manim import DoubleArrow, Line, MathTex, VGroup, Polygon, Intersection
+from manim import DoubleArrow, Line, MathTex, VGroup, VMobject, Polygon, Intersection
+from .hatch_utils import cached_hatch_segments
+from .path_utils import coords_to_points, segments_to_bezier_points
 
 
 def distance_marker(point1, point2=None, color="#1e40af", stroke_width=2, tick_size=0.25, text="", label_offset=0.3, marker_offset=0):
@@ -187,20 +189,32 @@ def label(latex_text, point1, point2, buff=0.5, alpha=0.5, auto_rotate=True):
     return label_obj
 
 
-def hatched_region(axes, vertices, spacing=0.2, direction="/", color="#808080", stroke_width=2):
+def hatched_region(axes, vertices, spacing=0.2, direction="/", color="#808080", stroke_width=2, holes=None, cache=True):
     """
     Creates a textbook-style shaded (hatched) region inside a polygon.
 
+    All hatch lines are clipped against the polygon in one vectorized scanline
+    pass (see hatch_utils.hatch_segments()), and the whole pattern is a single
+    VMobject with one subpath per hatch segment. Concave polygons are hatched
+    correctly, with several segments per line where needed, and holes are
+    left blank. The polygon's edges are cached by its normalized shape, so
+    moved or scaled copies of a shape reuse them with the same spacing.
+
     Args:
         axes: Manim Axes object for coordinate transformation
         vertices: List of (x, y) tuples defining polygon vertices in axes coordinates
-        spacing: Distance between hatch lines (default 0.2)
-        direction: Direction of hatching - "/" (default), "\\", "|" (vertical), "-" (horizontal)
+        spacing: Distance between hatch lines (default 0.2). For "/" and "\\" it is
+                 measured vertically, otherwise perpendicular to the lines
+        direction: Direction of hatching - "/" (default), "\\", "|" (vertical), "-" (horizontal),
+                   or the angle of the hatch lines in degrees (e.g. 30)
         color: Color of hatch lines (default GRAY)
         stroke_width: Width of hatch lines (default 2)
+        holes: Optional list of vertex lists (axes coordinates) cut out of the region
+        cache: Reuse cached hatch geometry (default True); see hatch_utils.cached_hatch_segments()
 
     Returns:
-        tuple: (hatched_lines VGroup, boundary_polygon Polygon)
+        tuple: (hatched_lines VMobject, boundary_polygon Polygon); hole outlines
+        are added to the boundary polygon as submobjects
 
     Example:
         >>> from manim import *
@@ -209,73 +223,25 @@ def hatched_region(axes, vertices, spacing=0.2, direction="/", color="#808080",
         >>> axes = Axes(x_range=[0, 10], y_range=[0, 10])
         >>> vertices = [(2, 2), (8, 2), (8, 6), (2, 6)]
         >>> hatched, boundary = hatched_region(axes, vertices, spacing=0.3, direction="/")
+        >>> crossed, _ = hatched_region(axes, vertices, spacing=0.3, direction=30)
+        >>> frame, _ = hatched_region(axes, vertices, holes=[[(4, 3), (6, 3), (6, 5), (4, 5)]])
         >>>
         >>> self.add(axes, boundary, hatched)
     """
-    from shapely.geometry import Polygon as ShapelyPolygon, LineString
-    from shapely.ops import unary_union
-
+    holes = list(holes) if holes is not None else []
     boundary_polygon = Polygon(*[axes.c2p(x, y) for x, y in vertices], fill_opacity=0)
-
-    # Create shapely polygon for clipping
-    shapely_poly = ShapelyPolygon([(x, y) for x, y in vertices])
-
-    # Create a large group of parallel lines covering the plotting area
-    x_min, x_max = axes.x_range[0], axes.x_range[1]
-    y_min, y_max = axes.y_range[0], axes.y_range[1]
-
-    hatched = VGroup()
-
-    # Generate hatch lines depending on the direction
-    if direction == "/":
-        # slope = +1
-        for b in np.arange(y_min - (x_max - x_min), y_max, spacing):
-            line_shapely = LineString([(x_min, b + x_min), (x_max, b + x_max)])
-            intersection = shapely_poly.intersection(line_shapely)
-            if not intersection.is_empty:
-                if hasattr(intersection, 'coords'):
-                    coords = list(intersection.coords)
-                    if len(coords) >= 2:
-                        start = axes.c2p(coords[0][0], coords[0][1])
-                        end = axes.c2p(coords[-1][0], coords[-1][1])
-                        hatched.add(Line(start, end, color=color, stroke_width=stroke_width))
-
-    elif direction == "\\":
-        # slope = -1
-        for b in np.arange(y_min, y_max + (x_max - x_min), spacing):
-            line_shapely = LineString([(x_min, b - x_min), (x_max, b - x_max)])
-            intersection = shapely_poly.intersection(line_shapely)
-            if not intersection.is_empty:
-                if hasattr(intersection, 'coords'):
-                    coords = list(intersection.coords)
-                    if len(coords) >= 2:
-                        start = axes.c2p(coords[0][0], coords[0][1])
-                        end = axes.c2p(coords[-1][0], coords[-1][1])
-                        hatched.add(Line(start, end, color=color, stroke_width=stroke_width))
-
-    elif direction == "|":   # vertical stripes
-        for x in np.arange(x_min, x_max, spacing):
-            line_shapely = LineString([(x, y_min), (x, y_max)])
-            intersection = shapely_poly.intersection(line_shapely)
-            if not intersection.is_empty:
-                if hasattr(intersection, 'coords'):
-                    coords = list(intersection.coords)
-                    if len(coords) >= 2:
-                        start = axes.c2p(coords[0][0], coords[0][1])
-                        end = axes.c2p(coords[-1][0], coords[-1][1])
-                        hatched.add(Line(start, end, color=color, stroke_width=stroke_width))
-
-    elif direction == "-":   # horizontal stripes
-        for y in np.arange(y_min, y_max, spacing):
-            line_shapely = LineString([(x_min, y), (x_max, y)])
-            intersection = shapely_poly.intersection(line_shapely)
-            if not intersection.is_empty:
-                if hasattr(intersection, 'coords'):
-                    coords = list(intersection.coords)
-                    if len(coords) >= 2:
-                        start = axes.c2p(coords[0][0], coords[0][1])
-                        end = axes.c2p(coords[-1][0], coords[-1][1])
-                        hatched.add(Line(start, end, color=color, stroke_width=stroke_width))
+    for hole in holes:
+        boundary_polygon.add(Polygon(*[axes.c2p(x, y) for x, y in hole], fill_opacity=0))
+
+    # Anchor the pattern at the lower-left corner of the axes so it does not shift with the polygon
+    anchor = (axes.x_range[0], axes.y_range[0])
+    segments = cached_hatch_segments([vertices, *holes], spacing=spacing, direction=direction, anchor=anchor,
+                                     cache=cache)
+
+    flat = segments.reshape(-1, 2)
+    scene_segments = coords_to_points(axes, flat[:, 0], flat[:, 1]).reshape(-1, 2, 3)
+    hatched = VMobject(color=color, stroke_width=stroke_width)
+    hatched.set_points(segments_to_bezier_points(scene_segments))
 
     return hatched, boundary_polygon
 
@@ -0,0 +1,118 @@
+"""
+Cache utilities shared by the plotting and labeling helpers.
+
+Provides a small bounded LRU cache with hit/miss counters and an on/off switch.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit/miss statistics.
+
+    Entries are evicted oldest-first once more than `maxsize` keys are stored.
+    When `enabled` is False, lookups always miss and nothing is stored.
+
+    Example:
+        >>> cache = LRUCache(maxsize=2)
+        >>> cache.put("a", 1)
+        >>> cache.get("a")
+        1
+        >>> cache.info()
+        {'hits': 1, 'misses': 0, 'size': 1, 'maxsize': 2, 'enabled': True}
+    """
+
+    _MISSING = object()
+
+    def __init__(self, maxsize=128, enabled=True):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries kept (default 128)
+            enabled: Whether the cache stores and returns entries (default True)
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key, default=None):
+        """
+        Look up a key, marking it as most recently used.
+
+        Args:
+            key: Hashable cache key
+            default: Value returned on a miss (default None)
+
+        Returns:
+            The cached value, or `default` if the key is absent or the cache is disabled
+        """
+        if not self.enabled:
+            return default
+        value = self._entries.get(key, self._MISSING)
+        if value is self._MISSING:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries if over capacity.
+
+        Args:
+            key: Hashable cache key
+            value: Value to store
+        """
+        if not self.enabled:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def resize(self, maxsize):
+        """
+        Change the capacity, evicting entries if the cache is now too large.
+
+        Args:
+            maxsize: New maximum number of entries
+        """
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, size, maxsize and enabled
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "enabled": self.enabled,
+        }
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,353 @@
+"""
+Numeric calculus utilities for explicit plots.
+
+Provides roots, extrema, derivatives, tangent lines and areas for plots
+created by GraphUtils.graph() (or any callable f(x)), computed with NumPy
+from the plot's samples instead of going back to sympy.
+"""
+
+import numpy as np
+from typing import List, Tuple
+from .sampling_utils import evaluate
+
+# Grid used when a plot carries no samples of its own
+_DEFAULT_SAMPLES = 1025
+
+_EPS = np.finfo(float).eps
+
+
+def brent(func, a, b, xtol=1e-12, max_iter=100, fa=None, fb=None) -> np.ndarray:
+    """
+    Find a root in each bracket [a_k, b_k] with Brent's method, all brackets at once.
+
+    Every iteration makes a single vectorized call to func for all brackets
+    that have not converged yet.
+
+    Args:
+        func: Vectorized callable f(x)
+        a: Array of left bracket ends
+        b: Array of right bracket ends; f(a_k) and f(b_k) must differ in sign
+        xtol: Absolute tolerance on the root (default 1e-12)
+        max_iter: Maximum number of iterations (default 100)
+        fa: Optional known values f(a), to skip re-evaluating them
+        fb: Optional known values f(b)
+
+    Returns:
+        Array of roots (same shape as a)
+
+    Example:
+        >>> brent(np.sin, np.array([3.0, 6.0]), np.array([3.5, 6.5]))  # [π, 2π]
+    """
+    a = np.array(a, dtype=float).ravel()
+    b = np.array(b, dtype=float).ravel()
+    fa = evaluate(func, a).copy() if fa is None else np.array(fa, dtype=float).ravel()
+    fb = evaluate(func, b).copy() if fb is None else np.array(fb, dtype=float).ravel()
+    c, fc = b.copy(), fb.copy()
+    d = e = b - a
+    active = np.ones(len(a), dtype=bool)
+
+    for _ in range(int(max_iter)):
+        # Keep the root bracketed between b and c
+        same = np.sign(fb) == np.sign(fc)
+        c = np.where(same, a, c)
+        fc = np.where(same, fa, fc)
+        d = np.where(same, b - a, d)
+        e = np.where(same, b - a, e)
+
+        # Make b the best estimate
+        swap = np.abs(fc) < np.abs(fb)
+        a, b, c = np.where(swap, b, a), np.where(swap, c, b), np.where(swap, b, c)
+        fa, fb, fc = np.where(swap, fb, fa), np.where(swap, fc, fb), np.where(swap, fb, fc)
+
+        tol1 = 2 * _EPS * np.abs(b) + 0.5 * xtol
+        xm = 0.5 * (c - b)
+        active &= (np.abs(xm) > tol1) & (fb != 0)
+        if not active.any():
+            break
+
+        # Inverse quadratic interpolation, or the secant step when a == c
+        with np.errstate(all="ignore"):
+            s = fb / fa
+            q_ac, r = fa / fc, fb / fc
+            secant = a == c
+            p = np.where(secant, 2 * xm * s, s * (2 * xm * q_ac * (q_ac - r) - (b - a) * (r - 1)))
+            q = np.where(secant, 1 - s, (q_ac - 1) * (r - 1) * (s - 1))
+        q = np.where(p > 0, -q, q)
+        p = np.abs(p)
+        interpolate = (np.abs(e) >= tol1) & (np.abs(fa) > np.abs(fb))
+        accept = interpolate & (2 * p < np.minimum(3 * xm * q - np.abs(tol1 * q), np.abs(e * q)))
+        with np.errstate(all="ignore"):
+            e = np.where(accept, d, xm)
+            d = np.where(accept, p / q, xm)
+
+        # Take the step (at least tol1) for active brackets only
+        step = np.where(np.abs(d) > tol1, d, np.copysign(tol1, xm))
+        a = np.where(active, b, a)
+        fa = np.where(active, fb, fa)
+        b = np.where(active, b + step, b)
+        if active.any():
+            fb = fb.copy()
+            fb[active] = evaluate(func, b[active])
+
+    return b
+
+
+class CalculusUtils:
+    """
+    Numeric analysis on explicit plots.
+
+    Functions accept a plot returned by GraphUtils.graph() (anything with an
+    underlying_function, such as axes.plot() results and SampledPlot) or a
+    plain vectorized callable f(x).
+    """
+
+    @staticmethod
+    def _function(plot):
+        """Get the callable f(x) behind a plot."""
+        func = getattr(plot, "underlying_function", None)
+        if func is None and callable(plot):
+            func = plot
+        if func is None:
+            raise TypeError(f"Expected an explicit plot or a callable f(x), got {type(plot).__name__}")
+        return func
+
+    @staticmethod
+    def _samples(plot, x_range=None, samples=None) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get (xs, ys) sample runs for a plot, reusing SampledPlot samples when possible.
+
+        Each run is continuous; brackets are never formed across gaps between runs.
+        """
+        polylines = getattr(plot, "polylines", None)
+        if polylines and samples is None:
+            runs = []
+            for line in polylines:
+                xs, ys = line[:, 0], line[:, 1]
+                if x_range is not None:
+                    keep = (xs >= x_range[0]) & (xs <= x_range[1])
+                    xs, ys = xs[keep], ys[keep]
+                if len(xs) >= 2:
+                    runs.append((xs, ys))
+            return runs
+
+        if x_range is None:
+            t_min, t_max = getattr(plot, "t_min", None), getattr(plot, "t_max", None)
+            if t_min is None or t_max is None:
+                raise ValueError("x_range is required for plots without samples")
+            x_range = [t_min, t_max]
+        xs = np.linspace(float(x_range[0]), float(x_range[1]), samples or _DEFAULT_SAMPLES)
+        return [(xs, evaluate(CalculusUtils._function(plot), xs))]
+
+    @staticmethod
+    def _sign_change_roots(func, runs) -> np.ndarray:
+        """Refine every sign change (and exact zero) in the sample runs with Brent's method."""
+        lefts, rights, exact = [], [], []
+        for xs, ys in runs:
+            finite = np.isfinite(ys)
+            exact.append(xs[finite & (ys == 0)])
+            with np.errstate(invalid="ignore"):
+                change = np.flatnonzero(finite[:-1] & finite[1:] & (ys[:-1] * ys[1:] < 0))
+            lefts.append(np.stack([xs[change], ys[change]]))
+            rights.append(np.stack([xs[change + 1], ys[change + 1]]))
+        (a, fa), (b, fb) = np.concatenate(lefts, axis=1), np.concatenate(rights, axis=1)
+        if len(a) == 0:
+            return np.unique(np.concatenate(exact))
+
+        roots = brent(func, a, b, fa=fa, fb=fb)
+        # Poles also change sign; keep only brackets where f actually vanishes
+        with np.errstate(invalid="ignore"):
+            genuine = np.abs(evaluate(func, roots)) <= 1e-6 * np.maximum(1.0, np.abs(fa) + np.abs(fb))
+        return np.unique(np.concatenate([roots[genuine], *exact]))
+
+    @staticmethod
+    def roots(plot, x_range=None, samples=None) -> np.ndarray:
+        """
+        Find the roots of f(x) = 0.
+
+        Sign changes between consecutive samples are bracketed and refined with
+        a vectorized Brent solver. Sign changes across poles are discarded.
+        Roots where f touches zero without changing sign (e.g. x**2) are only
+        found if a sample lands on them exactly.
+
+        Args:
+            plot: Plot from graph() or a callable f(x)
+            x_range: Optional [x_min, x_max] to search (default: the plot's samples or t_range)
+            samples: Optional grid size; if given, f is re-sampled uniformly instead
+                of using the plot's own samples
+
+        Returns:
+            Sorted array of roots
+
+        Example:
+            >>> axes, plot = graph("x**3 - x")
+            >>> roots(plot)  # array([-1., 0., 1.])
+        """
+        func = CalculusUtils._function(plot)
+        return CalculusUtils._sign_change_roots(func, CalculusUtils._samples(plot, x_range, samples))
+
+    @staticmethod
+    def derivative(plot, x, order=1, method="central", h=None):
+        """
+        Evaluate the derivative of f numerically.
+
+        Args:
+            plot: Plot from graph() or a callable f(x)
+            x: Scalar or array of x-values
+            order: 1 or 2 (default 1)
+            method: "central" (default) central differences, or "complex" for
+                the complex-step derivative (first order only; exact to rounding
+                for analytic functions, but wrong for abs(), floor() etc.)
+            h: Optional step size (default chosen from machine precision)
+
+        Returns:
+            Derivative value(s) with the shape of x
+
+        Example:
+            >>> derivative(plot, 0.0)                    # f'(0)
+            >>> derivative(plot, xs, method="complex")   # vectorized
+        """
+        func = CalculusUtils._function(plot)
+        x = np.asarray(x, dtype=float)
+        scale = np.maximum(1.0, np.abs(x))
+        if method == "complex":
+            if order != 1:
+                raise ValueError("The complex-step method only supports order=1")
+            step = h if h is not None else 1e-20
+            with np.errstate(all="ignore"):
+                values = np.asarray(func(x + 1j * step * scale))
+            result = np.broadcast_to(np.imag(values) / (step * scale), x.shape)
+            return result[()] if x.ndim == 0 else result
+        if method != "central":
+            raise ValueError(f"Unknown derivative method '{method}'. Use 'central' or 'complex'.")
+        if order == 1:
+            step = (h if h is not None else _EPS ** (1 / 3)) * scale
+            result = (evaluate(func, x + step) - evaluate(func, x - step)) / (2 * step)
+        elif order == 2:
+            step = (h if h is not None else _EPS ** (1 / 4)) * scale
+            result = (evaluate(func, x + step) - 2 * evaluate(func, x) + evaluate(func, x - step)) / step ** 2
+        else:
+            raise ValueError(f"order must be 1 or 2, got {order}")
+        return result[()] if x.ndim == 0 else result
+
+    @staticmethod
+    def extrema(plot, x_range=None, samples=None) -> List[Tuple[float, float, str]]:
+        """
+        Find local maxima and minima.
+
+        Turning points of the samples are bracketed and the zero of the
+        central-difference derivative is refined with Brent's method.
+
+        Args:
+            plot: Plot from graph() or a callable f(x)
+            x_range: Optional [x_min, x_max] to search
+            samples: Optional uniform grid size (default: the plot's own samples)
+
+        Returns:
+            List of (x, y, kind) tuples sorted by x, where kind is "max" or "min"
+
+        Example:
+            >>> extrema(graph("x**3 - 3x")[1])  # [(-1.0, 2.0, 'max'), (1.0, -2.0, 'min')]
+        """
+        func = CalculusUtils._function(plot)
+        lefts, rights = [], []
+        for xs, ys in CalculusUtils._samples(plot, x_range, samples):
+            if len(xs) < 3:
+                continue
+            slope = np.diff(ys)
+            with np.errstate(invalid="ignore"):
+                turn = np.isfinite(slope[:-1]) & np.isfinite(slope[1:]) & (slope[:-1] * slope[1:] <= 0) & \
+                       ((slope[:-1] != 0) | (slope[1:] != 0))
+            lefts.append(xs[:-2][turn])
+            rights.append(xs[2:][turn])
+        if not lefts or sum(len(a) for a in lefts) == 0:
+            return []
+
+        a, b = np.concatenate(lefts), np.concatenate(rights)
+
+        def slope(x):
+            return CalculusUtils.derivative(func, x)
+
+        # Brackets from a flat sample pair may not change derivative sign; fall back to the midpoint
+        sa, sb = slope(a), slope(b)
+        bracketed = sa * sb < 0
+        xs = (a + b) / 2
+        if bracketed.any():
+            xs[bracketed] = brent(slope, a[bracketed], b[bracketed], xtol=1e-10)
+        xs = np.unique(xs)
+        ys = evaluate(func, xs)
+        curvature = CalculusUtils.derivative(func, xs, order=2)
+        return [(float(x), float(y), "max" if k < 0 else "min") for x, y, k in zip(xs, ys, curvature) if np.isfinite(y)]
+
+    @staticmethod
+    def tangent(plot, x0) -> Tuple[float, float]:
+        """
+        Get the tangent line of f at x0.
+
+        Args:
+            plot: Plot from graph() or a callable f(x)
+            x0: Point of tangency
+
+        Returns:
+            Tuple of (slope, intercept) so that the tangent is y = slope * x + intercept
+
+        Example:
+            >>> slope, intercept = tangent(plot, 1.0)
+            >>> line = axes.plot(lambda x: slope * x + intercept)
+        """
+        func = CalculusUtils._function(plot)
+        slope = float(CalculusUtils.derivative(func, float(x0)))
+        y0 = float(evaluate(func, np.array([float(x0)]))[0])
+        return slope, y0 - slope * float(x0)
+
+    @staticmethod
+    def area(plot, a, b, intervals=1024) -> float:
+        """
+        Integrate f from a to b with the composite Simpson rule.
+
+        The function is evaluated once on an (intervals + 1)-point grid.
+        Undefined values count as zero.
+
+        Args:
+            plot: Plot from graph() or a callable f(x)
+            a: Lower limit
+            b: Upper limit
+            intervals: Number of subintervals, rounded up to even (default 1024)
+
+        Returns:
+            Signed area
+
+        Example:
+            >>> area(graph("x**2")[1], 0, 3)  # 9.0
+        """
+        func = CalculusUtils._function(plot)
+        n = max(2, int(intervals) + int(intervals) % 2)
+        xs = np.linspace(float(a), float(b), n + 1)
+        ys = np.nan_to_num(evaluate(func, xs), nan=0.0, posinf=0.0, neginf=0.0)
+        h = (float(b) - float(a)) / n
+        return float(h / 3 * (ys[0] + ys[-1] + 4 * ys[1:-1:2].sum() + 2 * ys[2:-1:2].sum()))
+
+
+# Convenience functions at module level
+def roots(plot, x_range=None, samples=None) -> np.ndarray:
+    """Find roots of an explicit plot. See CalculusUtils.roots()."""
+    return CalculusUtils.roots(plot, x_range, samples)
+
+
+def extrema(plot, x_range=None, samples=None) -> List[Tuple[float, float, str]]:
+    """Find local maxima and minima of an explicit plot. See CalculusUtils.extrema()."""
+    return CalculusUtils.extrema(plot, x_range, samples)
+
+
+def derivative(plot, x, order=1, method="central", h=None):
+    """Evaluate the derivative of an explicit plot. See CalculusUtils.derivative()."""
+    return CalculusUtils.derivative(plot, x, order, method, h)
+
+
+def tangent(plot, x0) -> Tuple[float, float]:
+    """Get (slope, intercept) of the tangent at x0. See CalculusUtils.tangent()."""
+    return CalculusUtils.tangent(plot, x0)
+
+
+def area(plot, a, b, intervals=1024) -> float:
+    """Integrate an explicit plot from a to b. See CalculusUtils.area()."""
+    return CalculusUtils.area(plot, a, b, intervals)
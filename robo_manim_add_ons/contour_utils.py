@@ -0,0 +1,408 @@
+"""
+Contour utilities for implicit curves f(x, y) = 0.
+
+Provides a vectorized marching-squares engine with quadtree refinement of the
+cells that straddle the curve, optional tiling and chunked evaluation for large
+grids, and stitching of the resulting segments into polylines. Sign changes
+through poles (e.g. y - tan(x) at x = π/2) are detected and skipped.
+"""
+
+import numpy as np
+from typing import List
+from .sampling_utils import evaluate
+
+# Cell corners are ordered (bottom-left, bottom-right, top-right, top-left).
+# Edges: 0 = bottom (BL->BR), 1 = right (BR->TR), 2 = top (TL->TR), 3 = left (BL->TL).
+# Every edge is oriented towards increasing x or y, so a shared edge is
+# interpolated identically from both neighbouring cells.
+_EDGE_CORNERS = np.array([[0, 1], [1, 2], [3, 2], [0, 3]])
+
+# Segment table: case index (bit i set when corner i is positive) -> up to two
+# (edge, edge) pairs, -1 for unused slots. Saddle cases 5 and 10 are listed
+# for a negative cell center and patched below for a positive one.
+_SEGMENTS = np.full((16, 2, 2), -1, dtype=np.int64)
+for _case, _pairs in {
+    1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)],
+    5: [(3, 0), (1, 2)], 6: [(0, 2)], 7: [(3, 2)], 8: [(2, 3)],
+    9: [(0, 2)], 10: [(0, 1), (2, 3)], 11: [(1, 2)], 12: [(1, 3)],
+    13: [(0, 1)], 14: [(0, 3)],
+}.items():
+    for _slot, _pair in enumerate(_pairs):
+        _SEGMENTS[_case, _slot] = _pair
+
+_SEGMENTS_POSITIVE_CENTER = _SEGMENTS.copy()
+_SEGMENTS_POSITIVE_CENTER[5] = [(0, 1), (2, 3)]
+_SEGMENTS_POSITIVE_CENTER[10] = [(3, 0), (1, 2)]
+
+# Bisection steps used to tell a zero crossing from a pole on a cell edge
+_POLE_BISECTIONS = 8
+
+
+def _straddles(corners: np.ndarray) -> np.ndarray:
+    """Mask of cells whose finite corner values change sign."""
+    positive = corners > 0
+    finite = np.isfinite(corners).all(axis=1)
+    return finite & positive.any(axis=1) & ~positive.all(axis=1)
+
+
+def _crosses_pole(evaluate_points, cells, corners, lattice) -> np.ndarray:
+    """
+    Mask of unit cells whose sign change goes through a pole instead of a zero.
+
+    Every sign-changing edge is bisected a few times. Towards a zero the
+    smaller end value shrinks; towards a pole (or a jump) it grows, so a cell
+    with any edge whose bracket ends up larger than it started is a pole cell.
+    """
+    x_min, y_min, dx, dy = lattice[:4]
+    i0, j0 = cells[:, 0], cells[:, 1]
+    corner_x = x_min + np.stack([i0, i0 + 1, i0 + 1, i0], axis=1) * dx
+    corner_y = y_min + np.stack([j0, j0, j0 + 1, j0 + 1], axis=1) * dy
+    a, b = corners[:, _EDGE_CORNERS[:, 0]], corners[:, _EDGE_CORNERS[:, 1]]
+    changes = (a > 0) != (b > 0)
+    cell_index, edge = np.nonzero(changes)
+    if len(cell_index) == 0:
+        return np.zeros(len(cells), dtype=bool)
+
+    lo_x, hi_x = corner_x[cell_index, _EDGE_CORNERS[edge, 0]], corner_x[cell_index, _EDGE_CORNERS[edge, 1]]
+    lo_y, hi_y = corner_y[cell_index, _EDGE_CORNERS[edge, 0]], corner_y[cell_index, _EDGE_CORNERS[edge, 1]]
+    lo_v, hi_v = a[cell_index, edge], b[cell_index, edge]
+    start = np.minimum(np.abs(lo_v), np.abs(hi_v))
+    lo_positive = lo_v > 0
+    for _ in range(_POLE_BISECTIONS):
+        mid_x, mid_y = (lo_x + hi_x) / 2, (lo_y + hi_y) / 2
+        mid_v = evaluate_points(mid_x, mid_y)
+        move_lo = (mid_v > 0) == lo_positive
+        lo_x, lo_y, lo_v = np.where(move_lo, mid_x, lo_x), np.where(move_lo, mid_y, lo_y), np.where(move_lo, mid_v, lo_v)
+        hi_x, hi_y, hi_v = np.where(move_lo, hi_x, mid_x), np.where(move_lo, hi_y, mid_y), np.where(move_lo, hi_v, mid_v)
+    end = np.fmin(np.abs(lo_v), np.abs(hi_v))
+
+    pole = np.zeros(len(cells), dtype=bool)
+    pole[cell_index[end > start]] = True
+    return pole
+
+
+def _grid_shape(resolution):
+    """Get the coarse grid (nx, ny) from an int or pair, validating it."""
+    nx, ny = (resolution, resolution) if np.isscalar(resolution) else resolution
+    nx, ny = int(nx), int(ny)
+    if nx < 1 or ny < 1:
+        raise ValueError(f"resolution must be positive, got {resolution}")
+    return nx, ny
+
+
+def tile_ranges(resolution, tiles) -> List[tuple]:
+    """
+    Split the coarse grid into rectangular tiles.
+
+    Args:
+        resolution: Coarse grid cells per axis, int or (nx, ny)
+        tiles: Tiles per axis, int or (tx, ty); clamped to the grid size
+
+    Returns:
+        List of (i0, i1, j0, j1) coarse cell index ranges (end-exclusive)
+
+    Example:
+        >>> tile_ranges(64, 2)  # [(0, 32, 0, 32), (32, 64, 0, 32), (0, 32, 32, 64), (32, 64, 32, 64)]
+    """
+    nx, ny = _grid_shape(resolution)
+    tx, ty = (tiles, tiles) if np.isscalar(tiles) else tiles
+    tx, ty = min(max(int(tx), 1), nx), min(max(int(ty), 1), ny)
+    x_edges = np.linspace(0, nx, tx + 1).round().astype(int)
+    y_edges = np.linspace(0, ny, ty + 1).round().astype(int)
+    return [
+        (int(x_edges[a]), int(x_edges[a + 1]), int(y_edges[b]), int(y_edges[b + 1]))
+        for b in range(ty) for a in range(tx)
+    ]
+
+
+def contour_cells(func, x_range, y_range, resolution=64, refine_depth=3, tile=None, chunk_size=None):
+    """
+    Find the finest-level lattice cells that straddle f(x, y) = 0.
+
+    The function is evaluated once on the full coarse grid; each straddling cell
+    is then split into four (quadtree) for `refine_depth` levels, evaluating
+    only the five new points per refined cell. Finest cells whose sign change
+    is a pole rather than a zero are dropped (see _crosses_pole()).
+
+    Args:
+        func: Vectorized callable f(x, y)
+        x_range: [x_min, x_max]
+        y_range: [y_min, y_max]
+        resolution: Coarse grid cells per axis, int or (nx, ny) (default 64)
+        refine_depth: Number of quadtree refinement levels (default 3)
+        tile: Optional (i0, i1, j0, j1) coarse cell range from tile_ranges();
+            only those cells are processed, on the lattice of the whole grid
+        chunk_size: Optional maximum number of points per call to func, to
+            bound memory on large grids (default: no limit)
+
+    Returns:
+        Tuple of (cells, corners, lattice) where cells is an (M, 2) int array of
+        lattice indices of each cell's bottom-left corner, corners is an (M, 4)
+        array of corner values, and lattice is (x_min, y_min, dx, dy, nx, ny) at
+        the finest level
+    """
+    nx, ny = _grid_shape(resolution)
+    if refine_depth < 0:
+        raise ValueError(f"refine_depth must be non-negative, got {refine_depth}")
+    i_start, i_stop, j_start, j_stop = tile if tile is not None else (0, nx, 0, ny)
+
+    x_min, x_max = float(x_range[0]), float(x_range[1])
+    y_min, y_max = float(y_range[0]), float(y_range[1])
+    factor = 2 ** int(refine_depth)
+    fine_nx, fine_ny = nx * factor, ny * factor
+    dx = (x_max - x_min) / fine_nx
+    dy = (y_max - y_min) / fine_ny
+
+    def evaluate_points(xs, ys):
+        if chunk_size is None or xs.size <= chunk_size:
+            return evaluate(func, xs, ys)
+        flat_x, flat_y = xs.ravel(), ys.ravel()
+        values = np.empty(flat_x.shape)
+        for start in range(0, len(flat_x), int(chunk_size)):
+            part = slice(start, start + int(chunk_size))
+            values[part] = evaluate(func, flat_x[part], flat_y[part])
+        return values.reshape(xs.shape)
+
+    def evaluate_lattice(i, j):
+        # Positions are computed from integer lattice indices so that shared
+        # vertices evaluate to bit-identical values from every cell (and tile).
+        return evaluate_points(x_min + i * dx, y_min + j * dy)
+
+    # One evaluation over the whole coarse grid (of this tile)
+    grid_i, grid_j = np.meshgrid(np.arange(i_start, i_stop + 1) * factor, np.arange(j_start, j_stop + 1) * factor)
+    grid = evaluate_lattice(grid_i, grid_j)
+    corners = np.stack([grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]], axis=-1).reshape(-1, 4)
+    cells = np.stack([grid_i[:-1, :-1], grid_j[:-1, :-1]], axis=-1).reshape(-1, 2)
+
+    keep = _straddles(corners)
+    cells, corners = cells[keep], corners[keep]
+
+    size = factor
+    for _ in range(int(refine_depth)):
+        if len(cells) == 0:
+            break
+        half = size // 2
+        i0, j0 = cells[:, 0], cells[:, 1]
+        # New points: bottom-mid, right-mid, top-mid, left-mid, center
+        new_i = np.stack([i0 + half, i0 + size, i0 + half, i0, i0 + half], axis=1)
+        new_j = np.stack([j0, j0 + half, j0 + size, j0 + half, j0 + half], axis=1)
+        bottom, right, top, left, center = evaluate_lattice(new_i, new_j).T
+        bl, br, tr, tl = corners.T
+
+        corners = np.concatenate([
+            np.stack([bl, bottom, center, left], axis=1),
+            np.stack([bottom, br, right, center], axis=1),
+            np.stack([center, right, tr, top], axis=1),
+            np.stack([left, center, top, tl], axis=1),
+        ])
+        cells = np.concatenate([
+            np.stack([i0, j0], axis=1),
+            np.stack([i0 + half, j0], axis=1),
+            np.stack([i0 + half, j0 + half], axis=1),
+            np.stack([i0, j0 + half], axis=1),
+        ])
+        keep = _straddles(corners)
+        cells, corners = cells[keep], corners[keep]
+        size = half
+
+    lattice = (x_min, y_min, dx, dy, fine_nx, fine_ny)
+    if len(cells):
+        keep = ~_crosses_pole(evaluate_points, cells, corners, lattice)
+        cells, corners = cells[keep], corners[keep]
+    return cells, corners, lattice
+
+
+def contour_segments(cells, corners, lattice):
+    """
+    Run marching squares on straddling unit cells.
+
+    Args:
+        cells: (M, 2) lattice indices from contour_cells()
+        corners: (M, 4) corner values from contour_cells()
+        lattice: Lattice description from contour_cells()
+
+    Returns:
+        Tuple of (edge_ids, points) where edge_ids is an (S, 2) int array of the
+        lattice edges each segment connects, and points is an (S, 2, 2) array of
+        the segment endpoints in axes coordinates
+    """
+    if len(cells) == 0:
+        return np.zeros((0, 2), dtype=np.int64), np.zeros((0, 2, 2))
+
+    x_min, y_min, dx, dy, fine_nx, _ = lattice
+    i0, j0 = cells[:, 0], cells[:, 1]
+
+    # Corner positions in axes coordinates
+    corner_x = x_min + np.stack([i0, i0 + 1, i0 + 1, i0], axis=1) * dx
+    corner_y = y_min + np.stack([j0, j0, j0 + 1, j0 + 1], axis=1) * dy
+
+    # Linear interpolation of the zero crossing along every edge of every cell
+    a = corners[:, _EDGE_CORNERS[:, 0]]
+    b = corners[:, _EDGE_CORNERS[:, 1]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(a != b, a / (a - b), 0.5)
+    t = np.clip(t, 0.0, 1.0)
+    edge_x = corner_x[:, _EDGE_CORNERS[:, 0]] + t * (corner_x[:, _EDGE_CORNERS[:, 1]] - corner_x[:, _EDGE_CORNERS[:, 0]])
+    edge_y = corner_y[:, _EDGE_CORNERS[:, 0]] + t * (corner_y[:, _EDGE_CORNERS[:, 1]] - corner_y[:, _EDGE_CORNERS[:, 0]])
+
+    # Global edge ids: horizontal edge at vertex (i, j) -> 2 * v, vertical -> 2 * v + 1
+    row = fine_nx + 1
+    edge_ids = np.stack([
+        2 * (j0 * row + i0),
+        2 * (j0 * row + i0 + 1) + 1,
+        2 * ((j0 + 1) * row + i0),
+        2 * (j0 * row + i0) + 1,
+    ], axis=1)
+
+    case = (corners > 0).astype(np.int64) @ np.array([1, 2, 4, 8])
+    positive_center = corners.mean(axis=1) > 0
+    table = np.where(positive_center[:, None, None], _SEGMENTS_POSITIVE_CENTER[case], _SEGMENTS[case])
+
+    cell_index, slot = np.nonzero(table[:, :, 0] >= 0)
+    ea = table[cell_index, slot, 0]
+    eb = table[cell_index, slot, 1]
+
+    ids = np.stack([edge_ids[cell_index, ea], edge_ids[cell_index, eb]], axis=1)
+    points = np.stack([
+        np.stack([edge_x[cell_index, ea], edge_y[cell_index, ea]], axis=1),
+        np.stack([edge_x[cell_index, eb], edge_y[cell_index, eb]], axis=1),
+    ], axis=1)
+    return ids, points
+
+
+def stitch_segments(ids, points) -> List[np.ndarray]:
+    """
+    Join segments that share endpoints into polylines.
+
+    Args:
+        ids: (S, 2) integer endpoint ids; equal ids mark the same point
+        points: (S, 2, D) endpoint coordinates
+
+    Returns:
+        List of (N, D) polylines; closed loops repeat their first point at the end
+    """
+    if len(ids) == 0:
+        return []
+
+    nodes, inverse = np.unique(ids.ravel(), return_inverse=True)
+    inverse = inverse.reshape(-1, 2)
+    node_points = np.empty((len(nodes), points.shape[-1]))
+    node_points[inverse.ravel()] = points.reshape(-1, points.shape[-1])
+
+    # Each node has at most two neighbours (an edge is shared by at most two cells)
+    ends = np.concatenate([inverse[:, 0], inverse[:, 1]])
+    others = np.concatenate([inverse[:, 1], inverse[:, 0]])
+    order = np.argsort(ends, kind="stable")
+    ends, others = ends[order], others[order]
+    first = np.ones(len(ends), dtype=bool)
+    first[1:] = ends[1:] != ends[:-1]
+    neighbours = np.full((len(nodes), 2), -1, dtype=np.int64)
+    neighbours[ends[first], 0] = others[first]
+    neighbours[ends[~first], 1] = others[~first]
+    degree = (neighbours >= 0).sum(axis=1)
+
+    neighbour_list = neighbours.tolist()
+    visited = np.zeros(len(nodes), dtype=bool)
+    polylines = []
+    # Open chains first (start at an end), then whatever is left are closed loops
+    for start in list(np.flatnonzero(degree == 1)) + list(range(len(nodes))):
+        if visited[start]:
+            continue
+        chain = [start]
+        visited[start] = True
+        prev, cur = -1, start
+        while True:
+            n0, n1 = neighbour_list[cur]
+            nxt = n0 if n0 != prev else n1
+            if nxt < 0:
+                break
+            if nxt == start:
+                chain.append(start)
+                break
+            if visited[nxt]:
+                break
+            visited[nxt] = True
+            chain.append(nxt)
+            prev, cur = cur, nxt
+        if len(chain) >= 2:
+            polylines.append(node_points[chain])
+    return polylines
+
+
+def contour_tile_segments(func, x_range, y_range, resolution=64, refine_depth=3, tile=None, chunk_size=None):
+    """
+    Contour one tile of the grid into segments with global edge ids.
+
+    Segments from different tiles of the same grid can be concatenated and
+    passed to stitch_segments(): edges on tile seams get the same ids and
+    bit-identical points from both sides, so seams merge into continuous
+    polylines.
+
+    Args:
+        func: Vectorized callable f(x, y)
+        x_range: [x_min, x_max] of the whole grid
+        y_range: [y_min, y_max] of the whole grid
+        resolution: Coarse grid cells per axis of the whole grid
+        refine_depth: Quadtree refinement levels
+        tile: (i0, i1, j0, j1) from tile_ranges(), or None for the whole grid
+        chunk_size: Optional maximum number of points per call to func
+
+    Returns:
+        Tuple of (edge_ids, points) as returned by contour_segments()
+    """
+    cells, corners, lattice = contour_cells(func, x_range, y_range, resolution, refine_depth,
+                                            tile=tile, chunk_size=chunk_size)
+    return contour_segments(cells, corners, lattice)
+
+
+def merge_tile_segments(results) -> List[np.ndarray]:
+    """
+    Stitch the segments of several tiles into polylines.
+
+    Args:
+        results: Iterable of (edge_ids, points) from contour_tile_segments()
+
+    Returns:
+        List of (N, 2) polylines
+    """
+    results = list(results)
+    if not results:
+        return []
+    ids = np.concatenate([r[0] for r in results])
+    points = np.concatenate([r[1] for r in results])
+    return stitch_segments(ids, points)
+
+
+def marching_squares(func, x_range, y_range, resolution=64, refine_depth=3, tiles=None, chunk_size=None) -> List[np.ndarray]:
+    """
+    Trace the curve f(x, y) = 0 as polylines.
+
+    Evaluates f once on a full coarse NumPy grid, refines only the cells that
+    straddle the curve with a quadtree, extracts segments with vectorized
+    marching squares and stitches them into polylines.
+
+    Args:
+        func: Vectorized callable f(x, y) (e.g., from sympy.lambdify)
+        x_range: [x_min, x_max] in axes coordinates
+        y_range: [y_min, y_max] in axes coordinates
+        resolution: Coarse grid cells per axis, int or (nx, ny) (default 64)
+        refine_depth: Quadtree levels below the coarse grid (default 3); the
+            effective resolution near the curve is resolution * 2**refine_depth
+        tiles: Optional tiles per axis, int or (tx, ty); the grid is processed
+            tile by tile and the seams are merged
+        chunk_size: Optional maximum number of points per call to func
+
+    Returns:
+        List of (N, 2) arrays of (x, y) points in axes coordinates
+
+    Example:
+        >>> circle = marching_squares(lambda x, y: x**2 + y**2 - 4, [-3, 3], [-3, 3])
+        >>> len(circle)  # 1 closed polyline
+    """
+    if tiles is None:
+        ids, points = contour_tile_segments(func, x_range, y_range, resolution, refine_depth, chunk_size=chunk_size)
+        return stitch_segments(ids, points)
+    return merge_tile_segments(
+        contour_tile_segments(func, x_range, y_range, resolution, refine_depth, tile=tile, chunk_size=chunk_size)
+        for tile in tile_ranges(resolution, tiles)
+    )
@@ -0,0 +1,243 @@
+"""
+Persistent on-disk cache for plot samples.
+
+Stores sampled polylines as memory-mapped .npy files (by default under the
+Manim media directory), so repeated renders of the same plots skip both
+sympy parsing and numeric evaluation.
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+from pathlib import Path
+from typing import List, Optional
+
+# Bumped whenever the sampling algorithms change in a way that invalidates old entries
+_FORMAT_VERSION = 1
+
+
+class DiskSampleCache:
+    """
+    Size-capped cache of plot samples stored as .npy files.
+
+    Each entry is one (M, 2) float array holding all polylines of a plot,
+    separated by rows of NaN, and is opened with mmap_mode="r" on a hit. Entry
+    files are touched on every hit, and the least recently used files are
+    deleted once the directory grows beyond `max_bytes`.
+
+    Example:
+        >>> cache = DiskSampleCache("/tmp/plot_cache", max_bytes=64 * 2**20)
+        >>> cache.put(("explicit", "sin(x)", (-5.0, 5.0)), polylines)
+        >>> cache.get(("explicit", "sin(x)", (-5.0, 5.0)))  # list of (N, 2) arrays
+    """
+
+    def __init__(self, directory=None, max_bytes=256 * 2**20, enabled=True):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory. If None, "plot_cache" inside Manim's
+                config.media_dir is used (resolved on first use)
+            max_bytes: Maximum total size of the entry files (default 256 MiB)
+            enabled: Whether the cache reads and writes entries (default True)
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+        self._directory = Path(directory) if directory is not None else None
+        self.max_bytes = int(max_bytes)
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+    @property
+    def directory(self) -> Path:
+        """The cache directory (Manim's media_dir/plot_cache unless set explicitly)."""
+        if self._directory is None:
+            from manim import config
+            return Path(config.media_dir) / "plot_cache"
+        return self._directory
+
+    @directory.setter
+    def directory(self, value):
+        self._directory = Path(value) if value is not None else None
+
+    @staticmethod
+    def key_digest(key) -> str:
+        """
+        Hash a cache key into a file name.
+
+        Args:
+            key: JSON-serializable key (tuples, strings, numbers)
+
+        Returns:
+            Hex digest string
+        """
+        text = json.dumps([_FORMAT_VERSION, key], default=repr, separators=(",", ":"))
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def _path(self, key) -> Path:
+        return self.directory / f"{self.key_digest(key)}.npy"
+
+    def get(self, key) -> Optional[List[np.ndarray]]:
+        """
+        Look up the polylines stored for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            List of (N, 2) arrays (read-only views into the memory-mapped file),
+            or None on a miss or when the cache is disabled
+        """
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            packed = np.load(path, mmap_mode="r")
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return unpack_polylines(packed)
+
+    def put(self, key, polylines):
+        """
+        Store polylines for a key, evicting old entries if over the size cap.
+
+        Args:
+            key: Cache key
+            polylines: List of (N, 2) arrays
+        """
+        if not self.enabled:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so concurrent renders never see partial entries
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp, pack_polylines(polylines))
+        os.replace(tmp, path)
+        self.writes += 1
+        self._evict()
+
+    def resize(self, max_bytes):
+        """
+        Change the size cap, evicting least recently used entries beyond it.
+
+        Args:
+            max_bytes: New maximum total size of the entry files in bytes
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+        self.max_bytes = int(max_bytes)
+        self._evict()
+
+    def _entries(self) -> list:
+        """List (mtime, size, path) for every entry file."""
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".npy") and ".tmp." not in entry.name:
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, Path(entry.path)))
+        return entries
+
+    def _evict(self):
+        """Delete least recently used entries until the total size fits max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.evictions += 1
+
+    def clear(self):
+        """Delete all entry files and reset the counters."""
+        for _, _, path in self._entries():
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self.hits = self.misses = self.writes = self.evictions = 0
+
+    def info(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, writes, evictions, entries, bytes,
+            max_bytes, directory and enabled
+        """
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "directory": str(self.directory),
+            "enabled": self.enabled,
+        }
+
+    def report(self) -> str:
+        """
+        Format the statistics as a one-line summary.
+
+        Returns:
+            String like "plot cache: 12 hits, 3 misses (80% hit rate), 3 writes, ..."
+        """
+        info = self.info()
+        lookups = info["hits"] + info["misses"]
+        rate = f"{100 * info['hits'] / lookups:.0f}%" if lookups else "n/a"
+        return (
+            f"plot cache: {info['hits']} hits, {info['misses']} misses ({rate} hit rate), "
+            f"{info['writes']} writes, {info['evictions']} evictions, "
+            f"{info['entries']} entries, {info['bytes'] / 2**20:.1f}/{info['max_bytes'] / 2**20:.1f} MiB "
+            f"in {info['directory']}"
+        )
+
+
+def pack_polylines(polylines) -> np.ndarray:
+    """
+    Pack polylines into one (M, 2) array with NaN rows between them.
+
+    Args:
+        polylines: List of (N, 2) arrays
+
+    Returns:
+        Float array of shape (M, 2)
+    """
+    parts = []
+    for line in polylines:
+        if parts:
+            parts.append(np.full((1, 2), np.nan))
+        parts.append(np.asarray(line, dtype=float).reshape(-1, 2))
+    if not parts:
+        return np.zeros((0, 2))
+    return np.vstack(parts)
+
+
+def unpack_polylines(packed: np.ndarray) -> List[np.ndarray]:
+    """
+    Split an array from pack_polylines() back into polylines.
+
+    Args:
+        packed: (M, 2) array with NaN separator rows
+
+    Returns:
+        List of (N, 2) arrays (views into packed)
+    """
+    separators = np.flatnonzero(np.isnan(packed[:, 0]))
+    bounds = np.concatenate([[-1], separators, [len(packed)]])
+    return [packed[start + 1:end] for start, end in zip(bounds[:-1], bounds[1:]) if end - start > 1]
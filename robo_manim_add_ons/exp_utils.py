@@ -2,16 +2,95 @@
 Expression utilities for extracting coordinates from various object types.
 
 Provides functions for extracting x and y coordinates from Manim objects,
-numpy arrays, or lists.
+numpy arrays, or lists. All helpers share one coercion layer (_coords and
+friends) instead of each carrying its own copy of the hasattr/isinstance
+checks. Helpers that produce points (st, ed, mid, pt, ...) return lazy
+PointRefs, which only build their Dot when used as a mobject.
 """
 
 import numpy as np
-from typing import Union
-from manim import Line, Arrow, Dot, Polygon, Arc, Angle, Circle, Rectangle, RED
+from typing import Optional, Union
+from manim import Line, Arrow, Polygon, Arc, Angle, Circle, Rectangle, VGroup, RED
 from .graph_utils import GraphUtils
+from .point_utils import PointRef
 from .shape_utils import rect as _rect, tri_sss as _sss, tri_sas as _sas, tri_ssa as _ssa
 
 
+# ============================================================================
+# Shared coercion layer
+# ============================================================================
+
+def _unsupported(obj, method: str) -> TypeError:
+    """Build the TypeError for an object without method() that is not coordinates either."""
+    return TypeError(
+        f"Unsupported type {type(obj).__name__}. "
+        f"Expected object with {method}(), numpy array, or list."
+    )
+
+
+def _vector(obj) -> Optional[np.ndarray]:
+    """
+    Get the coordinates of a point-like obj, or None for any other object.
+
+    Numpy arrays are returned as-is, lists/tuples are converted and PointRefs
+    give their coordinates, so single-argument helpers (mag, uv, ...) treat
+    them as vectors rather than calling get_length() etc. on them.
+    """
+    if isinstance(obj, PointRef):
+        return obj.get_center()
+    if isinstance(obj, np.ndarray):
+        return obj
+    if isinstance(obj, (list, tuple)):
+        return np.array(obj)
+    return None
+
+
+def _call(obj, method: str):
+    """Return obj.method(), raising TypeError if obj has no such method."""
+    if hasattr(obj, method):
+        return getattr(obj, method)()
+    raise _unsupported(obj, method)
+
+
+def _coords(obj, method: str = "get_center") -> np.ndarray:
+    """
+    Coerce obj to a coordinate array.
+
+    Objects give obj.method() (get_center() by default), numpy arrays are
+    returned as-is and lists/tuples are converted to arrays.
+    """
+    if not isinstance(obj, PointRef) and hasattr(obj, method):
+        return getattr(obj, method)()
+    vector = _vector(obj)
+    if vector is None:
+        raise _unsupported(obj, method)
+    return vector
+
+
+def _component(obj, index: int) -> float:
+    """Get one coordinate of obj's center (the body of x() and y())."""
+    if hasattr(obj, "get_center"):
+        return obj.get_center()[index]
+    if isinstance(obj, (np.ndarray, list, tuple)):
+        return float(obj[index])
+    raise _unsupported(obj, "get_center")
+
+
+def _is_point(arg) -> bool:
+    """Check if arg is a Dot/object or np.array (lists are coordinates, not points, in the overloaded helpers)."""
+    return isinstance(arg, np.ndarray) or hasattr(arg, "get_center")
+
+
+def _is_line(arg) -> bool:
+    """Check if arg is a Line object"""
+    return isinstance(arg, Line)
+
+
+def _is_number(arg) -> bool:
+    """Check if arg is a number"""
+    return isinstance(arg, (int, float))
+
+
 def x(obj: Union[object, np.ndarray, list]) -> float:
     """
     Extract the x-coordinate from various object types.
@@ -42,20 +121,7 @@ def x(obj: Union[object, np.ndarray, list]) -> float:
         >>> lst = [3.0, 4.0]
         >>> x_val = x(lst)  # Returns 3.0
     """
-    # Check if object has get_center method (Manim object like Dot, VMobject, etc.)
-    if hasattr(obj, 'get_center'):
-        return obj.get_center()[0]
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        return float(obj[0])
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        return float(obj[0])
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_center(), numpy array, or list."
-        )
+    return _component(obj, 0)
 
 
 def y(obj: Union[object, np.ndarray, list]) -> float:
@@ -88,23 +154,10 @@ def y(obj: Union[object, np.ndarray, list]) -> float:
         >>> lst = [3.0, 4.0]
         >>> y_val = y(lst)  # Returns 4.0
     """
-    # Check if object has get_center method (Manim object like Dot, VMobject, etc.)
-    if hasattr(obj, 'get_center'):
-        return obj.get_center()[1]
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        return float(obj[1])
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        return float(obj[1])
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_center(), numpy array, or list."
-        )
+    return _component(obj, 1)
 
 
-def st(obj: Union[object, np.ndarray, list]) -> Dot:
+def st(obj: Union[object, np.ndarray, list]) -> PointRef:
     """
     Get the start point from various object types as a Dot.
 
@@ -115,7 +168,7 @@ def st(obj: Union[object, np.ndarray, list]) -> Dot:
             - A Python list [x, y] or [x, y, z]
 
     Returns:
-        A Dot at the start point
+        A lazy PointRef (see point_utils.PointRef) at the start point
 
     Raises:
         TypeError: If the object type is not supported
@@ -133,23 +186,10 @@ def st(obj: Union[object, np.ndarray, list]) -> Dot:
         >>> lst = [3.0, 4.0, 0.0]
         >>> dot = st(lst)  # Dot at [3.0, 4.0, 0.0]
     """
-    # Check if object has get_start method (Manim object like Line, Arc, etc.)
-    if hasattr(obj, 'get_start'):
-        return Dot(obj.get_start())
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        return Dot(obj)
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        return Dot(np.array(obj))
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_start(), numpy array, or list."
-        )
+    return PointRef.lazy(_coords(obj, "get_start"))
 
 
-def ed(obj: Union[object, np.ndarray, list]) -> Dot:
+def ed(obj: Union[object, np.ndarray, list]) -> PointRef:
     """
     Get the end point from various object types as a Dot.
 
@@ -160,7 +200,7 @@ def ed(obj: Union[object, np.ndarray, list]) -> Dot:
             - A Python list [x, y] or [x, y, z]
 
     Returns:
-        A Dot at the end point
+        A lazy PointRef (see point_utils.PointRef) at the end point
 
     Raises:
         TypeError: If the object type is not supported
@@ -178,23 +218,10 @@ def ed(obj: Union[object, np.ndarray, list]) -> Dot:
         >>> lst = [3.0, 4.0, 0.0]
         >>> dot = ed(lst)  # Dot at [3.0, 4.0, 0.0]
     """
-    # Check if object has get_end method (Manim object like Line, Arc, etc.)
-    if hasattr(obj, 'get_end'):
-        return Dot(obj.get_end())
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        return Dot(obj)
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        return Dot(np.array(obj))
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_end(), numpy array, or list."
-        )
+    return PointRef.lazy(_coords(obj, "get_end"))
 
 
-def mid(obj) -> Dot:
+def mid(obj) -> PointRef:
     """
     Get a Dot at the center of an object.
 
@@ -202,7 +229,7 @@ def mid(obj) -> Dot:
         obj: A Manim object with get_center() method (e.g., Line, Circle, VMobject, etc.)
 
     Returns:
-        A Dot at the center of the object
+        A lazy PointRef (see point_utils.PointRef) at the center of the object
 
     Raises:
         TypeError: If the object doesn't have get_center() method
@@ -217,13 +244,12 @@ def mid(obj) -> Dot:
         >>> circle = Circle(radius=2)
         >>> dot = mid(circle)  # Dot at center of circle
     """
-    if hasattr(obj, 'get_center'):
-        return Dot(obj.get_center())
-    else:
+    if isinstance(obj, (np.ndarray, list, tuple)):
         raise TypeError(
             f"Unsupported type {type(obj).__name__}. "
             "Expected object with get_center() method."
         )
+    return PointRef.lazy(_call(obj, "get_center"))
 
 
 def mag(*args) -> float:
@@ -267,40 +293,17 @@ def mag(*args) -> float:
         >>> arr2 = np.array([3.0, 4.0, 0.0])
         >>> distance = mag(arr1, arr2)  # Returns 5.0
     """
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        elif isinstance(obj, (list, tuple)):
-            return np.array(obj)
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 1:
-        # Single argument - calculate magnitude
-        obj = args[0]
-
-        # Check if object has get_length method (Manim object like Line, Arc, etc.)
-        if hasattr(obj, 'get_length'):
-            return obj.get_length()
-        # Check if it's a numpy array
-        elif isinstance(obj, np.ndarray):
-            return float(np.linalg.norm(obj))
-        # Check if it's a list
-        elif isinstance(obj, (list, tuple)):
-            return float(np.linalg.norm(np.array(obj)))
-        else:
-            raise TypeError(
-                f"Unsupported type {type(obj).__name__}. "
-                "Expected object with get_length(), numpy array, or list."
-            )
+        # Single argument - the object's length, or the vector's magnitude
+        vector = _vector(args[0])
+        if vector is None:
+            return _call(args[0], "get_length")
+        return float(np.linalg.norm(vector))
 
     elif len(args) == 2:
         # Two arguments - calculate distance between points
-        pos1 = _extract_position(args[0])
-        pos2 = _extract_position(args[1])
+        pos1 = _coords(args[0])
+        pos2 = _coords(args[1])
 
         # Calculate distance
         return float(np.linalg.norm(pos2 - pos1))
@@ -341,30 +344,16 @@ def uv(obj: Union[object, np.ndarray, list]) -> np.ndarray:
         >>> lst = [0.0, 5.0, 0.0]
         >>> unit = uv(lst)  # Returns np.array([0., 1., 0.])
     """
-    # Check if object has get_unit_vector method (Manim object like Line, Vector, etc.)
-    if hasattr(obj, 'get_unit_vector'):
-        return obj.get_unit_vector()
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        magnitude = np.linalg.norm(obj)
-        if magnitude == 0:
-            raise ValueError("Cannot compute unit vector of zero-magnitude vector")
-        return obj / magnitude
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        arr = np.array(obj)
-        magnitude = np.linalg.norm(arr)
-        if magnitude == 0:
-            raise ValueError("Cannot compute unit vector of zero-magnitude vector")
-        return arr / magnitude
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_unit_vector(), numpy array, or list."
-        )
+    value = _vector(obj)
+    if value is None:
+        return _call(obj, "get_unit_vector")
+    magnitude = np.linalg.norm(value)
+    if magnitude == 0:
+        raise ValueError("Cannot compute unit vector of zero-magnitude vector")
+    return value / magnitude
 
 
-def vec(obj: Union[object, np.ndarray, list]) -> np.ndarray:
+def vec(obj: Union[object, np.ndarray, list], end=None) -> np.ndarray:
     """
     Get the vector from various object types.
 
@@ -373,6 +362,8 @@ def vec(obj: Union[object, np.ndarray, list]) -> np.ndarray:
             - A Manim object with get_vector() method (e.g., Line - returns end - start)
             - A NumPy array (returned as-is)
             - A Python list (converted to numpy array)
+        end: Optional second point; when given, returns the vector from the
+            point obj to the point end (e.g. vec(st(line), mid(line)))
 
     Returns:
         The vector as a numpy array
@@ -392,21 +383,12 @@ def vec(obj: Union[object, np.ndarray, list]) -> np.ndarray:
         >>>
         >>> lst = [3.0, 4.0, 0.0]
         >>> vector = vec(lst)  # Returns np.array([3.0, 4.0, 0.0])
+        >>>
+        >>> vector = vec(st(line), mid(line))  # Returns np.array([1., 0., 0.])
     """
-    # Check if object has get_vector method (Manim object like Line, etc.)
-    if hasattr(obj, 'get_vector'):
-        return obj.get_vector()
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        return obj
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        return np.array(obj)
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_vector(), numpy array, or list."
-        )
+    if end is not None:
+        return _coords(end) - _coords(obj)
+    return _coords(obj, "get_vector")
 
 
 def ang(obj: Union[object, np.ndarray, list]) -> float:
@@ -438,21 +420,10 @@ def ang(obj: Union[object, np.ndarray, list]) -> float:
         >>> lst = [0.0, 1.0, 0.0]
         >>> angle = ang(lst)  # Returns π/2 (90 degrees)
     """
-    # Check if object has get_angle method (Manim object like Line, etc.)
-    if hasattr(obj, 'get_angle'):
-        return obj.get_angle()
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        return float(np.arctan2(obj[1], obj[0]))
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        arr = np.array(obj)
-        return float(np.arctan2(arr[1], arr[0]))
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_angle(), numpy array, or list."
-        )
+    value = _vector(obj)
+    if value is None:
+        return _call(obj, "get_angle")
+    return float(np.arctan2(value[1], value[0]))
 
 
 def slope(obj: Union[object, np.ndarray, list]) -> float:
@@ -485,25 +456,12 @@ def slope(obj: Union[object, np.ndarray, list]) -> float:
         >>> lst = [1.0, 3.0, 0.0]
         >>> slp = slope(lst)  # Returns 3.0
     """
-    # Check if object has get_slope method (Manim object like Line, etc.)
-    if hasattr(obj, 'get_slope'):
-        return obj.get_slope()
-    # Check if it's a numpy array
-    elif isinstance(obj, np.ndarray):
-        if obj[0] == 0:
-            return float('inf') if obj[1] > 0 else float('-inf')
-        return float(obj[1] / obj[0])
-    # Check if it's a list
-    elif isinstance(obj, (list, tuple)):
-        arr = np.array(obj)
-        if arr[0] == 0:
-            return float('inf') if arr[1] > 0 else float('-inf')
-        return float(arr[1] / arr[0])
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_slope(), numpy array, or list."
-        )
+    value = _vector(obj)
+    if value is None:
+        return _call(obj, "get_slope")
+    if value[0] == 0:
+        return float('inf') if value[1] > 0 else float('-inf')
+    return float(value[1] / value[0])
 
 
 def val(obj: Union[object, float, int]) -> float:
@@ -534,20 +492,18 @@ def val(obj: Union[object, float, int]) -> float:
         >>> integer = 42
         >>> value = val(integer)  # Returns 42.0
     """
-    # Check if object has get_value method (Manim object like ValueTracker, Variable, etc.)
+    # Numbers first: they are the common case and never have get_value()
+    if isinstance(obj, (int, float)):
+        return float(obj)
     if hasattr(obj, 'get_value'):
         return obj.get_value()
-    # Check if it's already a numeric value
-    elif isinstance(obj, (int, float)):
-        return float(obj)
-    else:
-        raise TypeError(
-            f"Unsupported type {type(obj).__name__}. "
-            "Expected object with get_value() or numeric value."
-        )
+    raise TypeError(
+        f"Unsupported type {type(obj).__name__}. "
+        "Expected object with get_value() or numeric value."
+    )
 
 
-def pt(x: float, y: float, z: float = 0) -> Dot:
+def pt(x: float, y: float, z: float = 0) -> PointRef:
     """
     Create a Dot at the specified coordinates.
 
@@ -557,7 +513,7 @@ def pt(x: float, y: float, z: float = 0) -> Dot:
         z: The z-coordinate (default: 0)
 
     Returns:
-        A Dot at position [x, y, z]
+        A lazy PointRef (see point_utils.PointRef) at position [x, y, z]
 
     Example:
         >>> from robo_manim_add_ons import pt
@@ -568,10 +524,10 @@ def pt(x: float, y: float, z: float = 0) -> Dot:
         >>>
         >>> dot = pt(1, 2, 3)  # Dot at [1, 2, 3]
     """
-    return Dot(np.array([x, y, z]))
+    return PointRef.lazy(np.array([x, y, z]))
 
 
-def m2v(axes, x: float, y: float) -> Dot:
+def m2v(axes, x: float, y: float) -> PointRef:
     """
     Convert model coordinates to view coordinates and return as a Dot.
 
@@ -581,7 +537,7 @@ def m2v(axes, x: float, y: float) -> Dot:
         y: The y-coordinate in model space
 
     Returns:
-        A Dot at the screen point corresponding to the model coordinates
+        A lazy PointRef (see point_utils.PointRef) at the screen point corresponding to the model coordinates
 
     Example:
         >>> from manim import Axes
@@ -590,10 +546,10 @@ def m2v(axes, x: float, y: float) -> Dot:
         >>> axes = Axes(x_range=[-5, 5], y_range=[-5, 5])
         >>> dot = m2v(axes, 2, 3)  # Dot at screen coordinates for (2, 3) in model space
     """
-    return Dot(axes.c2p(x, y))
+    return PointRef.lazy(axes.c2p(x, y))
 
 
-def v2m(axes, x: float, y: float) -> Dot:
+def v2m(axes, x: float, y: float) -> PointRef:
     """
     Convert view coordinates (screen point) to model coordinates and return as a Dot.
 
@@ -603,7 +559,7 @@ def v2m(axes, x: float, y: float) -> Dot:
         y: The y-coordinate in screen space
 
     Returns:
-        A Dot at the model coordinates corresponding to the screen point
+        A lazy PointRef (see point_utils.PointRef) at the model coordinates corresponding to the screen point
 
     Example:
         >>> from manim import Axes
@@ -612,10 +568,10 @@ def v2m(axes, x: float, y: float) -> Dot:
         >>> axes = Axes(x_range=[-5, 5], y_range=[-5, 5])
         >>> dot = v2m(axes, 1.5, 2.0)  # Dot at model coordinates for screen point (1.5, 2.0)
     """
-    return Dot(axes.p2c(np.array([x, y, 0])))
+    return PointRef.lazy(axes.p2c(np.array([x, y, 0])))
 
 
-def x2v(axes, graph, x: float) -> Dot:
+def x2v(axes, graph, x: float) -> PointRef:
     """
     Get a Dot on a graph at a given x-value.
 
@@ -627,7 +583,7 @@ def x2v(axes, graph, x: float) -> Dot:
         x: The x-value on the graph
 
     Returns:
-        A Dot at the point on the graph corresponding to the x-value
+        A lazy PointRef (see point_utils.PointRef) at the point on the graph corresponding to the x-value
 
     Example:
         >>> from manim import Axes
@@ -637,7 +593,7 @@ def x2v(axes, graph, x: float) -> Dot:
         >>> parabola = axes.plot(lambda x: x**2)
         >>> dot = x2v(axes, parabola, 2)  # Dot on parabola at x=2
     """
-    return Dot(axes.i2gp(x, graph))
+    return PointRef.lazy(axes.i2gp(x, graph))
 
 
 def vl(x: float, y1: float = -20, y2: float = 20) -> Line:
@@ -738,7 +694,7 @@ def vra(radius: float, angle: float, from_x: float = 0, from_y: float = 0) -> Ar
     return Arrow(start=start_point, end=end_point)
 
 
-def r2p(obj, proportion: float) -> Dot:
+def r2p(obj, proportion: float) -> PointRef:
     """
     Get a point at a proportion along an object and return it as a Dot.
 
@@ -747,7 +703,7 @@ def r2p(obj, proportion: float) -> Dot:
         proportion: The proportion along the object (0 = start, 1 = end)
 
     Returns:
-        A Dot at the point corresponding to the given proportion
+        A lazy PointRef (see point_utils.PointRef) at the point corresponding to the given proportion
 
     Example:
         >>> from manim import Line, LEFT, RIGHT
@@ -759,7 +715,7 @@ def r2p(obj, proportion: float) -> Dot:
         >>> dot = r2p(line, 1)     # Dot at end of line
     """
     point = obj.point_from_proportion(proportion)
-    return Dot(point)
+    return PointRef.lazy(point)
 
 
 def ln(*args) -> Line:
@@ -795,43 +751,24 @@ def ln(*args) -> Line:
         >>> # With four numbers
         >>> line = ln(0, 0, 1, 2)
     """
-    from manim import RED
-
-    def _is_object(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 2:
         # Two objects (Dots or arrays)
-        start_pos = _extract_position(args[0])
-        end_pos = _extract_position(args[1])
+        start_pos = _coords(args[0])
+        end_pos = _coords(args[1])
         return Line(start_pos, end_pos, color=RED)
 
     elif len(args) == 3:
         # One dot/array and two numbers
         # Check if first arg is object and last two are numbers
-        if _is_object(args[0]) and _is_number(args[1]) and _is_number(args[2]):
+        if _is_point(args[0]) and _is_number(args[1]) and _is_number(args[2]):
             # Pattern: (dot, x, y)
-            start_pos = _extract_position(args[0])
+            start_pos = _coords(args[0])
             end_pos = np.array([args[1], args[2], 0])
         # Check if first two are numbers and last is object
-        elif _is_number(args[0]) and _is_number(args[1]) and _is_object(args[2]):
+        elif _is_number(args[0]) and _is_number(args[1]) and _is_point(args[2]):
             # Pattern: (x, y, dot)
             start_pos = np.array([args[0], args[1], 0])
-            end_pos = _extract_position(args[2])
+            end_pos = _coords(args[2])
         else:
             raise TypeError(
                 "For 3 arguments, expected either (dot, x, y) or (x, y, dot)"
@@ -885,43 +822,24 @@ def vt(*args) -> Arrow:
         >>> # With four numbers
         >>> arrow = vt(0, 0, 1, 2)
     """
-    from manim import RED
-
-    def _is_object(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 2:
         # Two objects (Dots or arrays)
-        start_pos = _extract_position(args[0])
-        end_pos = _extract_position(args[1])
+        start_pos = _coords(args[0])
+        end_pos = _coords(args[1])
         return Arrow(start_pos, end_pos, color=RED)
 
     elif len(args) == 3:
         # One dot/array and two numbers
         # Check if first arg is object and last two are numbers
-        if _is_object(args[0]) and _is_number(args[1]) and _is_number(args[2]):
+        if _is_point(args[0]) and _is_number(args[1]) and _is_number(args[2]):
             # Pattern: (dot, x, y)
-            start_pos = _extract_position(args[0])
+            start_pos = _coords(args[0])
             end_pos = np.array([args[1], args[2], 0])
         # Check if first two are numbers and last is object
-        elif _is_number(args[0]) and _is_number(args[1]) and _is_object(args[2]):
+        elif _is_number(args[0]) and _is_number(args[1]) and _is_point(args[2]):
             # Pattern: (x, y, dot)
             start_pos = np.array([args[0], args[1], 0])
-            end_pos = _extract_position(args[2])
+            end_pos = _coords(args[2])
         else:
             raise TypeError(
                 "For 3 arguments, expected either (dot, x, y) or (x, y, dot)"
@@ -967,20 +885,9 @@ def tri(p1, p2, p3) -> Polygon:
         >>> # With mixed dots and arrays
         >>> triangle = tri(Dot(ORIGIN), np.array([0, 1, 0]), Dot(RIGHT))
     """
-    from manim import RED
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
-    pos1 = _extract_position(p1)
-    pos2 = _extract_position(p2)
-    pos3 = _extract_position(p3)
+    pos1 = _coords(p1)
+    pos2 = _coords(p2)
+    pos3 = _coords(p3)
 
     return Polygon(pos1, pos2, pos3, color=RED)
 
@@ -1027,27 +934,9 @@ def aa(*args, radius=0.5, dash=True, **kwargs):
         >>> line4 = Line(LEFT + UP, RIGHT + UP)
         >>> result = aa(line3, line4)  # Returns empty VGroup
     """
-    from manim import VGroup
     from .custom_objects import ArcArrow, ArcDashedVMobject
     from .intersection_utils import intersect_lines
 
-    def _is_line(arg):
-        """Check if arg is a Line object"""
-        return isinstance(arg, Line)
-
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     # Set default color if not provided
     if 'color' not in kwargs:
         kwargs['color'] = RED
@@ -1104,9 +993,9 @@ def aa(*args, radius=0.5, dash=True, **kwargs):
         p1, vertex, p3 = args
 
         # Extract positions
-        p1_pos = _extract_position(p1)
-        vertex_pos = _extract_position(vertex)
-        p3_pos = _extract_position(p3)
+        p1_pos = _coords(p1)
+        vertex_pos = _coords(vertex)
+        p3_pos = _coords(p3)
 
         # Create vectors from vertex to p1 and p3
         v1 = p1_pos - vertex_pos
@@ -1191,26 +1080,8 @@ def aa2(*args, radius=0.5, **kwargs):
         >>> # Three points with clockwise direction
         >>> angle = aa2(np.array([1, 0, 0]), np.array([0, 0, 0]), np.array([0, 1, 0]), -1)
     """
-    from manim import VGroup
     from .intersection_utils import intersect_lines
 
-    def _is_line(arg):
-        """Check if arg is a Line object"""
-        return isinstance(arg, Line)
-
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     # Set default color if not provided
     if 'color' not in kwargs:
         kwargs['color'] = RED
@@ -1260,9 +1131,9 @@ def aa2(*args, radius=0.5, **kwargs):
             p1, vertex, p3 = args
 
             # Extract positions
-            p1_pos = _extract_position(p1)
-            vertex_pos = _extract_position(vertex)
-            p3_pos = _extract_position(p3)
+            p1_pos = _coords(p1)
+            vertex_pos = _coords(vertex)
+            p3_pos = _coords(p3)
 
             # Create Angle from three points
             return Angle.from_three_points(p1_pos, vertex_pos, p3_pos, radius=radius, **kwargs)
@@ -1279,9 +1150,9 @@ def aa2(*args, radius=0.5, **kwargs):
         quadrant_param = args[3]
 
         # Extract positions
-        p1_pos = _extract_position(p1)
-        vertex_pos = _extract_position(vertex)
-        p3_pos = _extract_position(p3)
+        p1_pos = _coords(p1)
+        vertex_pos = _coords(vertex)
+        p3_pos = _coords(p3)
 
         # Process quadrant parameter
         if isinstance(quadrant_param, bool):
@@ -1439,27 +1310,6 @@ def cr(*args, **kwargs) -> Circle:
         >>> dot2 = Dot(RIGHT)
         >>> circle = cr(dot1, dot2)  # Circle with center at origin, radius 1
     """
-    def _is_line(arg):
-        """Check if arg is a Line object"""
-        return isinstance(arg, Line)
-
-    def _is_point(arg):
-        """Check if arg is a Dot/object or np.array"""
-        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
-
-    def _is_number(arg):
-        """Check if arg is a number"""
-        return isinstance(arg, (int, float))
-
-    def _extract_position(obj):
-        """Extract position from Dot/object or np.array"""
-        if hasattr(obj, 'get_center'):
-            return obj.get_center()
-        elif isinstance(obj, np.ndarray):
-            return obj
-        else:
-            raise TypeError(f"Expected Dot or np.array, got {type(obj).__name__}")
-
     if len(args) == 1:
         # Single line case
         if not _is_line(args[0]):
@@ -1478,7 +1328,7 @@ def cr(*args, **kwargs) -> Circle:
         # Could be: (center, radius) OR (dot1, dot2)
         if _is_point(args[0]) and _is_number(args[1]):
             # Pattern: (center, radius)
-            center = _extract_position(args[0])
+            center = _coords(args[0])
             radius = args[1]
 
             circle = Circle(radius=radius, **kwargs)
@@ -1487,8 +1337,8 @@ def cr(*args, **kwargs) -> Circle:
 
         elif _is_point(args[0]) and _is_point(args[1]):
             # Pattern: (dot1, dot2)
-            pos1 = _extract_position(args[0])
-            pos2 = _extract_position(args[1])
+            pos1 = _coords(args[0])
+            pos2 = _coords(args[1])
 
             # Midpoint is center
             center = (pos1 + pos2) / 2
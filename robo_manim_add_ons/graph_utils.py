@@ -5,18 +5,47 @@ Provides functions for creating various types of plots (explicit, implicit, para
 from string expressions using sympy for parsing.
 """
 
+import math
 import numpy as np
 import sympy as sp
 import re
+from concurrent.futures import ProcessPoolExecutor
 from sympy.parsing.sympy_parser import parse_expr, standard_transformations, implicit_multiplication_application, convert_xor
-from manim import Axes, ImplicitFunction, ParametricFunction, MathTex, PI, BLACK, BLUE_D, DOWN, LEFT
+from manim import (Axes, ImplicitFunction, ParametricFunction, MathTex, VGroup, PI, BLACK, BLUE_D, RED, GREEN_D,
+                   ORANGE, PURPLE, TEAL, GOLD, MAROON, DOWN, LEFT)
 from typing import Tuple, Union
+from .cache_utils import LRUCache
+from .contour_utils import marching_squares, contour_tile_segments, merge_tile_segments, tile_ranges
+from .disk_cache_utils import DiskSampleCache
+from .lod_utils import LODSampler
+from .path_utils import SampledPlot
+from .sampling_utils import evaluate, sample_explicit, sample_parametric, sample_shared_grid, split_runs
 
 # Transformations for parsing expressions with implicit multiplication
 transformations = (standard_transformations +
                    (implicit_multiplication_application,) +
                    (convert_xor,))
 
+# Process-wide cache of parsed sympy expressions and their numpy callables,
+# keyed by (plot kind, normalized expression text, extra variables)
+_expression_cache = LRUCache(maxsize=256)
+
+# Keyword arguments of graph() that configure the Axes rather than the plot
+_AXES_KWARGS = ('x_length', 'y_length', 'tips', 'axis_config')
+
+# Pre-built axes (with π ticks / coordinate numbers) keyed by their full
+# configuration; graph() hands out copies so templates are never mutated
+_axes_cache = LRUCache(maxsize=32)
+
+# Optional persistent cache of sampled polylines (disabled until configured)
+_disk_cache = DiskSampleCache(enabled=False)
+
+# Default colors for graph_many(), cycled when there are more curves
+_MANY_COLORS = (BLUE_D, RED, GREEN_D, ORANGE, PURPLE, TEAL, GOLD, MAROON)
+
+# Rendered π tick labels keyed by (LaTeX label, font size); callers get copies
+_pi_label_cache = LRUCache(maxsize=256)
+
 
 class GraphUtils:
     """
@@ -56,73 +85,116 @@ class GraphUtils:
         return x_needs_pi, y_needs_pi
 
     @staticmethod
-    def _add_pi_ticks(axes: Axes, axis: str, mode: str, axis_range: list):
+    def pi_tick_label(numerator: int, denominator: int = 1) -> str:
+        """
+        Get the LaTeX label for the multiple (numerator/denominator)·π.
+
+        Args:
+            numerator: Integer multiple of π/denominator
+            denominator: Positive integer divisor of π (default 1)
+
+        Returns:
+            LaTeX string, reduced to lowest terms
+
+        Examples:
+            >>> GraphUtils.pi_tick_label(1)      # "\\pi"
+            >>> GraphUtils.pi_tick_label(-3, 2)  # "-\\frac{3\\pi}{2}"
+            >>> GraphUtils.pi_tick_label(2, 4)   # "\\frac{\\pi}{2}"
+        """
+        if denominator <= 0:
+            raise ValueError(f"denominator must be positive, got {denominator}")
+        if numerator == 0:
+            return "0"
+        divisor = math.gcd(numerator, denominator)
+        num, den = abs(numerator) // divisor, denominator // divisor
+        sign = "-" if numerator < 0 else ""
+        coefficient = "" if num == 1 else str(num)
+        if den == 1:
+            return rf"{sign}{coefficient}\pi"
+        return rf"{sign}\frac{{{coefficient}\pi}}{{{den}}}"
+
+    @staticmethod
+    def pi_ticks(mode: str, axis_range: list) -> list:
+        """
+        Generate the π tick positions and labels inside an axis range.
+
+        Args:
+            mode: Tick spacing "k·pi/n", e.g. "pi", "2pi", "pi/2", "pi/4", "2pi/3".
+                Unrecognized modes fall back to "pi/2".
+            axis_range: Range of the axis [min, max, ...]
+
+        Returns:
+            Sorted list of (value, latex_label) tuples
+
+        Examples:
+            >>> GraphUtils.pi_ticks("pi/2", [0, 4])  # [(0, "0"), (π/2, "\\frac{\\pi}{2}"), (π, "\\pi")]
+            >>> GraphUtils.pi_ticks("pi/6", [0, PI]) # any multiple of π/n
+        """
+        match = re.fullmatch(r"\s*(\d*)\s*pi\s*(?:/\s*(\d+))?\s*", str(mode))
+        if match and int(match.group(1) or 1) > 0 and int(match.group(2) or 1) > 0:
+            step, denominator = int(match.group(1) or 1), int(match.group(2) or 1)
+        else:
+            step, denominator = 1, 2
+
+        unit = PI / denominator
+        eps = 1e-9
+        lo = math.ceil((axis_range[0] - eps) / (unit * step))
+        hi = math.floor((axis_range[1] + eps) / (unit * step))
+        return [(k * step * unit, GraphUtils.pi_tick_label(k * step, denominator)) for k in range(lo, hi + 1)]
+
+    @staticmethod
+    def _pi_label_mobject(label_text: str, font_size: float = 24) -> MathTex:
+        """Get a copy of a rendered π label, rendering it on the first request."""
+        key = (label_text, font_size)
+        template = _pi_label_cache.get(key)
+        if template is None:
+            template = MathTex(label_text, font_size=font_size)
+            _pi_label_cache.put(key, template)
+            if not _pi_label_cache.enabled:
+                return template
+        return template.copy()
+
+    @staticmethod
+    def pi_label_cache_info() -> dict:
+        """
+        Get statistics for the rendered π label cache.
+
+        Returns:
+            Dict with hits, misses, size, maxsize and enabled
+        """
+        return _pi_label_cache.info()
+
+    @staticmethod
+    def clear_pi_label_cache():
+        """Drop all rendered π labels and reset the counters."""
+        _pi_label_cache.clear()
+
+    @staticmethod
+    def _add_pi_ticks(axes: Axes, axis: str, mode: str, axis_range: list, font_size: float = 24):
         """
         Add π-based tick labels to an axis.
 
+        Labels are copied from a module-level cache of rendered MathTex, so
+        each distinct label is typeset only once per process.
+
         Args:
             axes: The Axes object
             axis: 'x' or 'y'
-            mode: "pi", "pi/2", or "2pi" - determines tick spacing
+            mode: "pi", "pi/2", "2pi" or any "k·pi/n" - determines tick spacing
             axis_range: Range of the axis [min, max, step]
+            font_size: Label font size (default 24)
 
         Examples:
             >>> _add_pi_ticks(axes, 'x', "pi", [0, 2*PI])
             >>> _add_pi_ticks(axes, 'y', "pi/2", [-PI, PI])
+            >>> _add_pi_ticks(axes, 'x', "pi/4", [0, PI])
         """
-        # Define comprehensive π label mapping
-        pi_labels = {
-            PI: r"\pi",
-            PI/2: r"\frac{\pi}{2}",
-            -PI: r"-\pi",
-            -PI/2: r"-\frac{\pi}{2}",
-            2*PI: r"2\pi",
-            -2*PI: r"-2\pi",
-            3*PI/2: r"\frac{3\pi}{2}",
-            -3*PI/2: r"-\frac{3\pi}{2}",
-            3*PI: r"3\pi",
-            -3*PI: r"-3\pi",
-            4*PI: r"4\pi",
-            -4*PI: r"-4\pi",
-            5*PI/2: r"\frac{5\pi}{2}",
-            -5*PI/2: r"-\frac{5\pi}{2}",
-            5*PI: r"5\pi",
-            -5*PI: r"-5\pi",
-            6*PI: r"6\pi",
-            -6*PI: r"-6\pi",
-            7*PI/2: r"\frac{7\pi}{2}",
-            -7*PI/2: r"-\frac{7\pi}{2}",
-            8*PI: r"8\pi",
-            -8*PI: r"-8\pi",
-            0: r"0",
-        }
-
-        # Filter labels based on mode
-        if mode == "2pi":
-            # Only multiples of 2π
-            filtered = {k: v for k, v in pi_labels.items() if k % (2*PI) == 0 or k == 0}
-        elif mode == "pi":
-            # Multiples of π (including 2π)
-            filtered = {k: v for k, v in pi_labels.items() if k % PI == 0}
-        elif mode == "pi/2":
-            # All labels (multiples of π/2)
-            filtered = pi_labels
-        else:
-            filtered = pi_labels
-
-        # Filter based on axis range
-        x_min, x_max = axis_range[0], axis_range[1]
-        range_filtered = {x: label for x, label in filtered.items() if x_min <= x <= x_max}
-
-        # Sort for consistency
-        sorted_labels = dict(sorted(range_filtered.items()))
-
         # Get the appropriate axis
         target_axis = axes.get_x_axis() if axis == 'x' else axes.get_y_axis()
 
         # Add labels
-        for val, label_text in sorted_labels.items():
-            label = MathTex(label_text, font_size=24)
+        for val, label_text in GraphUtils.pi_ticks(mode, axis_range):
+            label = GraphUtils._pi_label_mobject(label_text, font_size)
             if axis == 'x':
                 label.next_to(target_axis.n2p(val), DOWN, buff=0.2)
             else:
@@ -130,7 +202,7 @@ class GraphUtils:
             axes.add(label)
 
     @staticmethod
-    def graph(*args, x_range=[-5, 5], y_range=[-5, 5], axes=None, x_ticks=None, y_ticks=None, coords=True, **kwargs) -> Tuple[Axes, object]:
+    def graph(*args, x_range=[-5, 5], y_range=[-5, 5], axes=None, x_ticks=None, y_ticks=None, coords=True, cache=True, **kwargs) -> Tuple[Axes, object]:
         """
         Create a graph from string expression(s) with intelligent π tick detection.
 
@@ -153,11 +225,23 @@ class GraphUtils:
                 - False: Disable π ticks (use regular numbers)
             y_ticks: Tick mode for y-axis (same options as x_ticks)
             coords: If True, automatically add coordinate numbers to axes (default True)
-            **kwargs: Additional keyword arguments passed to Axes and plot functions
+            cache: If True, reuse the parsed expression and numpy callable from the
+                process-wide expression cache, and copy new axes from the axes
+                template cache (default True). Pass False to always re-parse with
+                sympy and build fresh axes.
+            **kwargs: Additional keyword arguments passed to Axes and plot functions.
+                Explicit plots also accept sampling="uniform"|"adaptive",
+                tolerance, params={name: ValueTracker} and lod=True (see
+                _create_explicit_plot); parametric plots accept
+                sampling="uniform"|"adaptive" and tolerance (see
+                _create_parametric_plot). Implicit plots also accept
+                engine="manim"|"native", resolution and refine_depth (see
+                _create_implicit_plot).
 
         Returns:
             Tuple of (axes, plot) where axes is an Axes object and plot is the
-            plotted function (either from axes.plot(), ImplicitFunction, or ParametricFunction)
+            plotted function (from axes.plot(), an ImplicitFunction, or a
+            SampledPlot for adaptive and native plots)
 
         Raises:
             ValueError: If wrong number of arguments or invalid expression
@@ -178,12 +262,42 @@ class GraphUtils:
             >>> # Disable coordinate numbers
             >>> axes, plot = graph("x**2", coords=False)
             >>>
+            >>> # Adaptive sampling with clean asymptotes
+            >>> axes, plot = graph("tan(x)", sampling="adaptive")
+            >>>
+            >>> # Parameters bound to ValueTrackers, updated in place every frame
+            >>> a, b = ValueTracker(1), ValueTracker(1)
+            >>> axes, plot = graph("a*sin(b*x)", params={"a": a, "b": b})
+            >>> self.play(a.animate.set_value(2), b.animate.set_value(3))
+            >>>
+            >>> # Level-of-detail plot, re-sampled while RogebraScene.zoom() animates the camera
+            >>> axes, plot = graph("sin(1/x)", lod=True)
+            >>>
             >>> # Implicit plot
             >>> axes, plot = graph("x**2 + y**2 = 4")
             >>>
+            >>> # Implicit plot traced by the native engine, with a finer contour grid
+            >>> axes, plot = graph("x**4 + y**4 - 3xy = 1", engine="native", resolution=128, refine_depth=4)
+            >>>
+            >>> # High-resolution native implicit plot on 4 processes, bounded memory per call
+            >>> axes, plot = graph("x**4 + y**4 - 3xy = 1", engine="native", resolution=1024, workers=4,
+            ...                    chunk_size=2**20)
+            >>>
             >>> # Parametric plot
             >>> axes, plot = graph("cos(t)", "sin(t)")
+            >>>
+            >>> # Adaptively sampled tight spiral with a stricter tolerance
+            >>> axes, plot = graph("t*cos(t)/10", "t*sin(t)/10", t_range=[0, 40], sampling="adaptive", tolerance=1e-4)
+            >>> plot.sample_count
         """
+        explicit = len(args) == 1 and "=" not in args[0]
+        if kwargs.get("params") and not explicit:
+            raise ValueError("params are only supported for explicit plots y = f(x)")
+        if kwargs.get("lod") and not explicit:
+            raise ValueError("lod is only supported for explicit plots y = f(x)")
+        if kwargs.get("lod") and kwargs.get("params"):
+            raise ValueError("lod and params cannot be combined")
+
         # Auto-detect trig functions if ticks not explicitly set
         if x_ticks is None or y_ticks is None:
             x_auto, y_auto = GraphUtils._detect_trig_axes(*args)
@@ -201,13 +315,13 @@ class GraphUtils:
                 # Implicit plot
                 return GraphUtils._create_implicit_plot(
                     expr_str, x_range, y_range, axes=axes,
-                    x_ticks=x_ticks, y_ticks=y_ticks, coords=coords, **kwargs
+                    x_ticks=x_ticks, y_ticks=y_ticks, coords=coords, cache=cache, **kwargs
                 )
             else:
                 # Explicit plot
                 return GraphUtils._create_explicit_plot(
                     expr_str, x_range, y_range, axes=axes,
-                    x_ticks=x_ticks, y_ticks=y_ticks, coords=coords, **kwargs
+                    x_ticks=x_ticks, y_ticks=y_ticks, coords=coords, cache=cache, **kwargs
                 )
 
         elif len(args) == 2:
@@ -215,7 +329,7 @@ class GraphUtils:
             expr_x, expr_y = args
             return GraphUtils._create_parametric_plot(
                 expr_x, expr_y, x_range, y_range, axes=axes,
-                x_ticks=x_ticks, y_ticks=y_ticks, coords=coords, **kwargs
+                x_ticks=x_ticks, y_ticks=y_ticks, coords=coords, cache=cache, **kwargs
             )
 
         else:
@@ -224,6 +338,77 @@ class GraphUtils:
                 "Use 1 arg for explicit/implicit plots, 2 args for parametric plots."
             )
 
+    @staticmethod
+    def graph_many(expressions, x_range=[-5, 5], y_range=[-5, 5], axes=None, x_ticks=None, y_ticks=None, coords=True,
+                   cache=True, colors=None, samples=257, **kwargs) -> Tuple[Axes, VGroup]:
+        """
+        Plot several explicit functions on one set of axes.
+
+        The axes and π tick detection are set up once, and all expressions are
+        lambdified into a single callable evaluated over one shared x-grid,
+        instead of parsing and sampling each curve separately.
+
+        Args:
+            expressions: List of explicit expressions y = f(x), e.g. ["sin(x)", "cos(x)"]
+            x_range: Range for x-axis, default [-5, 5]
+            y_range: Range for y-axis, default [-5, 5]
+            axes: Optional Axes object to use. If None, new axes will be created
+            x_ticks: Tick mode for x-axis (see graph()); auto-detected across all expressions
+            y_ticks: Tick mode for y-axis (see graph())
+            coords: If True, add coordinate numbers to axes (default True)
+            cache: Whether to use the expression and axes caches (default True)
+            colors: Optional list of colors, one per expression; defaults cycle
+                through BLUE_D, RED, GREEN_D, ORANGE, PURPLE, TEAL, GOLD, MAROON
+            samples: Number of points in the shared x-grid (default 257)
+            **kwargs: Additional arguments for Axes (x_length, y_length, tips,
+                axis_config) and plots (stroke_width; color applies to all curves)
+
+        Returns:
+            Tuple of (axes, plots) where plots is a VGroup with one SampledPlot
+            per expression, in order
+
+        Raises:
+            ValueError: If no expressions are given or one of them is an equation
+
+        Examples:
+            >>> axes, plots = graph_many(["sin(x)", "cos(x)", "sin(2x)"], x_range=[0, 2*PI], y_range=[-1.5, 1.5])
+            >>> self.add(axes, plots)
+            >>> sin_plot, cos_plot, sin2_plot = plots
+        """
+        expressions = list(expressions)
+        if not expressions:
+            raise ValueError("graph_many() needs at least one expression")
+        for expr_str in expressions:
+            if "=" in GraphUtils._remove_function_notation(expr_str):
+                raise ValueError(
+                    f"graph_many() only supports explicit expressions, got equation '{expr_str}'. "
+                    "Use graph() for implicit plots."
+                )
+
+        # Auto-detect trig functions once for the whole family
+        if x_ticks is None or y_ticks is None:
+            x_auto, y_auto = GraphUtils._detect_trig_axes(*expressions)
+            if x_ticks is None:
+                x_ticks = "pi" if x_auto else False
+            if y_ticks is None:
+                y_ticks = "pi" if y_auto else False
+
+        compiled, func = GraphUtils._compile_explicit_many(expressions, cache=cache)
+        axes = GraphUtils._prepare_axes(axes, x_range, y_range, x_ticks, y_ticks, coords, cache=cache, **kwargs)
+
+        # One vectorized evaluation of every curve over the shared grid
+        curves = sample_shared_grid(func, x_range, y_range, samples=samples)
+
+        if colors is None:
+            colors = [kwargs['color']] * len(expressions) if 'color' in kwargs else _MANY_COLORS
+        stroke_width = kwargs.get('stroke_width', 3)
+        plots = VGroup(*[
+            SampledPlot(axes, polylines, underlying_function=single_func,
+                        color=colors[i % len(colors)], stroke_width=stroke_width)
+            for i, (polylines, (_, _, single_func)) in enumerate(zip(curves, compiled))
+        ])
+        return axes, plots
+
     @staticmethod
     def _remove_function_notation(expression: str) -> str:
         """
@@ -244,7 +429,434 @@ class GraphUtils:
         return expression
 
     @staticmethod
-    def _create_explicit_plot(expr_str: str, x_range, y_range, axes=None, x_ticks=False, y_ticks=False, coords=True, **kwargs) -> Tuple[Axes, object]:
+    def _normalize_expression(expression: str) -> str:
+        """
+        Normalize an expression string for use as a cache key.
+
+        Collapses runs of whitespace so that "x**2 +  1" and "x**2 + 1" share
+        an entry. Whitespace is not removed entirely because implicit
+        multiplication treats "sin x" and "sinx" differently.
+        """
+        return " ".join(expression.split())
+
+    @staticmethod
+    def _cached_compile(kind: str, expressions: tuple, build, cache=True, extra=()):
+        """
+        Look up a compiled expression in the process-wide cache, building it on a miss.
+
+        Args:
+            kind: Plot kind ("explicit", "implicit" or "parametric")
+            expressions: Tuple of expression strings
+            build: Callable that parses and lambdifies the expressions
+            cache: If False, bypass the cache entirely
+            extra: Tuple of extra variable names (e.g. bound parameters)
+
+        Returns:
+            Whatever `build` returns
+        """
+        if not cache:
+            return build()
+
+        key = (kind, tuple(GraphUtils._normalize_expression(e) for e in expressions), tuple(extra))
+        compiled = _expression_cache.get(key)
+        if compiled is None:
+            compiled = build()
+            _expression_cache.put(key, compiled)
+        return compiled
+
+    @staticmethod
+    def _compile_explicit(expr_str: str, cache=True, params=()):
+        """
+        Parse and lambdify an explicit expression y = f(x).
+
+        Args:
+            expr_str: Expression string
+            cache: Whether to use the expression cache
+            params: Names of parameter symbols; they become extra positional
+                arguments of func, after x, in the given order
+
+        Returns:
+            Tuple of (var, expr, func) where func takes (x, *params)
+        """
+        # Remove function notation if present (e.g., "y = sin(x)" -> "sin(x)")
+        expr_str = GraphUtils._remove_function_notation(expr_str)
+        params = tuple(params)
+
+        def build():
+            # Parameter names are passed as symbols so that "amp" is not split into a*m*p
+            param_symbols = [sp.Symbol(name) for name in params]
+            expr = parse_expr(expr_str, local_dict=dict(zip(params, param_symbols)) or None,
+                              transformations=transformations)
+
+            # Get the free variable (should be x)
+            free_vars = expr.free_symbols - set(param_symbols)
+            if len(free_vars) == 0:
+                # Constant function
+                var = sp.Symbol('x')
+            elif len(free_vars) == 1:
+                var = list(free_vars)[0]
+            else:
+                # Multiple variables - can't do explicit plot
+                raise ValueError(
+                    f"Expression '{expr_str}' has multiple variables {free_vars}. "
+                    "Use implicit plot (include '=') or parametric plot (2 expressions)."
+                )
+
+            return var, expr, sp.lambdify((var, *param_symbols), expr, "numpy")
+
+        return GraphUtils._cached_compile("explicit", (expr_str,), build, cache=cache, extra=params)
+
+    @staticmethod
+    def _compile_implicit(expr_str: str, cache=True):
+        """
+        Parse and lambdify an implicit equation f(x, y) = 0.
+
+        Returns:
+            Tuple of (expr, func) where func takes (x, y)
+        """
+        def build():
+            if "=" in expr_str:
+                left, right = expr_str.split("=", 1)
+                left_expr = parse_expr(left.strip(), transformations=transformations)
+                right_expr = parse_expr(right.strip(), transformations=transformations)
+                # Convert to form: left - right = 0
+                expr = left_expr - right_expr
+            else:
+                # Assume it's already in form f(x, y) = 0
+                expr = parse_expr(expr_str, transformations=transformations)
+
+            free_vars = expr.free_symbols
+            if len(free_vars) != 2:
+                raise ValueError(
+                    f"Implicit plot requires exactly 2 variables, got {len(free_vars)}: {free_vars}"
+                )
+
+            x, y = sp.Symbol('x'), sp.Symbol('y')
+            return expr, sp.lambdify((x, y), expr, "numpy")
+
+        return GraphUtils._cached_compile("implicit", (expr_str,), build, cache=cache)
+
+    @staticmethod
+    def _compile_parametric(expr_x: str, expr_y: str, cache=True):
+        """
+        Parse and lambdify a pair of parametric expressions (x(t), y(t)).
+
+        Returns:
+            Tuple of (var, parsed_x, parsed_y, func) where func(t) returns the
+            pair (x, y), evaluating both components in a single call
+        """
+        # Remove function notation if present
+        expr_x = GraphUtils._remove_function_notation(expr_x)
+        expr_y = GraphUtils._remove_function_notation(expr_y)
+
+        def build():
+            parsed_x = parse_expr(expr_x, transformations=transformations)
+            parsed_y = parse_expr(expr_y, transformations=transformations)
+
+            all_vars = parsed_x.free_symbols | parsed_y.free_symbols
+            if len(all_vars) == 0:
+                # Constant functions
+                var = sp.Symbol('t')
+            elif len(all_vars) == 1:
+                var = list(all_vars)[0]
+            else:
+                raise ValueError(
+                    f"Parametric expressions must share the same variable, got {all_vars}"
+                )
+
+            func = sp.lambdify(var, (parsed_x, parsed_y), "numpy")
+            return var, parsed_x, parsed_y, func
+
+        return GraphUtils._cached_compile("parametric", (expr_x, expr_y), build, cache=cache)
+
+    @staticmethod
+    def _compile_explicit_many(expressions, cache=True):
+        """
+        Compile several explicit expressions into one callable of x.
+
+        Returns:
+            Tuple of (compiled, func) where compiled is the list of
+            _compile_explicit() results and func(x) returns all curves at once
+        """
+        compiled = [GraphUtils._compile_explicit(e, cache=cache) for e in expressions]
+
+        def build():
+            x = sp.Symbol('x')
+            return sp.lambdify(x, [expr.subs(var, x) for var, expr, _ in compiled], "numpy")
+
+        stripped = tuple(GraphUtils._remove_function_notation(e) for e in expressions)
+        return compiled, GraphUtils._cached_compile("explicit_many", stripped, build, cache=cache)
+
+    @staticmethod
+    def expression_cache_info() -> dict:
+        """
+        Get statistics for the process-wide compiled-expression cache.
+
+        Returns:
+            Dict with hits, misses, size, maxsize and enabled
+
+        Example:
+            >>> graph("sin(x)"); graph("sin(x)")
+            >>> GraphUtils.expression_cache_info()["hits"]  # 1
+        """
+        return _expression_cache.info()
+
+    @staticmethod
+    def clear_expression_cache():
+        """Empty the compiled-expression cache and reset its counters."""
+        _expression_cache.clear()
+
+    @staticmethod
+    def configure_expression_cache(enabled=None, maxsize=None):
+        """
+        Enable/disable the compiled-expression cache or change its size.
+
+        Args:
+            enabled: True to enable, False to disable (and stop storing), None to leave as is
+            maxsize: New maximum number of cached expressions, None to leave as is
+
+        Example:
+            >>> GraphUtils.configure_expression_cache(maxsize=1024)
+            >>> GraphUtils.configure_expression_cache(enabled=False)  # always re-parse
+        """
+        if enabled is not None:
+            _expression_cache.enabled = bool(enabled)
+        if maxsize is not None:
+            _expression_cache.resize(maxsize)
+
+    @staticmethod
+    def _build_axes(x_range, y_range, x_ticks=False, y_ticks=False, coords=True, **kwargs) -> Axes:
+        """
+        Construct new axes with π ticks or coordinate numbers.
+
+        Args:
+            x_range: Range for x-axis
+            y_range: Range for y-axis
+            x_ticks: π tick mode for x-axis
+            y_ticks: π tick mode for y-axis
+            coords: Whether to add coordinate numbers
+            **kwargs: Axes arguments (x_length, y_length, tips, axis_config)
+
+        Returns:
+            Axes object
+        """
+        # Configure axis to hide numbers if π ticks will be added
+        x_axis_config = {"include_numbers": not bool(x_ticks)}
+        y_axis_config = {"include_numbers": not bool(y_ticks)}
+
+        axes = Axes(
+            x_range=[x_range[0], x_range[1], (x_range[1] - x_range[0]) / 10],
+            y_range=[y_range[0], y_range[1], (y_range[1] - y_range[0]) / 10],
+            x_axis_config=x_axis_config,
+            y_axis_config=y_axis_config,
+            **{k: v for k, v in kwargs.items() if k in _AXES_KWARGS}
+        )
+        # Set default axes color to BLACK
+        axes.set_stroke(color=BLACK)
+
+        GraphUtils._decorate_axes(axes, x_range, y_range, x_ticks, y_ticks, coords)
+        return axes
+
+    @staticmethod
+    def _decorate_axes(axes: Axes, x_range, y_range, x_ticks=False, y_ticks=False, coords=True):
+        """Add π tick labels and/or coordinate numbers to axes."""
+        # Add π ticks if requested
+        if x_ticks and isinstance(x_ticks, str):
+            GraphUtils._add_pi_ticks(axes, 'x', x_ticks, x_range)
+        if y_ticks and isinstance(y_ticks, str):
+            GraphUtils._add_pi_ticks(axes, 'y', y_ticks, y_range)
+
+        # Add coordinate numbers if requested (and not using π ticks)
+        if coords and not (x_ticks or y_ticks):
+            axes.add_coordinates()
+
+    @staticmethod
+    def _freeze(value):
+        """Convert a (possibly nested) configuration value into a hashable cache key."""
+        if isinstance(value, dict):
+            return tuple(sorted((str(k), GraphUtils._freeze(v)) for k, v in value.items()))
+        if isinstance(value, (list, tuple)):
+            return tuple(GraphUtils._freeze(v) for v in value)
+        if isinstance(value, np.ndarray):
+            return ("ndarray", value.shape, tuple(value.ravel().tolist()))
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+        return value
+
+    @staticmethod
+    def _prepare_axes(axes, x_range, y_range, x_ticks=False, y_ticks=False, coords=True, cache=True, **kwargs) -> Axes:
+        """
+        Get the axes for a plot.
+
+        Provided axes are decorated in place. Otherwise a copy of a cached
+        template is returned; the template is built (π ticks and coordinate
+        numbers included) on the first request for its configuration.
+
+        Args:
+            axes: Axes object to use, or None to create new axes
+            x_range: Range for x-axis
+            y_range: Range for y-axis
+            x_ticks: π tick mode for x-axis
+            y_ticks: π tick mode for y-axis
+            coords: Whether to add coordinate numbers
+            cache: If False, always build fresh axes
+            **kwargs: graph() keyword arguments; only Axes arguments are used
+
+        Returns:
+            Axes object
+        """
+        if axes is not None:
+            GraphUtils._decorate_axes(axes, x_range, y_range, x_ticks, y_ticks, coords)
+            return axes
+
+        axes_kwargs = {k: v for k, v in kwargs.items() if k in _AXES_KWARGS}
+        if not cache or not _axes_cache.enabled:
+            return GraphUtils._build_axes(x_range, y_range, x_ticks, y_ticks, coords, **axes_kwargs)
+
+        key = (
+            (float(x_range[0]), float(x_range[1])),
+            (float(y_range[0]), float(y_range[1])),
+            x_ticks, y_ticks, bool(coords),
+            GraphUtils._freeze(axes_kwargs),
+        )
+        template = _axes_cache.get(key)
+        if template is None:
+            template = GraphUtils._build_axes(x_range, y_range, x_ticks, y_ticks, coords, **axes_kwargs)
+            _axes_cache.put(key, template)
+        return template.copy()
+
+    @staticmethod
+    def axes_cache_info() -> dict:
+        """
+        Get statistics for the axes template cache.
+
+        Returns:
+            Dict with hits, misses, size, maxsize and enabled
+        """
+        return _axes_cache.info()
+
+    @staticmethod
+    def clear_axes_cache():
+        """Drop all cached axes templates and reset the counters."""
+        _axes_cache.clear()
+
+    @staticmethod
+    def configure_axes_cache(enabled=None, maxsize=None):
+        """
+        Enable/disable the axes template cache or change its size.
+
+        Args:
+            enabled: True to enable, False to disable (always build new axes), None to leave as is
+            maxsize: New maximum number of cached templates, None to leave as is
+
+        Example:
+            >>> GraphUtils.configure_axes_cache(maxsize=8)
+        """
+        if enabled is not None:
+            _axes_cache.enabled = bool(enabled)
+        if maxsize is not None:
+            _axes_cache.resize(maxsize)
+
+    @staticmethod
+    def _disk_key(kind: str, expressions, *settings) -> tuple:
+        """Build a disk-cache key from normalized expressions, ranges and sampling settings."""
+        def normalize(value):
+            if isinstance(value, (list, tuple, np.ndarray)):
+                return tuple(normalize(v) for v in value)
+            if isinstance(value, (int, float, np.number)):
+                return float(value)
+            return value
+        return (kind, tuple(GraphUtils._normalize_expression(e) for e in expressions), normalize(settings))
+
+    @staticmethod
+    def _cached_samples(key: tuple, compute) -> list:
+        """
+        Look up sampled polylines in the disk cache, computing and storing them on a miss.
+
+        Args:
+            key: Key from _disk_key()
+            compute: Callable returning the polylines (parses and samples the expression)
+
+        Returns:
+            List of (N, 2) polylines
+        """
+        if not _disk_cache.enabled:
+            return compute()
+        polylines = _disk_cache.get(key)
+        if polylines is None:
+            polylines = compute()
+            _disk_cache.put(key, polylines)
+        return polylines
+
+    @staticmethod
+    def _lazy_function(compile_func):
+        """Wrap a compile step so the callable is only built when first evaluated."""
+        compiled = []
+
+        def underlying_function(x):
+            if not compiled:
+                compiled.append(compile_func())
+            return compiled[0](x)
+        return underlying_function
+
+    @staticmethod
+    def configure_disk_cache(enabled=None, directory=None, max_bytes=None):
+        """
+        Enable the persistent plot-sample cache, or change its location or size cap.
+
+        Explicit plots (uniform and adaptive), native implicit plots and
+        adaptive parametric plots are stored as memory-mapped .npy files keyed
+        by the normalized expression, ranges and sampling settings. A warm
+        entry skips both sympy parsing and numeric evaluation.
+
+        Args:
+            enabled: True to enable, False to disable, None to leave as is (disabled by default)
+            directory: Cache directory, None to leave as is (default: <media_dir>/plot_cache)
+            max_bytes: Size cap in bytes; least recently used entries are evicted beyond it
+
+        Example:
+            >>> GraphUtils.configure_disk_cache(enabled=True, max_bytes=512 * 2**20)
+        """
+        if enabled is not None:
+            _disk_cache.enabled = bool(enabled)
+        if directory is not None:
+            _disk_cache.directory = directory
+        if max_bytes is not None:
+            _disk_cache.resize(max_bytes)
+
+    @staticmethod
+    def disk_cache_info() -> dict:
+        """
+        Get statistics for the persistent plot-sample cache.
+
+        Returns:
+            Dict with hits, misses, writes, evictions, entries, bytes, max_bytes,
+            directory and enabled
+        """
+        return _disk_cache.info()
+
+    @staticmethod
+    def disk_cache_report() -> str:
+        """
+        Get a one-line summary of the persistent cache, e.g. for batch render logs.
+
+        Example:
+            >>> print(GraphUtils.disk_cache_report())
+            plot cache: 40 hits, 2 misses (95% hit rate), 2 writes, 0 evictions, ...
+        """
+        return _disk_cache.report()
+
+    @staticmethod
+    def clear_disk_cache():
+        """Delete all persistent cache entries and reset the counters."""
+        _disk_cache.clear()
+
+    @staticmethod
+    def _create_explicit_plot(expr_str: str, x_range, y_range, axes=None, x_ticks=False, y_ticks=False, coords=True, cache=True,
+                              sampling="uniform", tolerance=1e-3, params=None, samples=257, lod=False,
+                              **kwargs) -> Tuple[Axes, object]:
         """
         Create an explicit plot y = f(x).
 
@@ -255,49 +867,31 @@ class GraphUtils:
             axes: Optional Axes object to use
             x_ticks: π tick mode for x-axis
             y_ticks: π tick mode for y-axis
+            coords: Whether to add coordinate numbers
+            cache: Whether to use the expression and axes caches
+            sampling: "uniform" (default) uses axes.plot(); "adaptive" samples the
+                function with sample_explicit(), splitting at asymptotes and
+                undefined regions, and returns a SampledPlot
+            tolerance: Adaptive sampling tolerance as a fraction of the y-span (default 1e-3)
+            params: Optional dict mapping parameter names in the expression to
+                ValueTrackers (or numbers). The plot is sampled on a fixed grid
+                and an updater re-evaluates it in place whenever drawn (sampling
+                is ignored)
+            samples: Grid size for parameter-bound plots (default 257)
+            lod: If True, return a SampledPlot with an LODSampler in plot.lod;
+                RogebraScene.zoom() then re-samples the visible x-interval at a
+                density matched to the zoomed camera frame (sampling is ignored)
             **kwargs: Additional arguments for Axes
 
         Returns:
             Tuple of (axes, plot)
         """
-        # Remove function notation if present (e.g., "y = sin(x)" -> "sin(x)")
-        expr_str = GraphUtils._remove_function_notation(expr_str)
-
-        # Parse the expression
-        expr = parse_expr(expr_str, transformations=transformations)
+        # Parse and lambdify on demand (a warm disk cache skips sympy entirely)
+        def compile_func():
+            return GraphUtils._compile_explicit(expr_str, cache=cache, params=tuple(params or ()))[2]
 
-        # Get the free variable (should be x)
-        free_vars = expr.free_symbols
-        if len(free_vars) == 0:
-            # Constant function
-            var = sp.Symbol('x')
-        elif len(free_vars) == 1:
-            var = list(free_vars)[0]
-        else:
-            # Multiple variables - can't do explicit plot
-            raise ValueError(
-                f"Expression '{expr_str}' has multiple variables {free_vars}. "
-                "Use implicit plot (include '=') or parametric plot (2 expressions)."
-            )
-
-        # Convert to lambda function
-        func = sp.lambdify(var, expr, "numpy")
-
-        # Create or use provided axes
-        if axes is None:
-            # Configure axis to hide numbers if π ticks will be added
-            x_axis_config = {"include_numbers": not bool(x_ticks)}
-            y_axis_config = {"include_numbers": not bool(y_ticks)}
-
-            axes = Axes(
-                x_range=[x_range[0], x_range[1], (x_range[1] - x_range[0]) / 10],
-                y_range=[y_range[0], y_range[1], (y_range[1] - y_range[0]) / 10],
-                x_axis_config=x_axis_config,
-                y_axis_config=y_axis_config,
-                **{k: v for k, v in kwargs.items() if k in ['x_length', 'y_length', 'tips', 'axis_config']}
-            )
-            # Set default axes color to BLACK
-            axes.set_stroke(color=BLACK)
+        # Reuse a cached, fully decorated axes template (or decorate the provided axes)
+        axes = GraphUtils._prepare_axes(axes, x_range, y_range, x_ticks, y_ticks, coords, cache=cache, **kwargs)
 
         # Create plot with default BLUE_D color
         plot_kwargs = {k: v for k, v in kwargs.items() if k in ['color', 'stroke_width']}
@@ -305,22 +899,126 @@ class GraphUtils:
             plot_kwargs['color'] = BLUE_D
         if 'stroke_width' not in plot_kwargs:
             plot_kwargs['stroke_width'] = 3
-        plot = axes.plot(func, x_range=x_range, **plot_kwargs)
+        if lod:
+            func = compile_func()
+            sampler = LODSampler(func, x_range, y_range, tolerance=tolerance)
+            plot = SampledPlot(axes, sampler.sample(x_range[0], x_range[1], 0), underlying_function=func, **plot_kwargs)
+            plot.lod = sampler
+        elif params:
+            plot = GraphUtils._create_bound_plot(axes, compile_func(), list(params.values()), x_range, samples, **plot_kwargs)
+        elif sampling == "uniform":
+            plot = GraphUtils._create_uniform_plot(axes, expr_str, compile_func, x_range, **plot_kwargs)
+        elif sampling == "adaptive":
+            polylines = GraphUtils._cached_samples(
+                GraphUtils._disk_key("explicit", [GraphUtils._remove_function_notation(expr_str)],
+                                     x_range, y_range, tolerance),
+                lambda: sample_explicit(compile_func(), x_range, y_range, tolerance=tolerance)
+            )
+            plot = SampledPlot(axes, polylines, underlying_function=GraphUtils._lazy_function(compile_func), **plot_kwargs)
+        else:
+            raise ValueError(f"Unknown sampling mode '{sampling}'. Use 'uniform' or 'adaptive'.")
 
-        # Add π ticks if requested
-        if x_ticks and isinstance(x_ticks, str):
-            GraphUtils._add_pi_ticks(axes, 'x', x_ticks, x_range)
-        if y_ticks and isinstance(y_ticks, str):
-            GraphUtils._add_pi_ticks(axes, 'y', y_ticks, y_range)
+        return axes, plot
 
-        # Add coordinate numbers if requested (and not using π ticks)
-        if coords and not (x_ticks or y_ticks):
-            axes.add_coordinates()
+    @staticmethod
+    def _create_uniform_plot(axes: Axes, expr_str: str, compile_func, x_range, **plot_kwargs):
+        """
+        Create an axes.plot() curve whose samples go through the disk cache.
 
-        return axes, plot
+        axes.plot() evaluates the function one x at a time on its own grid. On
+        a miss the compiled function is wrapped to record those (x, y) pairs,
+        which are stored as one polyline; on a hit axes.plot() reads the same
+        grid back from the stored table, so neither sympy nor the function
+        runs. Other x values (later calls to plot.underlying_function) fall
+        back to the lazily compiled function.
+
+        Args:
+            axes: Axes the plot is drawn on
+            expr_str: Expression string, used for the cache key
+            compile_func: Callable returning the compiled f(x)
+            x_range: [x_min, x_max] or [x_min, x_max, step] for axes.plot()
+            **plot_kwargs: Style arguments for axes.plot()
+
+        Returns:
+            The axes.plot() result
+        """
+        if not _disk_cache.enabled:
+            return axes.plot(compile_func(), x_range=x_range, **plot_kwargs)
+
+        built = []
+
+        def sample():
+            func, recorded, recording = compile_func(), {}, [True]
+
+            def underlying_function(x):
+                y = func(x)
+                if recording[0] and np.ndim(x) == 0:
+                    recorded[float(x)] = y
+                return y
+
+            built.append(axes.plot(underlying_function, x_range=x_range, **plot_kwargs))
+            recording[0] = False
+            return [np.array(list(recorded.items()), dtype=float).reshape(-1, 2)]
+
+        # The grid depends on the plot range and on the axes step (axes.plot() subdivides it)
+        polylines = GraphUtils._cached_samples(
+            GraphUtils._disk_key("explicit-uniform", [GraphUtils._remove_function_notation(expr_str)],
+                                 x_range, axes.x_range),
+            sample
+        )
+        if built:
+            return built[0]
+
+        table = {x: y for line in polylines for x, y in np.asarray(line).tolist()}
+        fallback = GraphUtils._lazy_function(compile_func)
+
+        def underlying_function(x):
+            if np.ndim(x) == 0 and float(x) in table:
+                return table[float(x)]
+            return fallback(x)
+        return axes.plot(underlying_function, x_range=x_range, **plot_kwargs)
+
+    @staticmethod
+    def _create_bound_plot(axes: Axes, func, sources: list, x_range, samples=257, **plot_kwargs) -> SampledPlot:
+        """
+        Create an explicit plot whose parameters follow ValueTrackers.
+
+        The function is sampled on one fixed x-grid. The attached updater reads
+        the current parameter values, re-evaluates that grid in a single
+        vectorized call and overwrites the plot's points in place, so no
+        expression parsing or mobject construction happens per frame.
+
+        Args:
+            axes: Axes the plot is drawn on
+            func: Callable f(x, *params) from _compile_explicit()
+            sources: Parameter sources in argument order; ValueTrackers (or
+                anything with get_value()) or plain numbers
+            x_range: [x_min, x_max]
+            samples: Number of grid points (default 257)
+            **plot_kwargs: Style arguments for the plot
+
+        Returns:
+            SampledPlot with an updater attached
+        """
+        xs = np.linspace(float(x_range[0]), float(x_range[1]), max(int(samples), 2))
+
+        def current_values():
+            return [source.get_value() if hasattr(source, "get_value") else source for source in sources]
+
+        ys = evaluate(func, xs, *current_values())
+        finite = np.isfinite(ys)
+        plot = SampledPlot(
+            axes, split_runs(xs, ys, finite[:-1] & finite[1:]),
+            underlying_function=lambda x: func(x, *current_values()),
+            **plot_kwargs
+        )
+        plot.add_updater(lambda mob: mob.set_grid_values(xs, evaluate(func, xs, *current_values())))
+        return plot
 
     @staticmethod
-    def _create_implicit_plot(expr_str: str, x_range, y_range, axes=None, x_ticks=False, y_ticks=False, coords=True, **kwargs) -> Tuple[Axes, object]:
+    def _create_implicit_plot(expr_str: str, x_range, y_range, axes=None, x_ticks=False, y_ticks=False, coords=True, cache=True,
+                              engine="manim", resolution=64, refine_depth=3, workers=None, tiles=None, chunk_size=None,
+                              **kwargs) -> Tuple[Axes, object]:
         """
         Create an implicit plot from an equation.
 
@@ -331,48 +1029,34 @@ class GraphUtils:
             axes: Optional Axes object to use
             x_ticks: π tick mode for x-axis
             y_ticks: π tick mode for y-axis
+            coords: Whether to add coordinate numbers
+            cache: Whether to use the expression and axes caches
+            engine: "manim" (default) returns Manim's ImplicitFunction, as
+                before; "native" traces the curve with the vectorized
+                marching-squares engine (skipping sign changes through poles)
+                and returns a SampledPlot in axes coordinates, which can be
+                stored in the disk cache
+            resolution: Coarse grid cells per axis for the native engine (default 64)
+            refine_depth: Quadtree refinement levels for the native engine (default 3)
+            workers: Optional number of worker processes for the native engine.
+                The grid is split into tiles that are evaluated and contoured
+                in a ProcessPoolExecutor (each worker compiles the expression
+                string itself) and the tile seams are merged
+            tiles: Tiles per axis, int or (tx, ty) (default: workers per axis
+                when workers is set)
+            chunk_size: Maximum number of grid points per evaluation call, to
+                bound memory on large grids (default: no limit)
             **kwargs: Additional arguments for Axes
 
         Returns:
             Tuple of (axes, plot)
         """
-        # Parse the equation
-        if "=" in expr_str:
-            left, right = expr_str.split("=", 1)
-            left_expr = parse_expr(left.strip(), transformations=transformations)
-            right_expr = parse_expr(right.strip(), transformations=transformations)
-            # Convert to form: left - right = 0
-            expr = left_expr - right_expr
-        else:
-            # Assume it's already in form f(x, y) = 0
-            expr = parse_expr(expr_str, transformations=transformations)
-
-        # Get free variables
-        free_vars = expr.free_symbols
-        if len(free_vars) != 2:
-            raise ValueError(
-                f"Implicit plot requires exactly 2 variables, got {len(free_vars)}: {free_vars}"
-            )
+        # Parse and lambdify on demand (a warm disk cache skips sympy entirely)
+        def compile_func():
+            return GraphUtils._compile_implicit(expr_str, cache=cache)[1]
 
-        # Convert to lambda function
-        x, y = sp.Symbol('x'), sp.Symbol('y')
-        func = sp.lambdify((x, y), expr, "numpy")
-
-        # Create or use provided axes
-        if axes is None:
-            # Configure axis to hide numbers if π ticks will be added
-            x_axis_config = {"include_numbers": not bool(x_ticks)}
-            y_axis_config = {"include_numbers": not bool(y_ticks)}
-
-            axes = Axes(
-                x_range=[x_range[0], x_range[1], (x_range[1] - x_range[0]) / 10],
-                y_range=[y_range[0], y_range[1], (y_range[1] - y_range[0]) / 10],
-                x_axis_config=x_axis_config,
-                y_axis_config=y_axis_config,
-                **{k: v for k, v in kwargs.items() if k in ['x_length', 'y_length', 'tips', 'axis_config']}
-            )
-            # Set default axes color to BLACK
-            axes.set_stroke(color=BLACK)
+        # Reuse a cached, fully decorated axes template (or decorate the provided axes)
+        axes = GraphUtils._prepare_axes(axes, x_range, y_range, x_ticks, y_ticks, coords, cache=cache, **kwargs)
 
         # Create implicit plot with default BLUE_D color
         plot_kwargs = {k: v for k, v in kwargs.items() if k in ['color', 'stroke_width']}
@@ -380,25 +1064,61 @@ class GraphUtils:
             plot_kwargs['color'] = BLUE_D
         if 'stroke_width' not in plot_kwargs:
             plot_kwargs['stroke_width'] = 3
-        plot = ImplicitFunction(
-            lambda x, y: func(x, y),
-            **plot_kwargs
-        )
+        if engine == "native":
+            polylines = GraphUtils._cached_samples(
+                GraphUtils._disk_key("implicit", [expr_str], x_range, y_range, resolution, refine_depth),
+                lambda: GraphUtils._contour_implicit(expr_str, compile_func, x_range, y_range, resolution, refine_depth,
+                                                     workers=workers, tiles=tiles, chunk_size=chunk_size)
+            )
+            plot = SampledPlot(axes, polylines, **plot_kwargs)
+        elif engine == "manim":
+            func = compile_func()
+            plot = ImplicitFunction(
+                lambda x, y: func(x, y),
+                **plot_kwargs
+            )
+        else:
+            raise ValueError(f"Unknown implicit engine '{engine}'. Use 'native' or 'manim'.")
 
-        # Add π ticks if requested
-        if x_ticks and isinstance(x_ticks, str):
-            GraphUtils._add_pi_ticks(axes, 'x', x_ticks, x_range)
-        if y_ticks and isinstance(y_ticks, str):
-            GraphUtils._add_pi_ticks(axes, 'y', y_ticks, y_range)
+        return axes, plot
 
-        # Add coordinate numbers if requested (and not using π ticks)
-        if coords and not (x_ticks or y_ticks):
-            axes.add_coordinates()
+    @staticmethod
+    def _contour_implicit(expr_str: str, compile_func, x_range, y_range, resolution, refine_depth,
+                          workers=None, tiles=None, chunk_size=None) -> list:
+        """
+        Trace an implicit curve, optionally in tiles spread over worker processes.
 
-        return axes, plot
+        Args:
+            expr_str: Equation string (sent to workers instead of a pickled callable)
+            compile_func: Callable returning the compiled f(x, y) for in-process use
+            x_range: [x_min, x_max]
+            y_range: [y_min, y_max]
+            resolution: Coarse grid cells per axis
+            refine_depth: Quadtree refinement levels
+            workers: Number of worker processes, or None to stay in-process
+            tiles: Tiles per axis (default: workers)
+            chunk_size: Maximum number of grid points per evaluation call
+
+        Returns:
+            List of (N, 2) polylines
+        """
+        if not workers or workers <= 1:
+            return marching_squares(compile_func(), x_range, y_range, resolution=resolution,
+                                    refine_depth=refine_depth, tiles=tiles, chunk_size=chunk_size)
+
+        ranges = tile_ranges(resolution, tiles if tiles is not None else workers)
+        count = len(ranges)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                _contour_tile_worker,
+                [expr_str] * count, [list(x_range)] * count, [list(y_range)] * count,
+                [resolution] * count, [refine_depth] * count, ranges, [chunk_size] * count
+            )
+            return merge_tile_segments(results)
 
     @staticmethod
-    def _create_parametric_plot(expr_x: str, expr_y: str, x_range, y_range, t_range=None, axes=None, x_ticks=False, y_ticks=False, coords=True, **kwargs) -> Tuple[Axes, object]:
+    def _create_parametric_plot(expr_x: str, expr_y: str, x_range, y_range, t_range=None, axes=None, x_ticks=False, y_ticks=False, coords=True, cache=True,
+                                sampling="uniform", tolerance=1e-3, **kwargs) -> Tuple[Axes, object]:
         """
         Create a parametric plot from two expressions.
 
@@ -411,57 +1131,29 @@ class GraphUtils:
             axes: Optional Axes object to use
             x_ticks: π tick mode for x-axis
             y_ticks: π tick mode for y-axis
+            coords: Whether to add coordinate numbers
+            cache: Whether to use the expression and axes caches
+            sampling: "uniform" (default) uses Manim's ParametricFunction;
+                "adaptive" samples both components over one t array with
+                sample_parametric(), refining by curvature and arc length, and
+                returns a SampledPlot (see plot.sample_count)
+            tolerance: Adaptive sampling tolerance in view units, where the x- and
+                y-span each have length 1 (default 1e-3)
             **kwargs: Additional arguments for Axes
 
         Returns:
             Tuple of (axes, plot)
         """
-        # Remove function notation if present
-        expr_x = GraphUtils._remove_function_notation(expr_x)
-        expr_y = GraphUtils._remove_function_notation(expr_y)
-
-        # Parse expressions
-        parsed_x = parse_expr(expr_x, transformations=transformations)
-        parsed_y = parse_expr(expr_y, transformations=transformations)
-
-        # Get free variables
-        vars_x = parsed_x.free_symbols
-        vars_y = parsed_y.free_symbols
-        all_vars = vars_x | vars_y
-
-        if len(all_vars) == 0:
-            # Constant functions
-            var = sp.Symbol('t')
-        elif len(all_vars) == 1:
-            var = list(all_vars)[0]
-        else:
-            raise ValueError(
-                f"Parametric expressions must share the same variable, got {all_vars}"
-            )
-
-        # Convert to lambda functions
-        func_x = sp.lambdify(var, parsed_x, "numpy")
-        func_y = sp.lambdify(var, parsed_y, "numpy")
+        # Parse and lambdify on demand (a warm disk cache skips sympy entirely)
+        def compile_func():
+            return GraphUtils._compile_parametric(expr_x, expr_y, cache=cache)[3]
 
         # Default t_range if not provided
         if t_range is None:
             t_range = [0, 2 * np.pi]
 
-        # Create or use provided axes
-        if axes is None:
-            # Configure axis to hide numbers if π ticks will be added
-            x_axis_config = {"include_numbers": not bool(x_ticks)}
-            y_axis_config = {"include_numbers": not bool(y_ticks)}
-
-            axes = Axes(
-                x_range=[x_range[0], x_range[1], (x_range[1] - x_range[0]) / 10],
-                y_range=[y_range[0], y_range[1], (y_range[1] - y_range[0]) / 10],
-                x_axis_config=x_axis_config,
-                y_axis_config=y_axis_config,
-                **{k: v for k, v in kwargs.items() if k in ['x_length', 'y_length', 'tips', 'axis_config']}
-            )
-            # Set default axes color to BLACK
-            axes.set_stroke(color=BLACK)
+        # Reuse a cached, fully decorated axes template (or decorate the provided axes)
+        axes = GraphUtils._prepare_axes(axes, x_range, y_range, x_ticks, y_ticks, coords, cache=cache, **kwargs)
 
         # Create parametric plot with default BLUE_D color
         plot_kwargs = {k: v for k, v in kwargs.items() if k in ['color', 'stroke_width']}
@@ -469,23 +1161,30 @@ class GraphUtils:
             plot_kwargs['color'] = BLUE_D
         if 'stroke_width' not in plot_kwargs:
             plot_kwargs['stroke_width'] = 3
-        plot = ParametricFunction(
-            lambda t: axes.c2p(func_x(t), func_y(t)),
-            t_range=t_range,
-            **plot_kwargs
-        )
+        if sampling == "uniform":
+            func = compile_func()
+            plot = ParametricFunction(
+                lambda t: axes.c2p(*func(t)),
+                t_range=t_range,
+                **plot_kwargs
+            )
+        elif sampling == "adaptive":
+            polylines = GraphUtils._cached_samples(
+                GraphUtils._disk_key("parametric", [GraphUtils._remove_function_notation(e) for e in (expr_x, expr_y)],
+                                     t_range, x_range, y_range, tolerance),
+                lambda: sample_parametric(compile_func(), t_range, x_range, y_range, tolerance=tolerance)
+            )
+            plot = SampledPlot(axes, polylines, **plot_kwargs)
+        else:
+            raise ValueError(f"Unknown sampling mode '{sampling}'. Use 'uniform' or 'adaptive'.")
 
-        # Add π ticks if requested
-        if x_ticks and isinstance(x_ticks, str):
-            GraphUtils._add_pi_ticks(axes, 'x', x_ticks, x_range)
-        if y_ticks and isinstance(y_ticks, str):
-            GraphUtils._add_pi_ticks(axes, 'y', y_ticks, y_range)
+        return axes, plot
 
-        # Add coordinate numbers if requested (and not using π ticks)
-        if coords and not (x_ticks or y_ticks):
-            axes.add_coordinates()
 
-        return axes, plot
+def _contour_tile_worker(expr_str, x_range, y_range, resolution, refine_depth, tile, chunk_size):
+    """Process-pool worker: compile the equation string and contour one tile of the grid."""
+    func = GraphUtils._compile_implicit(expr_str)[1]
+    return contour_tile_segments(func, x_range, y_range, resolution, refine_depth, tile=tile, chunk_size=chunk_size)
 
 
 # Convenience function at module level
@@ -496,3 +1195,12 @@ def graph(*args, **kwargs) -> Tuple[Axes, object]:
     Create a graph from string expression(s). See GraphUtils.graph() for details.
     """
     return GraphUtils.graph(*args, **kwargs)
+
+
+def graph_many(expressions, **kwargs) -> Tuple[Axes, VGroup]:
+    """
+    Convenience function for GraphUtils.graph_many().
+
+    Plot several explicit functions on shared axes. See GraphUtils.graph_many() for details.
+    """
+    return GraphUtils.graph_many(expressions, **kwargs)
@@ -1,12 +1,23 @@
 """
 Intersection utility functions for Manim objects.
 
-Provides helper functions for finding intersections between geometric objects.
+Provides helper functions for finding intersections between geometric objects,
+plus batched NumPy kernels that intersect whole arrays of segments and circles
+in one call, and a general routine for any two curves given as cubic Bézier
+control points.
 """
 
 import numpy as np
-from manim import Line, Dot, VGroup, Circle
-from typing import Union
+from manim import Line, Dot, VGroup, VMobject, Circle, Arc, Ellipse, Polygram, ParametricFunction, PMobject, WHITE
+from typing import Callable, Optional, Tuple, Union
+from .path_utils import SampledPlot, segments_to_bezier_points
+from .cache_utils import LRUCache
+
+# Cross products / discriminants below this are treated as parallel / tangent
+_PARALLEL_TOL = 1e-10
+
+# Slack on segment parameters so endpoint hits count as inside
+_BOUNDS_TOL = 1e-9
 
 
 def intersect_lines(line1: Line, line2: Line) -> Union[Dot, VGroup]:
@@ -36,38 +47,14 @@ def intersect_lines(line1: Line, line2: Line) -> Union[Dot, VGroup]:
         >>> intersection2 = intersect_lines(line3, line4)
         >>> # Returns empty VGroup
     """
-    # Get endpoints of both lines
-    p1 = line1.get_start()
-    p2 = line1.get_end()
-    p3 = line2.get_start()
-    p4 = line2.get_end()
-
-    # Direction vectors
-    d1 = p2 - p1  # Direction of line1
-    d2 = p4 - p3  # Direction of line2
-
-    # Vector from line1 start to line2 start
-    p1_to_p3 = p3 - p1
-
-    # Calculate the cross product in 2D (ignoring z-component)
-    # For 3D vectors [x, y, z], we use the z-component of the cross product
-    cross_d1_d2 = d1[0] * d2[1] - d1[1] * d2[0]
-
-    # If cross product is zero, lines are parallel or coincident
-    if np.abs(cross_d1_d2) < 1e-10:
-        return VGroup()  # Empty VGroup for parallel/coincident lines
+    segments1 = np.array([[line1.get_start(), line1.get_end()]], dtype=float)
+    segments2 = np.array([[line2.get_start(), line2.get_end()]], dtype=float)
+    points, valid = line_intersections(segments1, segments2)
 
-    # Calculate parameter t for line1
-    # Using the formula from line intersection:
-    # t = ((p3 - p1) × d2) / (d1 × d2)
-    cross_p1p3_d2 = p1_to_p3[0] * d2[1] - p1_to_p3[1] * d2[0]
-    t = cross_p1p3_d2 / cross_d1_d2
-
-    # Calculate intersection point
-    # P = p1 + t * d1
-    intersection_point = p1 + t * d1
-
-    return Dot(intersection_point)
+    # Parallel or coincident lines have no single intersection point
+    if not valid[0]:
+        return VGroup()
+    return Dot(points[0])
 
 
 def intersect_line_circle(line: Line, circle: Circle) -> VGroup:
@@ -98,52 +85,1299 @@ def intersect_line_circle(line: Line, circle: Circle) -> VGroup:
         >>> intersections2 = intersect_line_circle(line2, circle)
         >>> # Returns empty VGroup
     """
-    # Get line parameters
-    p1 = line.get_start()
-    p2 = line.get_end()
-    direction = p2 - p1
+    segments = np.array([[line.get_start(), line.get_end()]], dtype=float)
+    # Calculate radius from the circle's width
+    points, valid = line_circle_intersections(segments, circle.get_center(), circle.width / 2)
 
-    # Normalize direction vector
-    d = direction / np.linalg.norm(direction)
+    # 2 Dots for a secant, 1 for a tangent, none for a miss
+    return VGroup(*[Dot(point) for point in points[0][valid[0]]])
 
-    # Get circle parameters
-    center = circle.get_center()
-    # Calculate radius from the circle's width
-    radius = circle.width / 2
 
-    # Vector from line start to circle center
-    f = p1 - center
+# ============================================================================
+# Batched kernels
+# ============================================================================
 
-    # Solve quadratic equation: |p1 + t*d - center|² = radius²
-    # Expanding: (f + t*d)·(f + t*d) = r²
-    # t²(d·d) + 2t(f·d) + (f·f - r²) = 0
-    # Since d is normalized, d·d = 1
-    a = np.dot(d, d)  # Should be 1 for normalized vector
-    b = 2 * np.dot(f, d)
-    c = np.dot(f, f) - radius * radius
+def segments_array(lines) -> np.ndarray:
+    """
+    Stack lines into an (N, 2, 3) array of (start, end) points.
 
-    # Calculate discriminant
-    discriminant = b * b - 4 * a * c
+    Args:
+        lines: An (N, 2, 3) or (2, 3) array-like, a Line-like object (anything
+               with get_start() and get_end()), or an iterable of them
 
-    # No intersection if discriminant is negative
-    if discriminant < -1e-10:
-        return VGroup()
+    Returns:
+        Float array of shape (N, 2, 3)
+
+    Example:
+        >>> segments_array([Line(LEFT, RIGHT), Line(DOWN, UP)]).shape  # (2, 2, 3)
+    """
+    if isinstance(lines, np.ndarray):
+        return lines.astype(float, copy=False).reshape(-1, 2, 3)
+    if hasattr(lines, "get_start"):
+        lines = [lines]
+    lines = list(lines)
+    if lines and hasattr(lines[0], "get_start"):
+        return np.array([[line.get_start(), line.get_end()] for line in lines], dtype=float).reshape(-1, 2, 3)
+    return np.asarray(lines, dtype=float).reshape(-1, 2, 3)
+
+
+def line_intersections(segments1, segments2, bounded=False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intersect pairs of lines, all at once.
+
+    Pair k intersects segments1[k] with segments2[k]; either side may also be
+    a single (2, 3) segment, which is broadcast. Only x and y are used for
+    the solve; the result lies on the first line.
+
+    Args:
+        segments1: (N, 2, 3) array of (start, end) points, or a list of Lines
+        segments2: (N, 2, 3) array, or a list of Lines
+        bounded: If True, only count hits within both segments (endpoints
+                 included); if False, the lines are extended infinitely like ill()
+
+    Returns:
+        Tuple of (points (N, 3), valid (N,) bool). Points of invalid pairs
+        (parallel, coincident, or outside the segments) are NaN
+
+    Example:
+        >>> points, valid = line_intersections(grid_lines, diagonals)
+        >>> hits = points[valid]
+    """
+    a, b = np.broadcast_arrays(segments_array(segments1), segments_array(segments2))
+    p1, d1 = a[:, 0], a[:, 1] - a[:, 0]
+    p3, d2 = b[:, 0], b[:, 1] - b[:, 0]
+    offset = p3 - p1
+
+    # 2D cross products (z-components)
+    cross = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    valid = np.abs(cross) >= _PARALLEL_TOL
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (offset[:, 0] * d2[:, 1] - offset[:, 1] * d2[:, 0]) / cross
+        if bounded:
+            u = (offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]) / cross
+            valid &= (t >= -_BOUNDS_TOL) & (t <= 1 + _BOUNDS_TOL) & (u >= -_BOUNDS_TOL) & (u <= 1 + _BOUNDS_TOL)
+        points = p1 + t[:, None] * d1
+
+    points[~valid] = np.nan
+    return points, valid
+
+
+def line_circle_intersections(segments, centers, radii, bounded=False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Intersect lines with circles, all at once.
+
+    Pair k intersects segments[k] with the circle (centers[k], radii[k]).
+    Single segments, centers or radii are broadcast against the others.
+
+    Args:
+        segments: (N, 2, 3) array of (start, end) points, or a list of Lines
+        centers: (N, 3) array of circle centers, or a single center
+        radii: (N,) array of radii, or a single radius
+        bounded: If True, only count hits within the segments (default False:
+                 lines are infinite like ilc())
+
+    Returns:
+        Tuple of (points (N, 2, 3), valid (N, 2) bool). For each pair the
+        points are ordered along the line direction; a tangent has only its
+        first point valid. Invalid points are NaN
 
-    # Tangent case (one intersection point)
-    if abs(discriminant) < 1e-10:
-        t = -b / (2 * a)
-        intersection_point = p1 + t * d
-        return VGroup(Dot(intersection_point))
+    Example:
+        >>> points, valid = line_circle_intersections(rays, ORIGIN, 2.0)
+        >>> hits = points[valid]  # (M, 3)
+    """
+    segments = segments_array(segments)
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    radii = np.asarray(radii, dtype=float).reshape(-1)
+    count = np.broadcast_shapes((len(segments),), (len(centers),), (len(radii),))[0]
+    segments = np.broadcast_to(segments, (count, 2, 3))
+    centers = np.broadcast_to(centers, (count, 3))
+    radii = np.broadcast_to(radii, (count,))
+
+    p1 = segments[:, 0]
+    direction = segments[:, 1] - p1
+    length = np.linalg.norm(direction, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d = direction / length[:, None]
 
-    # Two intersection points
-    sqrt_discriminant = np.sqrt(discriminant)
-    t1 = (-b - sqrt_discriminant) / (2 * a)
-    t2 = (-b + sqrt_discriminant) / (2 * a)
+    # |p1 + t*d - center|² = r² with |d| = 1: t² + b t + c = 0
+    f = p1 - centers
+    b = 2 * np.einsum("ij,ij->i", f, d)
+    c = np.einsum("ij,ij->i", f, f) - radii * radii
+    discriminant = b * b - 4 * c
 
-    point1 = p1 + t1 * d
-    point2 = p1 + t2 * d
+    tangent = np.abs(discriminant) < _PARALLEL_TOL
+    root = np.where(tangent, 0.0, np.sqrt(np.clip(discriminant, 0, None)))
+    t = np.column_stack([(-b - root) / 2, (-b + root) / 2])
 
-    return VGroup(Dot(point1), Dot(point2))
+    valid = np.column_stack([discriminant >= -_PARALLEL_TOL, discriminant >= _PARALLEL_TOL]) & (length > 0)[:, None]
+    if bounded:
+        valid &= (t >= -_BOUNDS_TOL * length[:, None]) & (t <= (1 + _BOUNDS_TOL) * length[:, None])
+
+    points = p1[:, None, :] + t[:, :, None] * d[:, None, :]
+    points[~valid] = np.nan
+    return points, valid
+
+
+def intersection_points(points, valid) -> np.ndarray:
+    """
+    Keep only the valid points from a kernel result, as raw coordinates.
+
+    Args:
+        points: Points from line_intersections() or line_circle_intersections()
+        valid: The matching validity mask
+
+    Returns:
+        Array of shape (M, 3)
+    """
+    return np.asarray(points)[np.asarray(valid)].reshape(-1, 3)
+
+
+def intersection_cloud(points, valid=None, color=WHITE, point_size=8) -> PMobject:
+    """
+    Put intersection points into a single point-cloud mobject instead of one Dot each.
+
+    Args:
+        points: (M, 3) array, or kernel points together with valid
+        valid: Optional validity mask from a kernel
+        color: Point color (default WHITE)
+        point_size: Rendered size of each point in pixels (default 8)
+
+    Returns:
+        PMobject holding all points
+
+    Example:
+        >>> cloud = intersection_cloud(*line_intersections(grid_lines, diagonals), color=YELLOW)
+        >>> self.add(cloud)
+    """
+    points = np.asarray(points, dtype=float)
+    points = intersection_points(points, valid) if valid is not None else points.reshape(-1, 3)
+    cloud = PMobject(stroke_width=point_size)
+    if len(points):
+        cloud.add_points(points, color=color)
+    return cloud
+
+
+# ============================================================================
+# All-pairs segment intersection
+# ============================================================================
+
+def _grid_candidate_pairs(lo, hi, cell_size) -> np.ndarray:
+    """
+    Find segment pairs sharing a uniform-grid cell (the broad phase).
+
+    Every segment is entered into each cell its bounding box covers, the
+    entries are sorted by cell, and all pairs within a cell are generated.
+    Falls back to every pair when the grid would not prune anything.
+
+    Args:
+        lo: (N, 2) lower-left bounding-box corners
+        hi: (N, 2) upper-right bounding-box corners
+        cell_size: Grid cell size, or None to pick one from the segment sizes
+
+    Returns:
+        (P, 2) int array of unique pairs (i, j) with i < j
+    """
+    count = len(lo)
+    all_pairs = count * (count - 1) // 2
+    if cell_size is None:
+        extent = float((hi.max(axis=0) - lo.min(axis=0)).max())
+        cell_size = max(float(np.median((hi - lo).max(axis=1))), extent / max(np.sqrt(count), 1.0))
+    if all_pairs <= 64 or cell_size <= 0:
+        return np.column_stack(np.triu_indices(count, 1))
+
+    first = np.floor(lo / cell_size).astype(np.int64)
+    last = np.floor(hi / cell_size).astype(np.int64)
+    spans = last - first + 1
+    cells = spans[:, 0] * spans[:, 1]
+    total = int(cells.sum())
+    if total >= all_pairs:
+        return np.column_stack(np.triu_indices(count, 1))
+
+    # One entry per (segment, covered cell)
+    segment = np.repeat(np.arange(count), cells)
+    offset = np.arange(total) - np.repeat(np.cumsum(cells) - cells, cells)
+    ix = first[segment, 0] + offset // spans[segment, 1]
+    iy = first[segment, 1] + offset % spans[segment, 1]
+    order = np.lexsort((segment, iy, ix))
+    segment, ix, iy = segment[order], ix[order], iy[order]
+
+    # Pair every entry with the entries after it in the same cell
+    new_cell = np.r_[True, (ix[1:] != ix[:-1]) | (iy[1:] != iy[:-1])]
+    group_end = np.minimum.accumulate(np.where(np.r_[new_cell[1:], True], np.arange(total) + 1, total)[::-1])[::-1]
+    after = group_end - np.arange(total) - 1
+    pair_count = int(after.sum())
+    if pair_count == 0:
+        return np.zeros((0, 2), dtype=np.int64)
+    left = np.repeat(np.arange(total), after)
+    right = left + 1 + np.arange(pair_count) - np.repeat(np.cumsum(after) - after, after)
+    a, b = segment[left], segment[right]
+    keys = np.unique(np.minimum(a, b) * count + np.maximum(a, b))
+    return np.column_stack([keys // count, keys % count])
+
+
+def segment_intersections(lines, cell_size=None, overlaps=False):
+    """
+    Find every intersection among a collection of segments.
+
+    A uniform-grid broad phase pairs up only segments sharing a grid cell,
+    their bounding boxes are compared, and the survivors are intersected in
+    one vectorized pass. Touching counts as intersecting: endpoints on
+    another segment (T-junctions, shared polygon vertices) are reported, and
+    collinear segments that overlap report one hit, at the midpoint of the
+    shared piece (a single point when they only meet end to end).
+    Zero-length segments never intersect anything. Only x and y are used.
+
+    Args:
+        lines: List of Lines, or an (N, 2, 3) array of (start, end) points
+        cell_size: Grid cell size (default: chosen from the segment lengths)
+        overlaps: Also return the shared piece of each pair (default False)
+
+    Returns:
+        Tuple of (points (M, 3), pairs (M, 2)) where pairs[k] = (i, j), i < j,
+        are the indices of the segments meeting at points[k], sorted by pair.
+        With overlaps=True a third (M, 2, 3) array holds the (start, end) of
+        the shared piece, with start == end for point intersections
+
+    Example:
+        >>> points, pairs = segment_intersections(bisectors)
+        >>> self.add(intersection_cloud(points))
+    """
+    segments = segments_array(lines)
+    empty = (np.zeros((0, 3)), np.zeros((0, 2), dtype=np.int64))
+    if overlaps:
+        empty += (np.zeros((0, 2, 3)),)
+    if len(segments) < 2:
+        return empty
+
+    xy = segments[:, :, :2]
+    lo, hi = xy.min(axis=1), xy.max(axis=1)
+    pairs = _grid_candidate_pairs(lo, hi, cell_size)
+
+    # Bounding-box rejection, with slack so touching boxes survive
+    slack = _BOUNDS_TOL * max(float(np.abs(xy).max()), 1.0)
+    i, j = pairs[:, 0], pairs[:, 1]
+    keep = np.all((lo[i] <= hi[j] + slack) & (lo[j] <= hi[i] + slack), axis=1)
+    i, j = i[keep], j[keep]
+
+    p1, d1 = segments[i, 0], segments[i, 1] - segments[i, 0]
+    p3, d2 = segments[j, 0], segments[j, 1] - segments[j, 0]
+    offset = p3 - p1
+    len1 = np.hypot(d1[:, 0], d1[:, 1])
+    len2 = np.hypot(d2[:, 0], d2[:, 1])
+    cross = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    offset_cross = offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]
+    nondegenerate = (len1 > 0) & (len2 > 0)
+    parallel = np.abs(cross) <= _PARALLEL_TOL * len1 * len2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Crossing segments: solve for the parameters on both
+        t = (offset[:, 0] * d2[:, 1] - offset[:, 1] * d2[:, 0]) / cross
+        u = offset_cross / cross
+        crossing = (nondegenerate & ~parallel & (t >= -_BOUNDS_TOL) & (t <= 1 + _BOUNDS_TOL)
+                    & (u >= -_BOUNDS_TOL) & (u <= 1 + _BOUNDS_TOL))
+        t = np.clip(t, 0.0, 1.0)
+
+        # Collinear segments: overlap of the second one's projection onto the first
+        collinear = nondegenerate & parallel & (np.abs(offset_cross) <= _BOUNDS_TOL * (len1 + len2) * len1)
+        dot = np.einsum("ij,ij->i", d1[:, :2], d1[:, :2])
+        s0 = np.einsum("ij,ij->i", offset[:, :2], d1[:, :2]) / dot
+        s1 = s0 + np.einsum("ij,ij->i", d2[:, :2], d1[:, :2]) / dot
+        start = np.maximum(np.minimum(s0, s1), 0.0)
+        end = np.minimum(np.maximum(s0, s1), 1.0)
+        collinear &= start <= end + _BOUNDS_TOL * (1 + len2 / np.where(len1 > 0, len1, 1))
+        end = np.maximum(start, end)
+
+    hit = crossing | collinear
+    start = np.where(collinear, start, t)[hit]
+    end = np.where(collinear, end, t)[hit]
+    p1, d1 = p1[hit], d1[hit]
+    pieces = np.stack([p1 + start[:, None] * d1, p1 + end[:, None] * d1], axis=1)
+    result = (pieces.mean(axis=1), np.column_stack([i[hit], j[hit]]))
+    if overlaps:
+        result += (pieces,)
+    return result
+
+
+# ============================================================================
+# Bézier curve intersection
+# ============================================================================
+
+# Pair count at which subdivision stops (tangent or overlapping stretches)
+_MAX_CURVE_PAIRS = 200_000
+
+
+def bezier_array(curve) -> np.ndarray:
+    """
+    Get the cubic Bézier control points of a curve as an (N, 4, 3) array.
+
+    Args:
+        curve: A VMobject (plot, arc, polygon, ...) or an array of control
+               points of shape (4N, 3) or (N, 4, 3)
+
+    Returns:
+        Float array of shape (N, 4, 3), one row per cubic
+
+    Example:
+        >>> bezier_array(Square()).shape  # (4, 4, 3)
+    """
+    if not isinstance(curve, np.ndarray):
+        curve = curve.get_points() if hasattr(curve, "get_points") else curve.points
+    return np.asarray(curve, dtype=float).reshape(-1, 4, 3)
+
+
+def _split_cubics(cubics) -> Tuple[np.ndarray, np.ndarray]:
+    """Split (M, 4, D) cubics at t = 0.5 with de Casteljau, returning both halves."""
+    p0, p1, p2, p3 = cubics[:, 0], cubics[:, 1], cubics[:, 2], cubics[:, 3]
+    a, b, c = (p0 + p1) / 2, (p1 + p2) / 2, (p2 + p3) / 2
+    d, e = (a + b) / 2, (b + c) / 2
+    mid = (d + e) / 2
+    return np.stack([p0, a, d, mid], axis=1), np.stack([mid, e, c, p3], axis=1)
+
+
+def _flatness(cubics) -> np.ndarray:
+    """Largest distance of the inner control points from the chord of each (M, 4, 2) cubic."""
+    chord = cubics[:, 3] - cubics[:, 0]
+    length = np.hypot(chord[:, 0], chord[:, 1])
+    inner = cubics[:, 1:3] - cubics[:, :1]
+    along = np.where(length > 0, 1.0, 0.0)[:, None] * chord / np.where(length > 0, length, 1.0)[:, None]
+    off_chord = inner[..., 0] * along[:, None, 1] - inner[..., 1] * along[:, None, 0]
+    # Degenerate chords: fall back to the distance from the start point
+    spread = np.hypot(inner[..., 0], inner[..., 1])
+    return np.where(length[:, None] > 0, np.abs(off_chord), spread).max(axis=1)
+
+
+def _boxes_overlap(a, b, slack) -> np.ndarray:
+    """Row-wise bounding-box overlap test for two (M, 4, 2) control point arrays."""
+    return np.all((a.min(axis=1) <= b.max(axis=1) + slack) & (b.min(axis=1) <= a.max(axis=1) + slack), axis=1)
+
+
+def _evaluate(cubics, t) -> Tuple[np.ndarray, np.ndarray]:
+    """Point and derivative of each (M, 4, D) cubic at its own parameter t (M,)."""
+    s = 1 - t
+    weights = np.column_stack([s ** 3, 3 * s * s * t, 3 * s * t * t, t ** 3])
+    slopes = np.column_stack([-3 * s * s, 3 * s * s - 6 * s * t, 6 * s * t - 3 * t * t, 3 * t * t])
+    return np.einsum("mk,mkd->md", weights, cubics), np.einsum("mk,mkd->md", slopes, cubics)
+
+
+def bezier_intersections(curve1, curve2, tol=1e-7, parameters=False):
+    """
+    Find all intersections between two piecewise cubic Bézier curves.
+
+    Cubic pairs whose control-point boxes overlap are subdivided with de
+    Casteljau until both pieces are flat, the chords of the flat pieces give
+    starting guesses, and Newton's method refines each guess on the original
+    cubics. Straight pieces (polygon edges) are flat from the start, so they
+    go straight to the chord step. Only x and y are used for the solve.
+    Collinear overlapping stretches have no isolated intersection and are
+    not reported.
+
+    Args:
+        curve1: VMobject or control points (see bezier_array())
+        curve2: VMobject or control points
+        tol: Distance below which two curve points count as the same (default 1e-7)
+        parameters: Also return where on each curve the hits are (default False)
+
+    Returns:
+        (M, 3) array of intersection points on curve1, ordered along curve1.
+        With parameters=True, a tuple of (points, params) where params[k] =
+        (i + t, j + u): cubic index plus local Bézier parameter on each curve
+
+    Example:
+        >>> points = bezier_intersections(plot, circle)
+        >>> points, params = bezier_intersections(arc, polygon, parameters=True)
+    """
+    cubics1, cubics2 = bezier_array(curve1), bezier_array(curve2)
+    empty = (np.zeros((0, 3)), np.zeros((0, 2))) if parameters else np.zeros((0, 3))
+    if len(cubics1) == 0 or len(cubics2) == 0:
+        return empty
+
+    xy1, xy2 = cubics1[..., :2], cubics2[..., :2]
+    scale = max(float(np.ptp(xy1.reshape(-1, 2), axis=0).max()), float(np.ptp(xy2.reshape(-1, 2), axis=0).max()), 1e-12)
+    flat = max(1e-4 * scale, tol)
+
+    # Broad phase: every cubic of curve1 against every cubic of curve2, by bounding box
+    lo1, hi1 = xy1.min(axis=1), xy1.max(axis=1)
+    lo2, hi2 = xy2.min(axis=1), xy2.max(axis=1)
+    overlap = np.all((lo1[:, None] <= hi2[None] + tol) & (lo2[None] <= hi1[:, None] + tol), axis=2)
+    index1, index2 = np.nonzero(overlap)
+
+    a, b = xy1[index1], xy2[index2]
+    range_a = np.tile([0.0, 1.0], (len(a), 1))
+    range_b = range_a.copy()
+    done = []
+    while len(a):
+        flat_a, flat_b = _flatness(a) <= flat, _flatness(b) <= flat
+        finished = flat_a & flat_b
+        if len(a) > _MAX_CURVE_PAIRS:
+            finished[:] = True
+        done.append((a[finished], b[finished], range_a[finished], range_b[finished], index1[finished], index2[finished]))
+        keep = ~finished
+        a, b, range_a, range_b = a[keep], b[keep], range_a[keep], range_b[keep]
+        index1, index2, flat_a = index1[keep], index2[keep], flat_a[keep]
+
+        # Split the curved side of each pair (the larger one when both are curved)
+        size_a = np.ptp(a, axis=1).max(axis=1)
+        size_b = np.ptp(b, axis=1).max(axis=1)
+        split_a = ~flat_a & (_flatness(b) <= flat) | ~flat_a & (size_a >= size_b)
+        pick = split_a[:, None, None]
+        first, second = _split_cubics(np.where(pick, a, b))
+        mid_a = range_a.mean(axis=1)
+        mid_b = range_b.mean(axis=1)
+        new_a = np.concatenate([np.where(pick, first, a), np.where(pick, second, a)])
+        new_b = np.concatenate([np.where(pick, b, first), np.where(pick, b, second)])
+        new_range_a = np.concatenate([np.where(split_a[:, None], np.column_stack([range_a[:, 0], mid_a]), range_a),
+                                      np.where(split_a[:, None], np.column_stack([mid_a, range_a[:, 1]]), range_a)])
+        new_range_b = np.concatenate([np.where(split_a[:, None], range_b, np.column_stack([range_b[:, 0], mid_b])),
+                                      np.where(split_a[:, None], range_b, np.column_stack([mid_b, range_b[:, 1]]))])
+        index1, index2 = np.tile(index1, 2), np.tile(index2, 2)
+        hit = _boxes_overlap(new_a, new_b, flat)
+        a, b, range_a, range_b = new_a[hit], new_b[hit], new_range_a[hit], new_range_b[hit]
+        index1, index2 = index1[hit], index2[hit]
+    if not done:
+        return empty
+
+    a, b, range_a, range_b, index1, index2 = (np.concatenate(parts) for parts in zip(*done))
+
+    # Starting guesses from the chords of the flat pieces (with a little slack at the ends)
+    chord_a = np.stack([a[:, 0], a[:, 3]], axis=1)
+    chord_b = np.stack([b[:, 0], b[:, 3]], axis=1)
+    d1, d2 = chord_a[:, 1] - chord_a[:, 0], chord_b[:, 1] - chord_b[:, 0]
+    offset = chord_b[:, 0] - chord_a[:, 0]
+    cross = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        s = (offset[:, 0] * d2[:, 1] - offset[:, 1] * d2[:, 0]) / cross
+        r = (offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]) / cross
+    length1, length2 = np.hypot(d1[:, 0], d1[:, 1]), np.hypot(d2[:, 0], d2[:, 1])
+    parallel = np.abs(cross) <= _PARALLEL_TOL * length1 * length2
+    collinear = parallel & (np.abs(offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]) <= tol * length1)
+    guess = ~parallel & (s >= -0.1) & (s <= 1.1) & (r >= -0.1) & (r <= 1.1)
+    # Parallel chords of a tangency: start from the middle of the pieces.
+    # Collinear chords are overlapping stretches; their ends are found from the neighbouring pieces
+    guess |= parallel & ~collinear
+    s = np.where(parallel, 0.5, np.clip(np.nan_to_num(s), 0, 1))[guess]
+    r = np.where(parallel, 0.5, np.clip(np.nan_to_num(r), 0, 1))[guess]
+    t = range_a[guess, 0] + s * (range_a[guess, 1] - range_a[guess, 0])
+    u = range_b[guess, 0] + r * (range_b[guess, 1] - range_b[guess, 0])
+    index1, index2 = index1[guess], index2[guess]
+
+    t, u = _newton_refine(xy1[index1], xy2[index2], t, u)
+    point1, _ = _evaluate(xy1[index1], t)
+    point2, _ = _evaluate(xy2[index2], u)
+    close = np.hypot(*(point1 - point2).T) <= tol
+    t, u, index1, index2 = t[close], u[close], index1[close], index2[close]
+
+    params = np.column_stack([index1 + t, index2 + u])
+    points, _ = _evaluate(cubics1[index1], t)
+    order = np.lexsort((params[:, 1], params[:, 0]))
+    points, params = _merge_close(points[order], params[order], tol)
+    return (points, params) if parameters else points
+
+
+def _newton_refine(a, b, t, u, iterations=8) -> Tuple[np.ndarray, np.ndarray]:
+    """Solve A(t) = B(u) for each (M, 4, 2) cubic pair with Newton's method, clamped to [0, 1]."""
+    for _ in range(iterations):
+        pa, da = _evaluate(a, t)
+        pb, db = _evaluate(b, u)
+        residual = pa - pb
+        # Jacobian [da, -db]; solve J (dt, du) = -residual by Cramer's rule
+        det = -da[:, 0] * db[:, 1] + da[:, 1] * db[:, 0]
+        ok = np.abs(det) > 1e-300
+        det = np.where(ok, det, 1.0)
+        dt = (residual[:, 0] * db[:, 1] - residual[:, 1] * db[:, 0]) / det
+        du = (residual[:, 0] * da[:, 1] - residual[:, 1] * da[:, 0]) / det
+        t = np.clip(t + np.where(ok, dt, 0.0), 0.0, 1.0)
+        u = np.clip(u + np.where(ok, du, 0.0), 0.0, 1.0)
+        # Converged (warm starts usually get here after two or three steps)
+        if np.abs(dt).max(initial=0.0) < 1e-13 and np.abs(du).max(initial=0.0) < 1e-13:
+            break
+    return t, u
+
+
+def _merge_close(points, params, tol) -> Tuple[np.ndarray, np.ndarray]:
+    """Drop points within tol of an earlier one (roots found from neighbouring pieces)."""
+    if len(points) < 2:
+        return points, params
+    keep = np.ones(len(points), dtype=bool)
+    for start in range(0, len(points), 1024):
+        block = points[start:start + 1024]
+        distance = np.linalg.norm(block[:, None, :2] - points[None, :, :2], axis=2)
+        earlier = np.arange(len(points))[None, :] < np.arange(start, start + len(block))[:, None]
+        keep[start:start + len(block)] = ~np.any((distance <= tol) & earlier & keep[None, :], axis=1)
+    return points[keep], params[keep]
+
+
+def intersect_curves(curve1, curve2, tol=1e-7) -> VGroup:
+    """
+    Find the intersection points of two VMobjects from their Bézier control points.
+
+    Works for any pair of curves (plots, arcs, polygons, stretched or partial
+    circles), since it never relies on shape parameters like width / 2.
+
+    Args:
+        curve1: The first VMobject
+        curve2: The second VMobject
+        tol: Distance below which two curve points count as the same (default 1e-7)
+
+    Returns:
+        VGroup with one Dot per intersection, ordered along curve1
+
+    Example:
+        >>> from manim import *
+        >>> from robo_manim_add_ons import intersect_curves
+        >>>
+        >>> ellipse = Circle(radius=1).stretch(2, 0)
+        >>> square = Square(side_length=3)
+        >>> dots = intersect_curves(ellipse, square)
+        >>> # Returns VGroup with 4 Dots
+    """
+    return VGroup(*[Dot(point) for point in bezier_intersections(curve1, curve2, tol)])
+
+
+# ============================================================================
+# Type-dispatched intersection
+# ============================================================================
+
+class InfiniteLine:
+    """
+    A line through two points, extended infinitely in both directions.
+
+    Manim Lines are treated as segments by intersect(); wrap one in
+    InfiniteLine (or Ray) to intersect its extension instead. A wrapped
+    Line is kept by reference and its endpoints are read on every call, so
+    the extension follows the Line when it moves.
+
+    Example:
+        >>> intersect(InfiniteLine(line), circle)
+        >>> intersect(InfiniteLine(LEFT, RIGHT), plot)
+    """
+
+    def __init__(self, start, end=None):
+        """
+        Initialize from a Line-like object or from two points.
+
+        Args:
+            start: A Line-like object (with get_start() and get_end()), or the first point
+            end: The second point (only when start is a point)
+        """
+        if end is None:
+            self.source = start
+        else:
+            self.source = None
+            self._start = np.asarray(start, dtype=float)
+            self._end = np.asarray(end, dtype=float)
+
+    @property
+    def start(self) -> np.ndarray:
+        if self.source is not None:
+            return np.asarray(self.source.get_start(), dtype=float)
+        return self._start
+
+    @property
+    def end(self) -> np.ndarray:
+        if self.source is not None:
+            return np.asarray(self.source.get_end(), dtype=float)
+        return self._end
+
+    def get_start(self) -> np.ndarray:
+        return self.start
+
+    def get_end(self) -> np.ndarray:
+        return self.end
+
+
+class Ray(InfiniteLine):
+    """
+    A half-line starting at start and passing through end.
+
+    Example:
+        >>> intersect(Ray(ORIGIN, RIGHT), polygon)
+    """
+
+
+# Geometric kind of each type; subclasses inherit their closest registered base
+_GEOMETRY_KINDS = {
+    np.ndarray: "polyline",
+    InfiniteLine: "line",
+    Ray: "ray",
+    Line: "segment",
+    Arc: "arc",
+    Circle: "circle",
+    Ellipse: "ellipse",
+    Polygram: "polygon",
+    SampledPlot: "plot",
+    ParametricFunction: "plot",
+    VMobject: "curve",
+}
+
+# type -> kind, filled on first use of each type
+_kind_cache = {}
+
+# (kind, kind) -> handler(a, b) returning an (M, 3) array of points
+_INTERSECTION_HANDLERS = {}
+
+# Parameter range of each straight kind along start -> end
+_LINEAR_BOUNDS = {"line": (-np.inf, np.inf), "ray": (0.0, np.inf), "segment": (0.0, 1.0)}
+_SEGMENT_KINDS = ("polygon", "polyline", "plot")
+_CONIC_KINDS = ("circle", "arc", "ellipse")
+
+# Relative radial error up to which a curve is treated as an exact circle
+_CIRCLE_FIT_TOL = 1e-3
+
+# Conic fits keyed by the curve's control points, so unchanged curves skip the fit
+_conic_cache = LRUCache(maxsize=256)
+
+
+def geometry_kind(obj) -> str:
+    """
+    Get the geometric kind intersect() dispatches on.
+
+    The kind is looked up along the type's MRO in the registered kinds, and
+    cached per type, so repeated calls are a single dict lookup.
+
+    Args:
+        obj: Any object
+
+    Returns:
+        "line", "ray", "segment", "circle", "arc", "ellipse", "polygon",
+        "polyline", "plot", "curve", or a kind added with register_geometry_kind()
+
+    Raises:
+        TypeError: If no base type of obj has a registered kind
+
+    Example:
+        >>> geometry_kind(Square())         # "polygon"
+        >>> geometry_kind(Ray(ORIGIN, UP))  # "ray"
+    """
+    cls = type(obj)
+    kind = _kind_cache.get(cls)
+    if kind is None:
+        for base in cls.__mro__:
+            if base in _GEOMETRY_KINDS:
+                kind = _GEOMETRY_KINDS[base]
+                break
+        else:
+            raise TypeError(f"Cannot intersect objects of type {cls.__name__}; register it with register_geometry_kind()")
+        _kind_cache[cls] = kind
+    return kind
+
+
+def register_geometry_kind(cls: type, kind: str):
+    """
+    Declare the geometric kind of a type (and its subclasses).
+
+    Args:
+        cls: The type to register
+        kind: A built-in kind (to reuse its kernels) or a new one (give it
+              handlers with register_intersection())
+
+    Example:
+        >>> register_geometry_kind(MyRoundedShape, "curve")
+    """
+    _GEOMETRY_KINDS[cls] = kind
+    _kind_cache.clear()
+
+
+def register_intersection(kind1: str, kind2: str, handler: Callable):
+    """
+    Register the kernel for a pair of geometric kinds.
+
+    The handler also serves the reversed pair (called with its arguments
+    swapped) unless that pair has its own handler.
+
+    Args:
+        kind1: Kind of the handler's first argument
+        kind2: Kind of the handler's second argument
+        handler: Callable (a, b) -> array of shape (M, 3) with the intersection points
+
+    Example:
+        >>> register_intersection("segment", "parabola", segment_parabola_points)
+    """
+    _INTERSECTION_HANDLERS[(kind1, kind2)] = handler
+
+
+def intersection_handler(a, b) -> Tuple[Callable, bool]:
+    """
+    Resolve the kernel intersect() would use for two objects.
+
+    Useful for timing dispatch on its own, or for calling a kernel directly
+    in a hot loop.
+
+    Args:
+        a: The first object
+        b: The second object
+
+    Returns:
+        Tuple of (handler, swapped): call handler(b, a) when swapped is True,
+        otherwise handler(a, b). Pairs without a registered handler get the
+        generic Bézier fallback
+
+    Example:
+        >>> handler, swapped = intersection_handler(line, circle)
+    """
+    key = (geometry_kind(a), geometry_kind(b))
+    handler = _INTERSECTION_HANDLERS.get(key)
+    if handler is not None:
+        return handler, False
+    handler = _INTERSECTION_HANDLERS.get((key[1], key[0]))
+    if handler is not None:
+        return handler, True
+    return _bezier_fallback, False
+
+
+def intersect(a, b) -> np.ndarray:
+    """
+    Intersect any two supported objects with the best kernel for their kinds.
+
+    Straight kinds (InfiniteLine, Ray, Line as a segment), polygonal kinds
+    (polygons, (N, 3) point arrays as polylines, sampled plots) and round
+    kinds (circles, arcs, ellipses, fitted from their Bézier points so
+    stretched or partial circles are handled) get closed-form vectorized
+    kernels; every other pair falls back to bezier_intersections().
+
+    Args:
+        a: The first object
+        b: The second object
+
+    Returns:
+        Array of shape (M, 3) with the intersection points
+
+    Example:
+        >>> points = intersect(Ray(ORIGIN, UR), Circle(radius=2))
+        >>> dots = VGroup(*[Dot(p) for p in intersect(square, plot)])
+    """
+    handler, swapped = intersection_handler(a, b)
+    return handler(b, a) if swapped else handler(a, b)
+
+
+def _line_parameters(p1, d1, p2, d2) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Parameters (t, u) of p1 + t*d1 = p2 + u*d2 for rows of 2D lines, and the non-parallel mask."""
+    offset = p2 - p1
+    cross = d1[..., 0] * d2[..., 1] - d1[..., 1] * d2[..., 0]
+    valid = np.abs(cross) > _PARALLEL_TOL * np.hypot(d1[..., 0], d1[..., 1]) * np.hypot(d2[..., 0], d2[..., 1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (offset[..., 0] * d2[..., 1] - offset[..., 1] * d2[..., 0]) / cross
+        u = (offset[..., 0] * d1[..., 1] - offset[..., 1] * d1[..., 0]) / cross
+    return t, u, valid
+
+
+def _within(t, bounds) -> np.ndarray:
+    """Mask of parameters inside (lo, hi) with the usual endpoint slack."""
+    return (t >= bounds[0] - _BOUNDS_TOL) & (t <= bounds[1] + _BOUNDS_TOL)
+
+
+def _unique_points(points, tol=1e-9) -> np.ndarray:
+    """Drop points within tol of an earlier one (hits at shared vertices)."""
+    return _merge_close(points, np.zeros((len(points), 0)), tol)[0]
+
+
+def _linear_of(obj):
+    """(start, direction, bounds) of a straight kind."""
+    start = np.asarray(obj.get_start(), dtype=float)
+    return start, np.asarray(obj.get_end(), dtype=float) - start, _LINEAR_BOUNDS[geometry_kind(obj)]
+
+
+def _segments_of(obj) -> Optional[np.ndarray]:
+    """(N, 2, 3) edges of a polygonal kind, or None when its Bézier pieces are not straight."""
+    if isinstance(obj, np.ndarray):
+        points = obj.astype(float, copy=False).reshape(-1, 3)
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+    else:
+        cubics = bezier_array(obj)
+        if len(cubics) and _flatness(cubics[..., :2]).max() > 1e-9 * max(float(np.ptp(cubics[..., :2])), 1.0):
+            return None
+        segments = cubics[:, [0, 3]]
+    return segments[np.any(segments[:, 0] != segments[:, 1], axis=1)]
+
+
+def _conic_of(obj):
+    """
+    Fit the round kinds from their Bézier points.
+
+    Returns (matrix, circle, arc) where matrix is the symmetric 3x3 conic
+    [x y 1] M [x y 1]^T = 0, circle is (center, radius) for circular curves
+    (else None) and arc is (start angle, sweep) for partial circles (else
+    None); or None when the curve is neither a circle nor a closed ellipse.
+    """
+    cubics = bezier_array(obj)[..., :2]
+    key = cubics.tobytes()
+    conic = _conic_cache.get(key, False)
+    if conic is False:
+        conic = _fit_conic(cubics)
+        _conic_cache.put(key, conic)
+    return conic
+
+
+def _fit_conic(cubics):
+    """Fit a circle, or failing that a closed ellipse, to (N, 4, 2) control points (see _conic_of())."""
+    samples = np.vstack([cubics[:, 0], (cubics[:, 0] + 3 * cubics[:, 1] + 3 * cubics[:, 2] + cubics[:, 3]) / 8,
+                         cubics[-1:, 3]])
+    xs, ys = samples[:, 0], samples[:, 1]
+
+    # Algebraic circle fit: x² + y² + D x + E y + F = 0
+    (d, e, f), *_ = np.linalg.lstsq(np.column_stack([xs, ys, np.ones_like(xs)]), -(xs * xs + ys * ys), rcond=None)
+    center = np.array([-d / 2, -e / 2])
+    radius = np.sqrt(max(center @ center - f, 0.0))
+    if radius > 0 and np.abs(np.hypot(xs - center[0], ys - center[1]) - radius).max() <= _CIRCLE_FIT_TOL * radius:
+        matrix = np.array([[1.0, 0.0, d / 2], [0.0, 1.0, e / 2], [d / 2, e / 2, f]])
+        anchors = np.vstack([cubics[:, 0], cubics[-1:, 3]]) - center
+        angles = np.arctan2(anchors[:, 1], anchors[:, 0])
+        sweep = float(np.sum((np.diff(angles) + np.pi) % (2 * np.pi) - np.pi))
+        arc = None if abs(sweep) >= 2 * np.pi - 1e-6 else (float(angles[0]), sweep)
+        return matrix, (center, radius), arc
+
+    # General conic through the samples, only for closed curves (full ellipses)
+    if np.linalg.norm(cubics[0, 0] - cubics[-1, 3]) > 1e-9 * max(float(np.ptp(cubics)), 1.0) or len(samples) < 6:
+        return None
+    scale = max(float(np.ptp(samples)), 1e-12)
+    shift = samples.mean(axis=0)
+    x, y = ((samples - shift) / scale).T
+    design = np.column_stack([x * x, x * y, y * y, x, y, np.ones_like(x)])
+    _, _, vt = np.linalg.svd(design)
+    a, b, c, d, e, f = vt[-1]
+    if b * b - 4 * a * c >= 0 or np.abs(design @ vt[-1]).max() > _CIRCLE_FIT_TOL:
+        return None
+    local = np.array([[a, b / 2, d / 2], [b / 2, c, e / 2], [d / 2, e / 2, f]])
+    # Undo the normalization: [x y 1]_local = T [x y 1]
+    to_local = np.array([[1 / scale, 0, -shift[0] / scale], [0, 1 / scale, -shift[1] / scale], [0, 0, 1]])
+    return to_local.T @ local @ to_local, None, None
+
+
+def _on_arc(points, circle, arc) -> np.ndarray:
+    """Mask of points (on the circle) that lie on the drawn part of an arc."""
+    if arc is None:
+        return np.ones(len(points), dtype=bool)
+    start, sweep = arc
+    angles = np.arctan2(points[:, 1] - circle[0][1], points[:, 0] - circle[0][0])
+    relative = ((angles - start) * np.sign(sweep)) % (2 * np.pi)
+    slack = 1e-9
+    return (relative <= abs(sweep) + slack) | (relative >= 2 * np.pi - slack)
+
+
+def _line_conic_points(starts, directions, bounds, conic) -> np.ndarray:
+    """Points where lines start + t * direction (t within bounds) meet a fitted conic."""
+    matrix, circle, arc = conic
+    starts = np.atleast_2d(starts)
+    directions = np.atleast_2d(directions)
+    ph = np.column_stack([starts[:, :2], np.ones(len(starts))])
+    dh = np.column_stack([directions[:, :2], np.zeros(len(directions))])
+    qa = np.einsum("ni,ij,nj->n", dh, matrix, dh)
+    qb = 2 * np.einsum("ni,ij,nj->n", ph, matrix, dh)
+    qc = np.einsum("ni,ij,nj->n", ph, matrix, ph)
+    discriminant = qb * qb - 4 * qa * qc
+    # Tangent when the discriminant is zero relative to its terms
+    tangent = np.abs(discriminant) <= 1e-12 * (qb * qb + np.abs(4 * qa * qc))
+    root = np.sqrt(np.where(tangent, 0.0, np.clip(discriminant, 0, None)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.column_stack([(-qb - root) / (2 * qa), (-qb + root) / (2 * qa)])
+    valid = np.column_stack([discriminant >= 0, (discriminant >= 0) & ~tangent]) | tangent[:, None] & [True, False]
+    valid &= _within(t, bounds) & (qa != 0)[:, None]
+    points = starts[:, None, :] + t[:, :, None] * directions[:, None, :]
+    points = points[valid]
+    if circle is not None:
+        points = points[_on_arc(points, circle, arc)]
+    return points
+
+
+def _intersect_linear_linear(a, b) -> np.ndarray:
+    """Two straight kinds: one 2x2 solve, with end-to-end touching of collinear pieces."""
+    p1, d1, bounds1 = _linear_of(a)
+    p2, d2, bounds2 = _linear_of(b)
+    t, u, valid = _line_parameters(p1[:2], d1[:2], p2[:2], d2[:2])
+    if valid:
+        if _within(t, bounds1) and _within(u, bounds2):
+            return (p1 + t * d1)[None]
+        return np.zeros((0, 3))
+    # Parallel: collinear pieces meeting in a single point still intersect
+    length = float(d1[:2] @ d1[:2])
+    offset = p2[:2] - p1[:2]
+    if length == 0 or abs(offset[0] * d1[1] - offset[1] * d1[0]) > _BOUNDS_TOL * length:
+        return np.zeros((0, 3))
+    scale = float(d2[:2] @ d1[:2]) / length
+    ends = (offset @ d1[:2]) / length + scale * np.array(bounds2)
+    with np.errstate(invalid="ignore"):
+        lo, hi = max(bounds1[0], np.nanmin(ends)), min(bounds1[1], np.nanmax(ends))
+    if np.isfinite(lo) and np.isfinite(hi) and abs(hi - lo) <= _BOUNDS_TOL:
+        return (p1 + lo * d1)[None]
+    return np.zeros((0, 3))
+
+
+def _intersect_linear_segments(a, b) -> np.ndarray:
+    """A straight kind against every edge of a polygonal kind at once."""
+    segments = _segments_of(b)
+    if segments is None:
+        return _bezier_fallback(a, b)
+    p1, d1, bounds = _linear_of(a)
+    t, u, valid = _line_parameters(p1[:2], d1[:2], segments[:, 0, :2], segments[:, 1, :2] - segments[:, 0, :2])
+    valid &= _within(t, bounds) & _within(u, (0.0, 1.0))
+    return _unique_points(p1 + t[valid, None] * d1)
+
+
+def _intersect_linear_conic(a, b) -> np.ndarray:
+    """A straight kind against a circle, arc or ellipse: one quadratic."""
+    conic = _conic_of(b)
+    if conic is None:
+        return _bezier_fallback(a, b)
+    p1, d1, bounds = _linear_of(a)
+    return _line_conic_points(p1, d1, bounds, conic)
+
+
+def _intersect_segments_segments(a, b) -> np.ndarray:
+    """Every edge of one polygonal kind against every edge of the other."""
+    segments1, segments2 = _segments_of(a), _segments_of(b)
+    if segments1 is None or segments2 is None:
+        return _bezier_fallback(a, b)
+    i, j = np.meshgrid(np.arange(len(segments1)), np.arange(len(segments2)), indexing="ij")
+    points, valid = line_intersections(segments1[i.ravel()], segments2[j.ravel()], bounded=True)
+    return _unique_points(points[valid])
+
+
+def _intersect_segments_conic(a, b) -> np.ndarray:
+    """Every edge of a polygonal kind against a circle, arc or ellipse."""
+    segments, conic = _segments_of(a), _conic_of(b)
+    if segments is None or conic is None:
+        return _bezier_fallback(a, b)
+    points = _line_conic_points(segments[:, 0], segments[:, 1] - segments[:, 0], (0.0, 1.0), conic)
+    return _unique_points(points)
+
+
+def _intersect_conic_conic(a, b) -> np.ndarray:
+    """Two circles or arcs in closed form; other round pairs go through the Bézier fallback."""
+    conic1, conic2 = _conic_of(a), _conic_of(b)
+    if conic1 is None or conic2 is None or conic1[1] is None or conic2[1] is None:
+        return _bezier_fallback(a, b)
+    (c1, r1), (c2, r2) = conic1[1], conic2[1]
+    offset = c2 - c1
+    distance = float(np.hypot(*offset))
+    slack = _BOUNDS_TOL * max(r1, r2)
+    if distance <= slack or distance > r1 + r2 + slack or distance < abs(r1 - r2) - slack:
+        return np.zeros((0, 3))
+    along = (r1 * r1 - r2 * r2 + distance * distance) / (2 * distance)
+    half = np.sqrt(max(r1 * r1 - along * along, 0.0))
+    base = c1 + along * offset / distance
+    normal = np.array([-offset[1], offset[0]]) / distance
+    points = np.array([base - half * normal, base + half * normal])
+    if half <= slack:
+        points = points[:1]
+    points = points[_on_arc(points, *conic1[1:]) & _on_arc(points, *conic2[1:])]
+    return np.column_stack([points, np.zeros(len(points))])
+
+
+def _bezier_of(obj, box) -> np.ndarray:
+    """Cubic control points of any kind; infinite straight kinds are clipped to cover box."""
+    kind = geometry_kind(obj)
+    if kind in ("line", "ray"):
+        start, direction, bounds = _linear_of(obj)
+        reach = (np.abs(box - start[:2]).max() * 2 + 1) / max(np.hypot(*direction[:2]), 1e-300)
+        lo, hi = max(bounds[0], -reach), min(bounds[1], reach)
+        return segments_to_bezier_points([[start + lo * direction, start + hi * direction]])
+    if isinstance(obj, np.ndarray):
+        return segments_to_bezier_points(_segments_of(obj))
+    return bezier_array(obj)
+
+
+def _bezier_fallback(a, b) -> np.ndarray:
+    """Generic handler: intersect the Bézier control points of both objects."""
+    corners = [_bezier_of(obj, None)[..., :2].reshape(-1, 2) for obj in (a, b) if geometry_kind(obj) not in ("line", "ray")]
+    corners = np.vstack(corners) if corners else np.array([a.get_start(), b.get_start()], dtype=float)[:, :2]
+    box = np.array([corners.min(axis=0), corners.max(axis=0)])
+    return bezier_intersections(_bezier_of(a, box), _bezier_of(b, box))
+
+
+def _register_builtin_intersections():
+    """Fill the registry with the closed-form kernels for the built-in kinds."""
+    families = {
+        ("linear", "linear"): _intersect_linear_linear,
+        ("linear", "segments"): _intersect_linear_segments,
+        ("linear", "conic"): _intersect_linear_conic,
+        ("segments", "segments"): _intersect_segments_segments,
+        ("segments", "conic"): _intersect_segments_conic,
+        ("conic", "conic"): _intersect_conic_conic,
+    }
+    kinds = {"linear": tuple(_LINEAR_BOUNDS), "segments": _SEGMENT_KINDS, "conic": _CONIC_KINDS}
+    for (family1, family2), handler in families.items():
+        for kind1 in kinds[family1]:
+            for kind2 in kinds[family2]:
+                register_intersection(kind1, kind2, handler)
+
+
+_register_builtin_intersections()
+
+
+# ============================================================================
+# Live intersection markers
+# ============================================================================
+
+def _live_curve(obj, box):
+    """
+    Get the cubics of an object for warm-started solving.
+
+    Returns (cubics (N, 4, 3), span) where span is the (lo, hi) range of the
+    line parameter covered by the single cubic of a line or ray (None for
+    everything else), so roots can be stored in units that survive a change
+    of clipping box.
+    """
+    if geometry_kind(obj) in ("line", "ray"):
+        start, direction, bounds = _linear_of(obj)
+        reach = (np.abs(box - start[:2]).max() * 2 + 1) / max(np.hypot(*direction[:2]), 1e-300)
+        lo, hi = max(bounds[0], -reach), min(bounds[1], reach)
+        return bezier_array(segments_to_bezier_points([[start + lo * direction, start + hi * direction]])), (lo, hi)
+    return bezier_array(_bezier_of(obj, box)), None
+
+
+def _chords(cubics, depth=2) -> np.ndarray:
+    """Chords of each (M, 4, 2) cubic split depth times with de Casteljau, in curve order, shape (M * 2**depth, 2, 2)."""
+    for _ in range(depth):
+        first, second = _split_cubics(cubics)
+        cubics = np.stack([first, second], axis=1).reshape(-1, 4, cubics.shape[-1])
+    return cubics[:, [0, 3]]
+
+
+def _estimated_roots(cubics_a, cubics_b, tol) -> int:
+    """
+    Cheap estimate of how many times two piecewise cubics cross.
+
+    Both curves are flattened into short chords (each cubic split in four)
+    and the chord crossings are counted, pairing chords by bounding box.
+    Each chord owns its start but not its end, so a crossing at a shared
+    vertex is counted once. Crossings closer together than the chord sag
+    (a tangency just opening up) may be missed.
+    """
+    xy_a, xy_b = cubics_a[..., :2], cubics_b[..., :2]
+    if np.any(xy_a.min(axis=(0, 1)) > xy_b.max(axis=(0, 1)) + tol) or np.any(xy_b.min(axis=(0, 1)) > xy_a.max(axis=(0, 1)) + tol):
+        return 0
+    chords_a, chords_b = _chords(xy_a), _chords(xy_b)
+    lo_a, hi_a = chords_a.min(axis=1), chords_a.max(axis=1)
+    lo_b, hi_b = chords_b.min(axis=1), chords_b.max(axis=1)
+    index_a, index_b = np.nonzero(np.all((lo_a[:, None] <= hi_b[None] + tol) & (lo_b[None] <= hi_a[:, None] + tol), axis=2))
+    a, b = chords_a[index_a], chords_b[index_b]
+    d1, d2 = a[:, 1] - a[:, 0], b[:, 1] - b[:, 0]
+    offset = b[:, 0] - a[:, 0]
+    cross = d1[:, 0] * d2[:, 1] - d1[:, 1] * d2[:, 0]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = (offset[:, 0] * d2[:, 1] - offset[:, 1] * d2[:, 0]) / cross
+        r = (offset[:, 0] * d1[:, 1] - offset[:, 1] * d1[:, 0]) / cross
+    return int(np.count_nonzero((cross != 0) & (s >= 0) & (s < 1) & (r >= 0) & (r < 1)))
+
+
+def _to_local(params, count, span) -> Tuple[np.ndarray, np.ndarray]:
+    """Split stored root parameters into (cubic index, local t) for one curve."""
+    if span is not None:
+        return np.zeros(len(params), dtype=np.int64), (params - span[0]) / (span[1] - span[0])
+    index = np.clip(np.floor(params).astype(np.int64), 0, count - 1)
+    return index, params - index
+
+
+def _to_stored(index, t, span) -> np.ndarray:
+    """Inverse of _to_local()."""
+    if span is not None:
+        return span[0] + t * (span[1] - span[0])
+    return index + t
+
+
+class IntersectionMarkers(VGroup):
+    """
+    One Dot per intersection of two moving objects, kept across frames.
+
+    A single updater re-solves the intersections each frame. Roots are first
+    refined with Newton's method starting from the previous frame's curve
+    parameters; a full solve runs only every full_every frames, or when a
+    warm start fails (a root slid onto another Bézier piece, vanished, or
+    the curves changed piece count). Before each warm start a broad phase
+    counts the crossings of the two curves flattened into short chords; if
+    that exceeds the live roots (the curves started to overlap, or a
+    tangency turned into two crossings), a full solve runs right away
+    instead of waiting for the next scheduled one. After a full
+    solve, new roots are matched to the previous ones by distance, so each
+    Dot keeps following its own root when several exist. Dots of roots that
+    disappear fade out over fade_time seconds and are removed, or come back
+    if the root reappears nearby first.
+
+    Manim Lines count as segments, as in intersect(). With extend=True they
+    are intersected as their infinite extensions, read from the Lines every
+    frame, so IntersectionMarkers(l1, l2, extend=True) replaces
+    always_redraw(lambda: ill(l1, l2)), which rebuilds the Dot from scratch
+    each frame.
+
+    Example:
+        >>> markers = IntersectionMarkers(circle, plot, color=YELLOW)
+        >>> self.add(circle, plot, markers)
+        >>> self.play(circle.animate.shift(RIGHT))  # dots follow their roots
+        >>> crossing = IntersectionMarkers(l1, l2, extend=True)  # like ill(l1, l2)
+    """
+
+    def __init__(self, a, b, color=WHITE, fade_time=0.25, match_distance=0.5, full_every=10, tol=1e-7,
+                 extend=False, **dot_kwargs):
+        """
+        Initialize the markers and attach their updater.
+
+        Args:
+            a: The first object: a VMobject, InfiniteLine, Ray or (N, 3) point array
+            b: The second object
+            color: Dot color (default WHITE)
+            fade_time: Seconds over which the Dot of a vanished root fades out;
+                       0 removes it immediately (default 0.25)
+            match_distance: Largest distance a root may move between full
+                            solves and keep its Dot (default 0.5)
+            full_every: Run a full solve at least every this many frames, to
+                        pick up new roots the broad phase missed (default 10)
+            tol: Distance below which the two curves count as meeting (default 1e-7)
+            extend: If True, intersect Lines as their infinite extensions
+                    (wrapped in InfiniteLine) instead of as segments (default False)
+            **dot_kwargs: Additional arguments passed to each Dot (radius, etc.)
+        """
+        if full_every < 1:
+            raise ValueError(f"full_every must be at least 1, got {full_every}")
+        if extend:
+            a, b = (InfiniteLine(obj) if geometry_kind(obj) == "segment" else obj for obj in (a, b))
+        super().__init__()
+        self.a = a
+        self.b = b
+        self.marker_color = color
+        self.fade_time = fade_time
+        self.match_distance = match_distance
+        self.full_every = full_every
+        self.tol = tol
+        self.dot_kwargs = dot_kwargs
+        # Live roots: ids, stored parameters on each curve, and positions
+        self.root_ids = np.zeros(0, dtype=np.int64)
+        self.root_params = np.zeros((0, 2))
+        self.root_points = np.zeros((0, 3))
+        self.full_solves = 0
+        self._markers = {}
+        self._fading = {}
+        self._next_id = 0
+        self._frames_since_full = 0
+        self._shape = None
+        self.refresh()
+        self.add_updater(lambda group, dt: group.refresh(dt))
+
+    def _curves(self):
+        """Cubics and line spans of both objects, clipped to a box around both."""
+        corners = [_bezier_of(obj, None)[..., :2].reshape(-1, 2) for obj in (self.a, self.b)
+                   if geometry_kind(obj) not in ("line", "ray")]
+        corners = np.vstack(corners) if corners else np.array([self.a.get_start(), self.b.get_start()], dtype=float)[:, :2]
+        box = np.array([corners.min(axis=0), corners.max(axis=0)])
+        return _live_curve(self.a, box), _live_curve(self.b, box)
+
+    def _warm_solve(self, curve_a, curve_b):
+        """Newton from the previous parameters; returns (params, points), or None if a root is lost or new ones may exist."""
+        (cubics_a, span_a), (cubics_b, span_b) = curve_a, curve_b
+        if self._shape != (len(cubics_a), len(cubics_b)):
+            return None
+        if _estimated_roots(cubics_a, cubics_b, self.tol) > len(self.root_ids):
+            return None
+        if len(self.root_ids) == 0:
+            return self.root_params, self.root_points
+        index_a, t = _to_local(self.root_params[:, 0], len(cubics_a), span_a)
+        index_b, u = _to_local(self.root_params[:, 1], len(cubics_b), span_b)
+        xy_a, xy_b = cubics_a[index_a][..., :2], cubics_b[index_b][..., :2]
+        t, u = _newton_refine(xy_a, xy_b, t, u)
+        point_a, _ = _evaluate(xy_a, t)
+        point_b, _ = _evaluate(xy_b, u)
+        if np.any(np.hypot(*(point_a - point_b).T) > self.tol):
+            return None
+        params = np.column_stack([_to_stored(index_a, t, span_a), _to_stored(index_b, u, span_b)])
+        return params, _evaluate(cubics_a[index_a], t)[0]
+
+    def _full_solve(self, curve_a, curve_b):
+        """Solve from scratch and match the roots to the previous ones; returns (ids, params, points)."""
+        (cubics_a, span_a), (cubics_b, span_b) = curve_a, curve_b
+        points, local = bezier_intersections(cubics_a, cubics_b, self.tol, parameters=True)
+        index_a, index_b = np.floor(local).astype(np.int64).T
+        index_a, index_b = np.minimum(index_a, len(cubics_a) - 1), np.minimum(index_b, len(cubics_b) - 1)
+        params = np.column_stack([_to_stored(index_a, local[:, 0] - index_a, span_a),
+                                  _to_stored(index_b, local[:, 1] - index_b, span_b)])
+        self.full_solves += 1
+
+        # Candidates: live roots, then fading markers at their last position
+        fading = list(self._fading)
+        old_ids = np.concatenate([self.root_ids, np.array(fading, dtype=np.int64)])
+        old_points = np.vstack([self.root_points] + [self._markers[i].get_center()[None] for i in fading])
+        ids = np.full(len(points), -1, dtype=np.int64)
+        if len(points) and len(old_ids):
+            distance = np.linalg.norm(points[:, None, :2] - old_points[None, :, :2], axis=2)
+            used_new, used_old = set(), set()
+            # Greedy matching, closest pairs first
+            for flat in np.argsort(distance, axis=None):
+                new, old = divmod(int(flat), len(old_ids))
+                if distance[new, old] > self.match_distance:
+                    break
+                if new not in used_new and old not in used_old:
+                    ids[new] = old_ids[old]
+                    used_new.add(new)
+                    used_old.add(old)
+        for k in np.flatnonzero(ids < 0):
+            ids[k] = self._next_id
+            self._next_id += 1
+        return ids, params, points
+
+    def refresh(self, dt=0.0):
+        """
+        Re-solve the intersections and update the Dots.
+
+        Args:
+            dt: Seconds since the last frame, used to fade vanished roots (default 0)
+
+        Returns:
+            self (for chaining)
+        """
+        curve_a, curve_b = self._curves()
+        warm = None
+        if self._frames_since_full + 1 < self.full_every:
+            warm = self._warm_solve(curve_a, curve_b)
+        if warm is not None:
+            self.root_params, self.root_points = warm
+            self._frames_since_full += 1
+        else:
+            self.root_ids, self.root_params, self.root_points = self._full_solve(curve_a, curve_b)
+            self._shape = (len(curve_a[0]), len(curve_b[0]))
+            self._frames_since_full = 0
+        self._sync_markers(dt)
+        return self
+
+    def _sync_markers(self, dt):
+        """Move, create, revive and fade Dots to match the current roots."""
+        live = set(self.root_ids.tolist())
+        for root_id, point in zip(self.root_ids.tolist(), self.root_points):
+            marker = self._markers.get(root_id)
+            if marker is None:
+                marker = Dot(point, color=self.marker_color, **self.dot_kwargs)
+                self._markers[root_id] = marker
+                self.add(marker)
+            else:
+                marker.move_to(point)
+            if self._fading.pop(root_id, None) is not None:
+                marker.set_opacity(1)
+
+        for root_id in [i for i in self._markers if i not in live]:
+            opacity = self._fading.get(root_id, 1.0) - (dt / self.fade_time if self.fade_time > 0 else 1.0)
+            if opacity <= 0:
+                self.remove(self._markers.pop(root_id))
+                self._fading.pop(root_id, None)
+            else:
+                self._fading[root_id] = opacity
+                self._markers[root_id].set_opacity(opacity)
+
+    def get_marker(self, root_id) -> Optional[Dot]:
+        """
+        Get the Dot of a root by its id (see root_ids), or None if it is gone.
+
+        Args:
+            root_id: Root id, stable for as long as the root is tracked
+        """
+        return self._markers.get(root_id)
+
+
+def live_intersections(a, b, color=WHITE, fade_time=0.25, extend=False, **kwargs) -> IntersectionMarkers:
+    """
+    Create IntersectionMarkers for two objects. See IntersectionMarkers for details.
+
+    Example:
+        >>> dots = live_intersections(line, circle, color=YELLOW)
+        >>> self.add(line, circle, dots)
+        >>> crossing = live_intersections(l1, l2, extend=True)  # replaces always_redraw(lambda: ill(l1, l2))
+    """
+    return IntersectionMarkers(a, b, color=color, fade_time=fade_time, extend=extend, **kwargs)
 
 
 # ============================================================================
@@ -158,3 +1392,8 @@ def ill(line1: Line, line2: Line) -> Union[Dot, VGroup]:
 def ilc(line: Line, circle: Circle) -> VGroup:
     """Alias for intersect_line_circle(). See intersect_line_circle() for full documentation."""
     return intersect_line_circle(line, circle)
+
+
+def icc(curve1, curve2, tol=1e-7) -> VGroup:
+    """Alias for intersect_curves(). See intersect_curves() for full documentation."""
+    return intersect_curves(curve1, curve2, tol)
@@ -5,10 +5,123 @@ This module provides utilities to create vertex and edge labels for polygons.
 """
 
 import numpy as np
-from manim import MathTex, WHITE, YELLOW, UP
+from manim import MathTex, VGroup, WHITE, YELLOW, UP
+from .cache_utils import LRUCache
+from .placement_utils import LabelPlacer
 
+# Rendered label templates keyed by (tex, scale, color); labels are copies of these
+_label_cache = LRUCache(maxsize=256)
 
-def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3):
+
+def _make_label(label_text, scale, color, cache):
+    """Create a scaled, colored MathTex label, copying a cached template when enabled."""
+    if not cache or not _label_cache.enabled:
+        label = MathTex(label_text)
+        label.scale(scale)
+        label.set_color(color)
+        return label
+
+    key = (label_text, float(scale), str(color))
+    template = _label_cache.get(key)
+    if template is None:
+        template = MathTex(label_text)
+        template.scale(scale)
+        template.set_color(color)
+        _label_cache.put(key, template)
+    return template.copy()
+
+
+def label_cache_info() -> dict:
+    """
+    Get statistics for the label template cache.
+
+    Every miss is one MathTex construction (a TeX compile or SVG parse);
+    hits only copy the cached template's points.
+
+    Returns:
+        Dict with hits, misses, size, maxsize and enabled
+
+    Example:
+        >>> vertex_labels(tri, ['A', 'B', 'C'])  # warm-up: 3 misses
+        >>> vertex_labels(tri, ['A', 'B', 'C'])
+        >>> label_cache_info()["hits"]  # 3
+    """
+    return _label_cache.info()
+
+
+def clear_label_cache():
+    """Empty the label template cache and reset its counters."""
+    _label_cache.clear()
+
+
+def configure_label_cache(enabled=None, maxsize=None):
+    """
+    Enable/disable the label template cache or change its size.
+
+    Args:
+        enabled: True to enable, False to disable (labels are then built fresh), None to leave as is
+        maxsize: New maximum number of templates, None to leave as is
+    """
+    if enabled is not None:
+        _label_cache.enabled = bool(enabled)
+    if maxsize is not None:
+        _label_cache.resize(maxsize)
+
+
+def _label_placer(polygon_vertices, avoid_overlap, placer):
+    """Get the LabelPlacer to use, or None for fixed placement."""
+    if placer is not None:
+        return placer
+    if not avoid_overlap:
+        return None
+    placer = LabelPlacer()
+    placer.add_polygon(polygon_vertices)
+    return placer
+
+
+def _vertex_anchor(vertex, center):
+    """Get the anchor point and outward unit direction for a vertex label."""
+    # Calculate outward direction from center
+    direction = vertex - center
+    norm = np.linalg.norm(direction)
+    if norm > 0:
+        direction = direction / norm
+    else:
+        direction = UP  # Fallback if vertex is at center
+    return vertex, direction
+
+
+def _edge_anchor(vertices, i):
+    """Get the midpoint and unit perpendicular of edge i (from vertex i to vertex i + 1)."""
+    # Get edge endpoints
+    p1 = vertices[i]
+    p2 = vertices[(i + 1) % len(vertices)]
+
+    # Calculate midpoint
+    midpoint = (p1 + p2) / 2
+
+    # Calculate perpendicular direction (rotate edge vector 90°)
+    edge_vector = p2 - p1
+    perp = np.array([-edge_vector[1], edge_vector[0], 0])
+
+    # Normalize perpendicular vector
+    perp_norm = np.linalg.norm(perp)
+    if perp_norm > 0:
+        perp = perp / perp_norm
+    else:
+        perp = UP  # Fallback
+    return midpoint, perp
+
+
+def _position_label(label, anchor, direction, buff, placer):
+    """Move a label next to its anchor, through the placer when one is given."""
+    if placer is None:
+        label.next_to(anchor, direction, buff=buff)
+    else:
+        label.move_to(placer.place(anchor, direction, label.width, label.height, buff))
+
+
+def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3, avoid_overlap=False, placer=None, cache=True):
     """
     Create vertex labels positioned outside polygon
 
@@ -18,35 +131,38 @@ def vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3):
         scale: Label text scale (default 0.7)
         color: Label color (default WHITE)
         buff: Distance from vertex to label (default 0.3)
+        avoid_overlap: If True, try several positions around each vertex and keep
+                       the one that overlaps the fewest labels and polygon edges (default False)
+        placer: Optional LabelPlacer shared with other label calls, so labels also avoid
+                each other across calls; obstacles on a shared placer are registered by
+                the caller (e.g. placer.add_polygon(polygon.get_vertices())). Implies avoid_overlap
+        cache: If True, labels are copies of cached templates keyed by (text, scale, color),
+               so repeated calls (e.g. inside always_redraw) skip MathTex construction (default True).
+               Pass False to always build fresh MathTex objects
 
     Returns:
         List of positioned MathTex objects
+
+    Example:
+        >>> labels = vertex_labels(polygon, ['A', 'B', 'C', 'D', 'E'], avoid_overlap=True)
+        >>> redrawn = always_redraw(lambda: VGroup(*vertex_labels(tri, ['A', 'B', 'C'])))
     """
     vertices = polygon.get_vertices()
     center = polygon.get_center()
+    placer = _label_placer(vertices, avoid_overlap, placer)
     label_objects = []
 
     for vertex, label_text in zip(vertices, labels):
-        # Calculate outward direction from center
-        direction = vertex - center
-        norm = np.linalg.norm(direction)
-        if norm > 0:
-            direction = direction / norm
-        else:
-            direction = UP  # Fallback if vertex is at center
-
         # Create and position label
-        label = MathTex(label_text)
-        label.scale(scale)
-        label.set_color(color)
-        label.next_to(vertex, direction, buff=buff)
+        label = _make_label(label_text, scale, color, cache)
+        _position_label(label, *_vertex_anchor(vertex, center), buff, placer)
 
         label_objects.append(label)
 
     return label_objects
 
 
-def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2):
+def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2, avoid_overlap=False, placer=None, cache=True):
     """
     Create edge labels at midpoints with perpendicular offset
 
@@ -56,39 +172,147 @@ def edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2):
         scale: Label text scale (default 0.6)
         color: Label color (default YELLOW)
         buff: Distance from edge midpoint (default 0.2)
+        avoid_overlap: If True, try several positions around each midpoint and keep
+                       the one that overlaps the fewest labels and polygon edges (default False)
+        placer: Optional LabelPlacer shared with other label calls (see vertex_labels())
+        cache: If True, labels are copies of cached templates (see vertex_labels())
 
     Returns:
         List of positioned MathTex objects
     """
     vertices = polygon.get_vertices()
+    placer = _label_placer(vertices, avoid_overlap, placer)
     label_objects = []
-    n = len(vertices)
 
     for i, label_text in enumerate(labels):
-        # Get edge endpoints
-        p1 = vertices[i]
-        p2 = vertices[(i + 1) % n]
+        # Create and position label
+        label = _make_label(label_text, scale, color, cache)
+        _position_label(label, *_edge_anchor(vertices, i), buff, placer)
 
-        # Calculate midpoint
-        midpoint = (p1 + p2) / 2
+        label_objects.append(label)
+
+    return label_objects
+
+
+class TrackingLabels(VGroup):
+    """
+    Vertex or edge labels that follow a moving polygon.
+
+    The labels are built once. A single updater recomputes the anchors each
+    frame and moves the existing labels there, instead of rebuilding the
+    whole group like always_redraw(lambda: VGroup(*vertex_labels(...))).
+    When the polygon's vertex count changes, only the labels for the added
+    or removed vertices (or edges) are created or dropped.
+
+    Example:
+        >>> tri = Polygon(LEFT, RIGHT, UP)
+        >>> names = tracking_vertex_labels(tri, ['A', 'B', 'C'])
+        >>> self.add(tri, names)
+        >>> self.play(tri.animate.shift(RIGHT))  # labels follow
+    """
+
+    def __init__(self, polygon, labels, kind="vertex", scale=0.7, color=WHITE, buff=0.3, avoid_overlap=False,
+                 cache=True):
+        """
+        Initialize tracking labels and attach their updater.
+
+        Args:
+            polygon: Manim Polygon object (anything with get_vertices() and get_center())
+            labels: List of label strings (entries beyond the current vertex count are
+                    used if vertices are added later), or a callable index -> label string
+            kind: "vertex" or "edge" (default "vertex")
+            scale: Label text scale (default 0.7)
+            color: Label color (default WHITE)
+            buff: Distance from the anchor to the label (default 0.3)
+            avoid_overlap: Re-run collision-aware placement every update (default False)
+            cache: Create labels from cached templates (default True)
+        """
+        if kind not in ("vertex", "edge"):
+            raise ValueError(f"kind must be 'vertex' or 'edge', got '{kind}'")
+        super().__init__()
+        self.polygon = polygon
+        self.labels = labels
+        self.kind = kind
+        self.label_scale = scale
+        self.label_color = color
+        self.buff = buff
+        self.avoid_overlap = avoid_overlap
+        self.cache = cache
+        self.reposition()
+        self.add_updater(lambda group: group.reposition())
 
-        # Calculate perpendicular direction (rotate edge vector 90°)
-        edge_vector = p2 - p1
-        perp = np.array([-edge_vector[1], edge_vector[0], 0])
+    def _label_text(self, index):
+        """Get the text for label index, or None if there is none."""
+        if callable(self.labels):
+            return self.labels(index)
+        return self.labels[index] if index < len(self.labels) else None
 
-        # Normalize perpendicular vector
-        perp_norm = np.linalg.norm(perp)
-        if perp_norm > 0:
-            perp = perp / perp_norm
+    def _sync_count(self, count):
+        """Add or remove labels at the end so there is one per vertex (or edge)."""
+        while len(self.submobjects) > count:
+            self.remove(self.submobjects[-1])
+        for index in range(len(self.submobjects), count):
+            text = self._label_text(index)
+            if text is None:
+                break
+            self.add(_make_label(text, self.label_scale, self.label_color, self.cache))
+
+    def reposition(self):
+        """
+        Move every label to its current anchor, adding or removing labels if the vertex count changed.
+
+        Returns:
+            self (for chaining)
+        """
+        vertices = self.polygon.get_vertices()
+        self._sync_count(len(vertices))
+        placer = _label_placer(vertices, self.avoid_overlap, None)
+        if self.kind == "vertex":
+            center = self.polygon.get_center()
+            anchors = (_vertex_anchor(vertices[i], center) for i in range(len(self.submobjects)))
         else:
-            perp = UP  # Fallback
+            anchors = (_edge_anchor(vertices, i) for i in range(len(self.submobjects)))
+        for label, (anchor, direction) in zip(self.submobjects, anchors):
+            _position_label(label, anchor, direction, self.buff, placer)
+        return self
 
-        # Create and position label
-        label = MathTex(label_text)
-        label.scale(scale)
-        label.set_color(color)
-        label.next_to(midpoint, perp, buff=buff)
 
-        label_objects.append(label)
+def tracking_vertex_labels(polygon, labels, scale=0.7, color=WHITE, buff=0.3, avoid_overlap=False, cache=True):
+    """
+    Create vertex labels that follow the polygon with a single updater.
 
-    return label_objects
+    Args:
+        polygon: Manim Polygon object
+        labels: List of label strings ['A', 'B', 'C'], or a callable index -> string
+        scale: Label text scale (default 0.7)
+        color: Label color (default WHITE)
+        buff: Distance from vertex to label (default 0.3)
+        avoid_overlap: Use collision-aware placement on every update (default False)
+        cache: Create labels from cached templates (default True)
+
+    Returns:
+        TrackingLabels group (a VGroup with the updater attached)
+
+    Example:
+        >>> labels = tracking_vertex_labels(tri, ['A', 'B', 'C'])  # replaces always_redraw(...)
+    """
+    return TrackingLabels(polygon, labels, "vertex", scale, color, buff, avoid_overlap, cache)
+
+
+def tracking_edge_labels(polygon, labels, scale=0.6, color=YELLOW, buff=0.2, avoid_overlap=False, cache=True):
+    """
+    Create edge labels that follow the polygon with a single updater.
+
+    Args:
+        polygon: Manim Polygon object
+        labels: List of label strings ['a', 'b', 'c'], or a callable index -> string
+        scale: Label text scale (default 0.6)
+        color: Label color (default YELLOW)
+        buff: Distance from edge midpoint (default 0.2)
+        avoid_overlap: Use collision-aware placement on every update (default False)
+        cache: Create labels from cached templates (default True)
+
+    Returns:
+        TrackingLabels group (a VGroup with the updater attached)
+    """
+    return TrackingLabels(polygon, labels, "edge", scale, color, buff, avoid_overlap, cache)
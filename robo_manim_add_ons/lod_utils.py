@@ -0,0 +1,177 @@
+"""
+Level-of-detail resampling for explicit plots.
+
+Provides a sampler that re-samples only the x-interval visible through a
+camera frame, at a density matched to the frame's pixels per unit, and
+caches the samples per zoom level.
+"""
+
+import math
+import numpy as np
+from typing import List
+from .cache_utils import LRUCache
+from .sampling_utils import sample_explicit
+
+
+class LODSampler:
+    """
+    Zoom-level-aware sampler for y = f(x).
+
+    The x-domain is split into 2**level equal tiles at each zoom level, and
+    every tile is sampled with the same number of initial samples, so one
+    level up doubles the density. A frame selects the coarsest level that
+    gives at least one sample every `pixels_per_sample` pixels, and only the
+    tiles it overlaps (plus one on each side) are sampled. Tiles are cached
+    per (level, index), so zooming back and forth reuses earlier samples.
+
+    Example:
+        >>> sampler = LODSampler(np.sin, [-5, 5], [-2, 2])
+        >>> pieces = sampler.sample(-1, 1, level=3)
+        >>> sampler.update(plot, self.camera.frame)  # inside an updater
+    """
+
+    def __init__(self, func, x_range, y_range=None, tolerance=1e-3, samples_per_tile=65, pixels_per_sample=4,
+                 max_level=8, pixel_width=None, cache_size=512):
+        """
+        Initialize the sampler.
+
+        Args:
+            func: Vectorized callable f(x)
+            x_range: [x_min, x_max] of the full plot
+            y_range: Optional [y_min, y_max] of the full view
+            tolerance: Adaptive tolerance at level 0, as a fraction of the
+                y-span; halved at every level (default 1e-3)
+            samples_per_tile: Initial samples per tile (default 65)
+            pixels_per_sample: Target screen spacing between samples in pixels (default 4)
+            max_level: Finest zoom level (default 8)
+            pixel_width: Output width in pixels; None reads manim's config.pixel_width
+            cache_size: Maximum number of cached tiles (default 512)
+        """
+        self.func = func
+        self.x_min, self.x_max = float(x_range[0]), float(x_range[1])
+        self.y_range = None if y_range is None else [float(y_range[0]), float(y_range[1])]
+        self.tolerance = tolerance
+        self.samples_per_tile = max(int(samples_per_tile), 2)
+        self.pixels_per_sample = pixels_per_sample
+        self.max_level = int(max_level)
+        self.pixel_width = pixel_width
+        self.cache = LRUCache(maxsize=cache_size)
+        self._state = None
+
+    def _tile(self, level: int, index: int) -> List[np.ndarray]:
+        """Get the (cached) polylines of one tile."""
+        key = (level, index)
+        pieces = self.cache.get(key)
+        if pieces is None:
+            width = (self.x_max - self.x_min) / 2 ** level
+            # Boundaries are computed the same way for both neighbours, so shared endpoints match exactly
+            lo = self.x_min + index * width
+            hi = self.x_min + (index + 1) * width
+            pieces = sample_explicit(self.func, [lo, hi], self.y_range, samples=self.samples_per_tile,
+                                     tolerance=self.tolerance / 2 ** level)
+            self.cache.put(key, pieces)
+        return pieces
+
+    def tiles_for(self, x_lo: float, x_hi: float, level: int) -> range:
+        """Get the tile indices at a level overlapping [x_lo, x_hi], plus one tile margin."""
+        count = 2 ** level
+        width = (self.x_max - self.x_min) / count
+        first = max(int(math.floor((x_lo - self.x_min) / width)) - 1, 0)
+        last = min(int(math.floor((x_hi - self.x_min) / width)) + 1, count - 1)
+        return range(first, last + 1)
+
+    def sample(self, x_lo: float, x_hi: float, level: int) -> List[np.ndarray]:
+        """
+        Sample the visible interval at a zoom level.
+
+        Args:
+            x_lo: Left edge of the visible interval (axes coordinates)
+            x_hi: Right edge of the visible interval
+            level: Zoom level (0 = whole domain in one tile)
+
+        Returns:
+            List of (N, 2) polylines; pieces continuing across tile borders are joined
+        """
+        level = min(max(int(level), 0), self.max_level)
+        polylines = []
+        for index in self.tiles_for(x_lo, x_hi, level):
+            for piece in self._tile(level, index):
+                last = polylines[-1] if polylines else None
+                if last is not None and np.array_equal(last[-1], piece[0]):
+                    polylines[-1] = np.vstack([last, piece[1:]])
+                else:
+                    polylines.append(piece)
+        return polylines
+
+    def level_for(self, samples_per_unit: float) -> int:
+        """
+        Get the coarsest level with at least the given density.
+
+        Args:
+            samples_per_unit: Required samples per axes x-unit
+
+        Returns:
+            Level between 0 and max_level
+        """
+        base = (self.samples_per_tile - 1) / (self.x_max - self.x_min)
+        if samples_per_unit <= base:
+            return 0
+        return min(int(math.ceil(math.log2(samples_per_unit / base))), self.max_level)
+
+    def view(self, affine: np.ndarray, frame):
+        """
+        Get the visible x-interval and zoom level for a camera frame.
+
+        Args:
+            affine: Axes affine map from axes_affine()
+            frame: Camera frame mobject (anything with width, height and get_center())
+
+        Returns:
+            Tuple of (x_lo, x_hi, level), or None if the plot's domain is not visible
+        """
+        center = np.asarray(frame.get_center(), dtype=float)
+        half_w, half_h = frame.width / 2, frame.height / 2
+        corners = center[:2] + np.array([[-half_w, -half_h], [half_w, -half_h], [half_w, half_h], [-half_w, half_h]])
+
+        # Invert point = origin + x * ex + y * ey on the screen plane
+        origin, ex, ey = affine
+        basis = np.column_stack([ex[:2], ey[:2]])
+        xs = np.linalg.solve(basis, (corners - origin[:2]).T)[0]
+        x_lo, x_hi = max(xs.min(), self.x_min), min(xs.max(), self.x_max)
+        if x_lo >= x_hi:
+            return None
+
+        pixel_width = self.pixel_width
+        if pixel_width is None:
+            from manim import config
+            pixel_width = config.pixel_width
+        pixels_per_unit = pixel_width / frame.width * np.linalg.norm(ex[:2])
+        return x_lo, x_hi, self.level_for(pixels_per_unit / self.pixels_per_sample)
+
+    def update(self, plot, frame) -> bool:
+        """
+        Re-sample a SampledPlot for the current camera frame if the view changed tiles or level.
+
+        Args:
+            plot: SampledPlot drawn with this sampler's function
+            frame: Camera frame mobject
+
+        Returns:
+            True if the plot's points were replaced
+        """
+        view = self.view(plot.get_axes_affine(), frame)
+        if view is None:
+            return False
+        x_lo, x_hi, level = view
+        tiles = self.tiles_for(x_lo, x_hi, level)
+        state = (level, tiles.start, tiles.stop)
+        if state == self._state:
+            return False
+        self._state = state
+        plot.set_polylines(self.sample(x_lo, x_hi, level))
+        return True
+
+    def reset(self, plot):
+        """Restore the full-domain level-0 samples on a plot."""
+        self._state = None
+        plot.set_polylines(self.sample(self.x_min, self.x_max, 0))
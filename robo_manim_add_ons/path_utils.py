@@ -0,0 +1,221 @@
+"""
+Path utilities for turning sampled polylines into Manim VMobjects.
+
+Provides vectorized helpers for mapping axes coordinates to scene points and
+for packing many polylines into the cubic Bézier point array of a single VMobject.
+"""
+
+import weakref
+import numpy as np
+from manim import VMobject
+from .sampling_utils import split_runs
+
+
+def axes_affine(axes) -> np.ndarray:
+    """
+    Get the affine map from axes coordinates to scene points.
+
+    Args:
+        axes: Axes object with a linear c2p() mapping
+
+    Returns:
+        3x3 array whose rows are (origin, x unit vector, y unit vector), so that
+        point = origin + x * ex + y * ey
+
+    Example:
+        >>> affine = axes_affine(axes)
+        >>> origin, ex, ey = affine
+    """
+    origin = np.asarray(axes.c2p(0, 0), dtype=float)
+    ex = np.asarray(axes.c2p(1, 0), dtype=float) - origin
+    ey = np.asarray(axes.c2p(0, 1), dtype=float) - origin
+    return np.array([origin, ex, ey])
+
+
+def coords_to_points(affine, xs, ys) -> np.ndarray:
+    """
+    Map arrays of axes coordinates to scene points in one vectorized step.
+
+    Args:
+        affine: Result of axes_affine(), or an Axes object
+        xs: Array of x-coordinates
+        ys: Array of y-coordinates (same shape as xs)
+
+    Returns:
+        Array of shape (N, 3) with the scene points
+    """
+    if not isinstance(affine, np.ndarray):
+        affine = axes_affine(affine)
+    xs = np.asarray(xs, dtype=float).reshape(-1, 1)
+    ys = np.asarray(ys, dtype=float).reshape(-1, 1)
+    return affine[0] + xs * affine[1] + ys * affine[2]
+
+
+def polylines_to_bezier_points(polylines) -> np.ndarray:
+    """
+    Pack polylines into a VMobject point array of straight cubic Bézier segments.
+
+    Each polyline becomes one subpath: consecutive segments share anchors, and
+    Manim starts a new subpath wherever one segment's end differs from the
+    next segment's start.
+
+    Args:
+        polylines: Iterable of (N, 3) arrays of scene points
+
+    Returns:
+        Array of shape (4 * number_of_segments, 3)
+
+    Example:
+        >>> square = np.array([[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [0, 0, 0]])
+        >>> points = polylines_to_bezier_points([square])  # 4 segments, 16 points
+    """
+    curves = []
+    for line in polylines:
+        line = np.asarray(line, dtype=float)
+        if len(line) < 2:
+            continue
+        curves.append(write_polyline_points(np.empty((4 * (len(line) - 1), 3)), line))
+    if not curves:
+        return np.zeros((0, 3))
+    return np.vstack(curves)
+
+
+def write_polyline_points(out: np.ndarray, line: np.ndarray) -> np.ndarray:
+    """
+    Write one polyline as straight cubic Bézier segments into an existing array.
+
+    Args:
+        out: Array of shape (4 * (N - 1), 3) to overwrite, e.g. a VMobject's points
+        line: (N, 3) array of scene points
+
+    Returns:
+        out
+    """
+    quads = out.reshape(-1, 4, 3)
+    starts, ends = line[:-1], line[1:]
+    quads[:, 0] = starts
+    quads[:, 3] = ends
+    np.subtract(ends, starts, out=quads[:, 1])
+    quads[:, 1] /= 3
+    np.multiply(quads[:, 1], 2, out=quads[:, 2])
+    quads[:, 1] += starts
+    quads[:, 2] += starts
+    return out
+
+
+def segments_to_bezier_points(segments) -> np.ndarray:
+    """
+    Pack disjoint line segments into a VMobject point array, one subpath each.
+
+    Args:
+        segments: Array of shape (N, 2, 3) with (start, end) scene points
+
+    Returns:
+        Array of shape (4 * N, 3) of straight cubic Bézier segments
+    """
+    segments = np.asarray(segments, dtype=float)
+    starts, ends = segments[:, 0], segments[:, 1]
+    quads = np.empty((len(segments), 4, 3))
+    quads[:, 0] = starts
+    quads[:, 1] = starts + (ends - starts) / 3
+    quads[:, 2] = starts + 2 * (ends - starts) / 3
+    quads[:, 3] = ends
+    return quads.reshape(-1, 3)
+
+
+class SampledPlot(VMobject):
+    """
+    A plot built from numeric samples in axes coordinates.
+
+    Holds the sampled polylines (in axes coordinates) alongside the rendered
+    Bézier points, so callers can inspect or resample a plot without going
+    back to sympy. The axes are referenced weakly so copying a plot does not
+    copy its axes.
+    """
+
+    def __init__(self, axes, polylines, underlying_function=None, **kwargs):
+        """
+        Initialize a sampled plot.
+
+        Args:
+            axes: The Axes the samples are expressed in
+            polylines: List of (N, 2) arrays of (x, y) samples in axes coordinates;
+                each array becomes a separate subpath
+            underlying_function: Optional f(x) for explicit plots. When given, the
+                plot works with axes.i2gp() like the result of axes.plot()
+            **kwargs: Additional arguments passed to VMobject (color, stroke_width, etc.)
+
+        Example:
+            >>> xs = np.linspace(-3, 3, 50)
+            >>> plot = SampledPlot(axes, [np.column_stack([xs, xs ** 2])], color=BLUE)
+        """
+        super().__init__(**kwargs)
+        self._axes_ref = weakref.ref(axes)
+        self._affine = axes_affine(axes)
+        # Optional level-of-detail sampler (see lod_utils.LODSampler)
+        self.lod = None
+        if underlying_function is not None:
+            self.underlying_function = underlying_function
+        self.set_polylines(polylines)
+
+    def function(self, x):
+        """Map an x-value to the scene point on an explicit plot (used by axes.i2gp())."""
+        y = self.underlying_function(x)
+        return coords_to_points(self.get_axes_affine(), x, y)[0]
+
+    def get_axes_affine(self) -> np.ndarray:
+        """Get the current axes affine map, falling back to the one seen at construction."""
+        axes = self._axes_ref()
+        if axes is not None:
+            self._affine = axes_affine(axes)
+        return self._affine
+
+    def set_polylines(self, polylines):
+        """
+        Replace the samples and rebuild the rendered points.
+
+        Args:
+            polylines: List of (N, 2) arrays of (x, y) samples in axes coordinates
+
+        Returns:
+            self (for chaining)
+        """
+        self.polylines = [np.array(line, dtype=float) for line in polylines if len(line) >= 2]
+        affine = self.get_axes_affine()
+        self.set_points(polylines_to_bezier_points(
+            coords_to_points(affine, line[:, 0], line[:, 1]) for line in self.polylines
+        ))
+        return self
+
+    def set_grid_values(self, xs, ys):
+        """
+        Update the plot from samples on a fixed x-grid, in place when possible.
+
+        When the plot is a single polyline over the same grid and all values
+        are finite, the sample array and the rendered points are overwritten
+        without allocating new arrays on the mobject. Otherwise the plot is
+        rebuilt, split around undefined values.
+
+        Args:
+            xs: Grid x-coordinates, shape (N,)
+            ys: Values on the grid, shape (N,)
+
+        Returns:
+            self (for chaining)
+        """
+        finite = np.isfinite(ys)
+        line = self.polylines[0] if len(self.polylines) == 1 else None
+        in_place = (finite.all() and line is not None and len(line) == len(xs)
+                    and len(self.points) == 4 * (len(xs) - 1) and self.points.flags.c_contiguous)
+        if in_place:
+            line[:, 0] = xs
+            line[:, 1] = ys
+            write_polyline_points(self.points, coords_to_points(self.get_axes_affine(), xs, ys))
+            return self
+        return self.set_polylines(split_runs(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float),
+                                             finite[:-1] & finite[1:]))
+
+    @property
+    def sample_count(self) -> int:
+        """Total number of samples across all subpaths."""
+        return sum(len(line) for line in self.polylines)
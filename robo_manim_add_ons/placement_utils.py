@@ -0,0 +1,339 @@
+"""
+Collision-aware placement for labels.
+
+Provides a uniform-grid spatial hash of label boxes and line segments, and a
+placer that tries several candidate positions around each anchor and keeps
+the one that overlaps the fewest already-placed labels and edges.
+"""
+
+import math
+import numpy as np
+from collections import defaultdict
+
+# Candidate directions, as rotations (degrees) away from the preferred direction, best first
+_CANDIDATE_ANGLES = (0, 30, -30, 60, -60, 90, -90, 135, -135, 180)
+
+# Candidate distances from the anchor, as multiples of buff
+_CANDIDATE_DISTANCES = (1.0, 2.0)
+
+# Cost weights: overlapping another label is worse than crossing an edge,
+# which is worse than any amount of moving away from the preferred spot
+_LABEL_OVERLAP_COST = 1000.0
+_EDGE_CROSSING_COST = 100.0
+_ANGLE_COST = 1.0
+_DISTANCE_COST = 2.0
+
+# Per-candidate rotation, distance factor and preference cost, in candidate order
+_ROTATIONS = np.radians(np.tile(_CANDIDATE_ANGLES, len(_CANDIDATE_DISTANCES)))
+_COS, _SIN = np.cos(_ROTATIONS), np.sin(_ROTATIONS)
+_SCALES = np.repeat(_CANDIDATE_DISTANCES, len(_CANDIDATE_ANGLES))
+_PREFERENCE_COST = (_ANGLE_COST * np.tile(np.arange(len(_CANDIDATE_ANGLES)), len(_CANDIDATE_DISTANCES)) +
+                    _DISTANCE_COST * np.repeat(np.arange(len(_CANDIDATE_DISTANCES)), len(_CANDIDATE_ANGLES)))
+_PREFERENCE_ORDER = [int(i) for i in np.argsort(_PREFERENCE_COST, kind="stable")]
+
+_CORNER_SIGNS = np.array([[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]])
+
+
+class SpatialHash:
+    """
+    Uniform grid of cells holding axis-aligned boxes and line segments.
+
+    Items are registered in every cell their bounding box covers, so a query
+    only has to look at the items in the cells around the query box.
+
+    Example:
+        >>> grid = SpatialHash(cell_size=0.5)
+        >>> grid.add_box([0, 0, 1, 0.4])
+        >>> grid.add_segment([0, -1], [0, 1])
+        >>> boxes, segments = grid.query([0.5, 0, 1.5, 1])
+    """
+
+    def __init__(self, cell_size=0.5):
+        """
+        Initialize an empty grid.
+
+        Args:
+            cell_size: Side length of a grid cell in scene units (default 0.5)
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell_size must be positive, got {cell_size}")
+        self.cell_size = float(cell_size)
+        self.boxes = []
+        self.segments = []
+        self._box_cells = defaultdict(list)
+        self._segment_cells = defaultdict(list)
+
+    def _cells(self, x_min, y_min, x_max, y_max):
+        """Iterate over the cell keys covering a box."""
+        size = self.cell_size
+        i0, i1 = math.floor(x_min / size), math.floor(x_max / size)
+        j0, j1 = math.floor(y_min / size), math.floor(y_max / size)
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                yield i, j
+
+    def add_box(self, box):
+        """
+        Register an axis-aligned box.
+
+        Args:
+            box: (x_min, y_min, x_max, y_max)
+        """
+        box = tuple(float(v) for v in box)
+        index = len(self.boxes)
+        self.boxes.append(box)
+        for cell in self._cells(*box):
+            self._box_cells[cell].append(index)
+
+    def add_segment(self, start, end):
+        """
+        Register a line segment.
+
+        Args:
+            start: (x, y[, z]) start point
+            end: (x, y[, z]) end point
+        """
+        x0, y0, x1, y1 = float(start[0]), float(start[1]), float(end[0]), float(end[1])
+        index = len(self.segments)
+        self.segments.append((x0, y0, x1, y1))
+        for cell in self._cells(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)):
+            self._segment_cells[cell].append(index)
+
+    def query(self, box):
+        """
+        Get the boxes and segments registered near a box.
+
+        Args:
+            box: (x_min, y_min, x_max, y_max) region of interest
+
+        Returns:
+            Tuple of (boxes (B, 4) array, segments (S, 4) array as x0, y0, x1, y1)
+        """
+        box_ids, segment_ids = set(), set()
+        for cell in self._cells(*box):
+            box_ids.update(self._box_cells.get(cell, ()))
+            segment_ids.update(self._segment_cells.get(cell, ()))
+        boxes = np.array([self.boxes[i] for i in box_ids], dtype=float).reshape(-1, 4)
+        segments = np.array([self.segments[i] for i in segment_ids], dtype=float).reshape(-1, 4)
+        return boxes, segments
+
+    def is_free(self, box) -> bool:
+        """
+        Check whether a box overlaps no registered box and crosses no registered segment.
+
+        Uses plain float arithmetic, which is cheaper than NumPy for the few
+        items in the cells around a single box.
+
+        Args:
+            box: (x_min, y_min, x_max, y_max)
+
+        Returns:
+            True if the box is free
+        """
+        x_min, y_min, x_max, y_max = box
+        corners = ((x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max))
+        seen_boxes, seen_segments = set(), set()
+        for cell in self._cells(x_min, y_min, x_max, y_max):
+            for index in self._box_cells.get(cell, ()):
+                if index in seen_boxes:
+                    continue
+                seen_boxes.add(index)
+                bx0, by0, bx1, by1 = self.boxes[index]
+                if min(x_max, bx1) > max(x_min, bx0) and min(y_max, by1) > max(y_min, by0):
+                    return False
+            for index in self._segment_cells.get(cell, ()):
+                if index in seen_segments:
+                    continue
+                seen_segments.add(index)
+                x0, y0, x1, y1 = self.segments[index]
+                if min(x0, x1) > x_max or max(x0, x1) < x_min or min(y0, y1) > y_max or max(y0, y1) < y_min:
+                    continue
+                sides = [(x1 - x0) * (cy - y0) - (y1 - y0) * (cx - x0) for cx, cy in corners]
+                if not (min(sides) > 0 or max(sides) < 0):
+                    return False
+        return True
+
+    def clear(self):
+        """Remove all boxes and segments."""
+        self.boxes.clear()
+        self.segments.clear()
+        self._box_cells.clear()
+        self._segment_cells.clear()
+
+
+def segments_cross_boxes(boxes: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """
+    Test every box against every segment.
+
+    A segment crosses a box when their bounding boxes overlap and the box's
+    corners do not all lie strictly on one side of the segment's line.
+
+    Args:
+        boxes: (K, 4) array of (x_min, y_min, x_max, y_max)
+        segments: (S, 4) array of (x0, y0, x1, y1)
+
+    Returns:
+        Boolean array of shape (K, S)
+    """
+    centers, halves = (boxes[:, :2] + boxes[:, 2:]) / 2, (boxes[:, 2:] - boxes[:, :2]) / 2
+    starts, ends = segments[:, :2], segments[:, 2:]
+    # Bounding boxes overlap when the centers are closer than the half-extents on both axes
+    reach = halves[:, None, :] + np.abs(ends - starts) / 2
+    overlap = (np.abs(centers[:, None, :] - (starts + ends) / 2) <= reach).all(axis=2)
+    # Signed side of the four corners (K * 4) against every segment line (S)
+    corners = (centers[:, None, :] + halves[:, None, :] * _CORNER_SIGNS).reshape(-1, 2)
+    normals = np.column_stack([starts[:, 1] - ends[:, 1], ends[:, 0] - starts[:, 0]])
+    sides = (corners @ normals.T - np.einsum("ij,ij->i", normals, starts)).reshape(len(boxes), 4, -1)
+    one_side = (sides.min(axis=1) > 0) | (sides.max(axis=1) < 0)
+    return overlap & ~one_side
+
+
+def overlap_areas(boxes: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Get the total overlap area of each box with a set of other boxes.
+
+    Args:
+        boxes: (K, 4) array of (x_min, y_min, x_max, y_max)
+        others: (B, 4) array of boxes
+
+    Returns:
+        Array of shape (K,)
+    """
+    w = np.minimum(boxes[:, None, 2], others[None, :, 2]) - np.maximum(boxes[:, None, 0], others[None, :, 0])
+    h = np.minimum(boxes[:, None, 3], others[None, :, 3]) - np.maximum(boxes[:, None, 1], others[None, :, 1])
+    return (np.clip(w, 0, None) * np.clip(h, 0, None)).sum(axis=1)
+
+
+class LabelPlacer:
+    """
+    Greedy collision-aware placement of label boxes.
+
+    Each label is tried at several candidate positions around its anchor
+    (rotations of the preferred direction at one and two times buff). Every
+    candidate is scored against the nearby label boxes and segments from the
+    spatial hash, and the cheapest one is kept and registered, so later
+    labels avoid it. A candidate at the preferred direction is placed exactly
+    like mobject.next_to(anchor, direction, buff=buff).
+
+    Example:
+        >>> placer = LabelPlacer()
+        >>> placer.add_polygon(triangle.get_vertices())
+        >>> center = placer.place(vertex, direction, label.width, label.height, buff=0.3)
+        >>> label.move_to(center)
+    """
+
+    def __init__(self, cell_size=0.5):
+        """
+        Initialize an empty placer.
+
+        Args:
+            cell_size: Spatial hash cell size in scene units (default 0.5,
+                about the size of a scaled single-letter label)
+        """
+        self.grid = SpatialHash(cell_size)
+
+    def add_polygon(self, vertices):
+        """
+        Register the closed edges of a polygon as obstacles.
+
+        Args:
+            vertices: (N, 2) or (N, 3) array of polygon vertices
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        for start, end in zip(vertices, np.roll(vertices, -1, axis=0)):
+            self.grid.add_segment(start, end)
+
+    def add_segments(self, segments):
+        """
+        Register open line segments as obstacles.
+
+        Args:
+            segments: Iterable of (start, end) point pairs
+        """
+        for start, end in segments:
+            self.grid.add_segment(start, end)
+
+    def add_mobject(self, mobject):
+        """Register a mobject's bounding box, e.g. an existing label, as an obstacle."""
+        x_min, y_min = mobject.get_corner(np.array([-1, -1, 0]))[:2]
+        x_max, y_max = mobject.get_corner(np.array([1, 1, 0]))[:2]
+        self.grid.add_box((x_min, y_min, x_max, y_max))
+
+    @staticmethod
+    def candidates(anchor, direction, width, height, buff) -> np.ndarray:
+        """
+        Get the candidate label centers around an anchor.
+
+        Args:
+            anchor: Anchor point (x, y[, z])
+            direction: Preferred unit direction from the anchor
+            width: Label width
+            height: Label height
+            buff: Gap between the anchor and the label
+
+        Returns:
+            Array of shape (K, 2) of centers, preferred candidate first
+        """
+        norm = math.hypot(direction[0], direction[1])
+        dx, dy = (direction[0] / norm, direction[1] / norm) if norm > 0 else (0.0, 1.0)
+        dirs = np.empty((len(_ROTATIONS), 2))
+        dirs[:, 0] = _COS * dx - _SIN * dy
+        dirs[:, 1] = _SIN * dx + _COS * dy
+        # Snap numerical noise so axis-aligned directions align to box edges like next_to()
+        dirs[np.abs(dirs) < 1e-9] = 0.0
+        half = np.array([width / 2, height / 2])
+        return np.asarray(anchor, dtype=float)[:2] + dirs * (buff * _SCALES)[:, None] + np.sign(dirs) * half
+
+    def place(self, anchor, direction, width, height, buff=0.3) -> np.ndarray:
+        """
+        Choose the lowest-cost position for one label and register it.
+
+        Args:
+            anchor: Anchor point (x, y[, z])
+            direction: Preferred direction from the anchor (need not be unit length)
+            width: Label width
+            height: Label height
+            buff: Gap between the anchor and the label (default 0.3)
+
+        Returns:
+            The chosen label center as a 3D point
+        """
+        z = float(anchor[2]) if len(anchor) > 2 else 0.0
+        # A free candidate beats every blocked one, so the first free candidate in
+        # preference order is optimal. The preferred spot is checked without NumPy.
+        norm = math.hypot(direction[0], direction[1])
+        dx, dy = (direction[0] / norm, direction[1] / norm) if norm > 0 else (0.0, 1.0)
+        dx, dy = (0.0 if abs(dx) < 1e-9 else dx), (0.0 if abs(dy) < 1e-9 else dy)
+        cx = float(anchor[0]) + dx * buff + math.copysign(width / 2, dx) * (dx != 0)
+        cy = float(anchor[1]) + dy * buff + math.copysign(height / 2, dy) * (dy != 0)
+        box = (cx - width / 2, cy - height / 2, cx + width / 2, cy + height / 2)
+        if self.grid.is_free(box):
+            self.grid.add_box(box)
+            return np.array([cx, cy, z])
+
+        centers = self.candidates(anchor, direction, width, height, buff)
+        half = np.array([width / 2, height / 2])
+        boxes = np.hstack([centers - half, centers + half])
+        box_list = boxes.tolist()
+        for index in _PREFERENCE_ORDER[1:]:
+            if self.grid.is_free(box_list[index]):
+                self.grid.add_box(box_list[index])
+                return np.array([centers[index, 0], centers[index, 1], z])
+
+        # Every candidate is blocked: score them all and take the least bad one
+
+        region = (*boxes[:, :2].min(axis=0), *boxes[:, 2:].max(axis=0))
+        placed, segments = self.grid.query(region)
+        cost = _PREFERENCE_COST.copy()
+        if len(placed):
+            cost += _LABEL_OVERLAP_COST * overlap_areas(boxes, placed) / max(width * height, 1e-12)
+        if len(segments):
+            cost += _EDGE_CROSSING_COST * segments_cross_boxes(boxes, segments).sum(axis=1)
+
+        best = int(np.argmin(cost))
+        self.grid.add_box(boxes[best])
+        return np.array([centers[best, 0], centers[best, 1], z])
+
+    def clear(self):
+        """Forget all registered labels and obstacles."""
+        self.grid.clear()
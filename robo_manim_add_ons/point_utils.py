@@ -1,13 +1,157 @@
 """
 Point utilities for Manim objects.
 
-Provides helper class for point operations and transformations.
+Provides helper class for point operations and transformations, and the
+lazy point references returned by the Exp helpers (st, ed, mid, pt, ...).
 """
 
 import numpy as np
 from manim import Dot, Mobject
 
 
+class PointRef(Dot):
+    """
+    A Dot that also behaves like its coordinate array.
+
+    np.asarray(p), p[0], x, y, z = p, len(p) (always 3), p + UP and p - q
+    all work on the center point, and the result of arithmetic is a plain
+    np.ndarray. Unlike other mobjects, iterating a PointRef yields its
+    coordinates, not its submobjects. Helpers such as st(),
+    mid() and pt() return lazy references made with PointRef.lazy(): those
+    only hold the coordinates, and build the Dot (points, style data,
+    submobjects) the first time they are used as a mobject, e.g. when they
+    are added to a scene or styled. Feeding them into other helpers, as in
+    mag(st(line), mid(line)), never builds a Dot.
+
+    A point's start and end are the point itself.
+    """
+
+    def __init__(self, point=(0, 0, 0), **kwargs):
+        """
+        Initialize a point reference as a regular (materialized) Dot.
+
+        Args:
+            point: Coordinates [x, y] or [x, y, z]
+            **kwargs: Additional arguments passed to Dot (color, radius, etc.)
+        """
+        super().__init__(_as_point(point), **kwargs)
+
+    @classmethod
+    def lazy(cls, point, **kwargs) -> "PointRef":
+        """
+        Create a point reference that builds its Dot only when first used as a mobject.
+
+        Args:
+            point: Coordinates [x, y] or [x, y, z]
+            **kwargs: Arguments for the Dot, applied when it is built
+
+        Returns:
+            A PointRef holding only the coordinates
+
+        Example:
+            >>> p = PointRef.lazy([1, 2])
+            >>> p.materialized  # False
+            >>> p.set_color(RED)  # builds the Dot
+            >>> p.materialized  # True
+        """
+        ref = object.__new__(_LazyPointRef)
+        object.__setattr__(ref, "_point", _as_point(point))
+        object.__setattr__(ref, "_dot_kwargs", kwargs)
+        return ref
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the underlying Dot has been built."""
+        return True
+
+    def get_start(self) -> np.ndarray:
+        """Get the point itself (a point starts where it is)."""
+        return self.get_center()
+
+    def get_end(self) -> np.ndarray:
+        """Get the point itself (a point ends where it is)."""
+        return self.get_center()
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self.get_center(), dtype=dtype)
+
+    def __getitem__(self, index):
+        return self.get_center()[index]
+
+    def __iter__(self):
+        return iter(self.get_center())
+
+    def __len__(self):
+        return 3
+
+    def __add__(self, other):
+        return self.get_center() + np.asarray(other)
+
+    def __radd__(self, other):
+        return np.asarray(other) + self.get_center()
+
+    def __sub__(self, other):
+        return self.get_center() - np.asarray(other)
+
+    def __rsub__(self, other):
+        return np.asarray(other) - self.get_center()
+
+    def __mul__(self, other):
+        return self.get_center() * other
+
+    def __rmul__(self, other):
+        return other * self.get_center()
+
+    def __truediv__(self, other):
+        return self.get_center() / other
+
+    def __neg__(self):
+        return -self.get_center()
+
+    def __repr__(self):
+        x, y, z = self.get_center()
+        return f"PointRef({x:g}, {y:g}, {z:g})"
+
+
+# Attributes a lazy PointRef serves without building its Dot (besides dunders,
+# which numpy and copy probe on the instance)
+_LAZY_ATTRIBUTES = frozenset({"_point", "_dot_kwargs", "materialized", "get_center", "get_start", "get_end"})
+
+
+class _LazyPointRef(PointRef):
+    """A PointRef whose Dot has not been built yet; turns into a plain PointRef on first mobject use."""
+
+    def __getattribute__(self, name):
+        if name not in _LAZY_ATTRIBUTES and not name.startswith("__"):
+            _materialize(self)
+        return object.__getattribute__(self, name)
+
+    @property
+    def materialized(self) -> bool:
+        """Whether the underlying Dot has been built."""
+        return False
+
+    def get_center(self) -> np.ndarray:
+        """Get a copy of the coordinates."""
+        return self._point.copy()
+
+
+def _materialize(ref):
+    """Build the Dot of a lazy PointRef in place."""
+    state = object.__getattribute__(ref, "__dict__")
+    point, kwargs = state.pop("_point"), state.pop("_dot_kwargs")
+    object.__setattr__(ref, "__class__", PointRef)
+    PointRef.__init__(ref, point, **kwargs)
+
+
+def _as_point(point) -> np.ndarray:
+    """Get coordinates as a float array of length 3."""
+    coords = np.zeros(3)
+    values = np.asarray(point, dtype=float)
+    coords[:len(values)] = values
+    return coords
+
+
 class PointUtils:
     """Utility class for point operations on Manim Dot objects."""
 
@@ -53,6 +197,10 @@ class PointUtils:
         if isinstance(point, np.ndarray):
             current_pos = point
             default_kwargs = {}
+        elif isinstance(point, PointRef) and not point.materialized:
+            # Read the coordinates without building the Dot
+            current_pos = point.get_center()
+            default_kwargs = {}
         elif isinstance(point, Dot):
             current_pos = point.get_center()
             # Get default styling from source point
@@ -0,0 +1,245 @@
+"""
+Reactive expressions over the Exp helpers.
+
+rx.<helper>(...) records a call instead of evaluating it, so a construction
+becomes a DAG of Expr nodes whose leaves are source mobjects and
+ValueTrackers. live(expr) evaluates it once and attaches a single updater
+to the resulting mobject. Each refresh polls a checksum of the output's
+sources (the tracker value, or the bytes of the points) and re-evaluates
+only the nodes whose inputs changed, so nodes shared by several outputs are
+evaluated once per change; the new geometry is copied into the existing
+mobject in place. This replaces always_redraw(), which rebuilds every
+helper from scratch each frame.
+"""
+
+import functools
+import itertools
+import weakref
+import numpy as np
+from manim import Mobject, ValueTracker
+from .exp_utils import Exp
+from .point_utils import PointRef
+
+# Update passes; nodes reached twice within one pass are brought up to date once
+_ticks = itertools.count(1)
+
+# Source node of every mobject used in an expression, so shared inputs share one node
+_sources = weakref.WeakKeyDictionary()
+
+
+def _checksum(obj):
+    """Summarize a source's state: a tracker's value, a point's coordinates or a hash of its points."""
+    if isinstance(obj, ValueTracker):
+        return obj.get_value()
+    if isinstance(obj, PointRef):
+        return obj.get_center().tobytes()
+    return hash(obj.get_all_points().tobytes())
+
+
+class _Source:
+    """Leaf node wrapping a mobject or ValueTracker; its value is the object itself."""
+
+    def __init__(self, obj):
+        self.value = obj
+        self.version = 0
+        self.checksum = None
+        self._tick = None
+
+    def update(self, tick) -> int:
+        """Poll the checksum (once per pass) and bump the version if the source changed."""
+        if tick != self._tick:
+            self._tick = tick
+            checksum = _checksum(self.value)
+            if self.version == 0 or not _same(checksum, self.checksum):
+                self.checksum = checksum
+                self.version += 1
+        return self.version
+
+
+def _same(a, b) -> bool:
+    """Compare two checksums (numbers, bytes or arrays)."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return np.array_equal(a, b)
+    return a == b
+
+
+def _node(arg):
+    """Get the DAG node for an argument: Exprs as-is, mobjects as shared sources, anything else None."""
+    if isinstance(arg, Expr):
+        return arg
+    if isinstance(arg, Mobject):
+        source = _sources.get(arg)
+        if source is None:
+            source = _sources[arg] = _Source(arg)
+        return source
+    return None
+
+
+class Expr:
+    """
+    A deferred call of an Exp helper (or any function) in a reactive DAG.
+
+    Arguments may be other Exprs, source mobjects/ValueTrackers (passed to
+    the function as themselves) or constants. The value is recomputed only
+    when the version of one of its inputs changed since the last evaluation.
+
+    Example:
+        >>> a, b, t = Dot(LEFT), Dot(RIGHT), ValueTracker(1)
+        >>> m = rx.mid(rx.ln(a, b))
+        >>> seg = rx.ln(m, rx.pt(rx.val(t), 2))
+        >>> self.add(a, b, live(seg))
+    """
+
+    def __init__(self, func, args=(), kwargs=None):
+        """
+        Initialize a node.
+
+        Args:
+            func: The function to call with the evaluated arguments
+            args: Positional arguments (Exprs, mobjects or constants)
+            kwargs: Keyword arguments (Exprs, mobjects or constants)
+        """
+        self.func = func
+        self.args = [(_node(arg), arg) for arg in args]
+        self.kwargs = {name: (_node(arg), arg) for name, arg in (kwargs or {}).items()}
+        self.inputs = [node for node, _ in self.args + list(self.kwargs.values()) if node is not None]
+        self.value = None
+        self.version = 0
+        self.evaluations = 0
+        self._seen = None
+        self._tick = None
+
+    def update(self, tick=None) -> int:
+        """
+        Bring the node up to date, re-evaluating it only if an input changed.
+
+        Args:
+            tick: Id of the update pass (nodes already updated in this pass
+                are skipped); a new pass is started when None
+
+        Returns:
+            The node's version, which increases with every re-evaluation
+        """
+        if tick is None:
+            tick = next(_ticks)
+        if tick != self._tick:
+            self._tick = tick
+            seen = tuple(node.update(tick) for node in self.inputs)
+            if seen != self._seen:
+                self._seen = seen
+                args = [arg if node is None else node.value for node, arg in self.args]
+                kwargs = {name: arg if node is None else node.value for name, (node, arg) in self.kwargs.items()}
+                self.value = self.func(*args, **kwargs)
+                self.version += 1
+                self.evaluations += 1
+        return self.version
+
+    def get_value(self):
+        """
+        Get the current value, updating the DAG first.
+
+        Example:
+            >>> d = rx.mag(a, b)
+            >>> label.add_updater(lambda m: m.set_value(d.get_value()))
+        """
+        self.update()
+        return self.value
+
+    def __repr__(self):
+        return f"Expr({getattr(self.func, '__name__', self.func)}, version={self.version})"
+
+
+def reactive(func):
+    """
+    Turn a function into a builder of Expr nodes.
+
+    Args:
+        func: Any function of points, mobjects and numbers
+
+    Returns:
+        A function with the same arguments that returns an Expr
+
+    Example:
+        >>> halfway = reactive(lambda a, b: (a.get_center() + b.get_center()) / 2)
+        >>> dot = live(rx.pt(rx.x(halfway(a, b)), 0))
+    """
+    @functools.wraps(func)
+    def build(*args, **kwargs) -> Expr:
+        return Expr(func, args, kwargs)
+    return build
+
+
+class ReactiveExp:
+    """
+    The Exp helpers in reactive form: rx.mid(line) returns an Expr instead of a PointRef.
+
+    Every staticmethod of Exp (x, y, st, ed, mid, mag, ..., cr, graph) is available under the same name.
+    """
+
+
+for _name, _member in vars(Exp).items():
+    if isinstance(_member, staticmethod):
+        setattr(ReactiveExp, _name, staticmethod(reactive(_member.__func__)))
+del _name, _member
+
+rx = ReactiveExp
+
+
+def _assign(target, value):
+    """Copy a freshly evaluated value's geometry into the output mobject in place."""
+    if isinstance(value, PointRef):
+        target.move_to(value.get_center())
+        return
+    if not isinstance(value, Mobject):
+        raise TypeError(f"live() needs an expression that evaluates to a mobject, got {type(value).__name__}")
+    old, new = target.get_family(), value.get_family()
+    if len(old) != len(new):
+        target.become(value)
+        return
+    for mob, fresh in zip(old, new):
+        if mob.points.shape == fresh.points.shape:
+            mob.points[...] = fresh.points
+        else:
+            mob.set_points(fresh.points)
+
+
+def live(expr: Expr) -> Mobject:
+    """
+    Evaluate an expression into a mobject kept up to date by one in-place updater.
+
+    The mobject is the expression's first value, so styling it (color,
+    stroke) sticks: later updates only replace its points. Each frame the
+    updater polls its sources, which is cheap next to re-evaluating, so it
+    also sees sources moved by updaters that ran earlier in the same frame;
+    when none changed, it does nothing else.
+
+    Args:
+        expr: An Expr evaluating to a mobject (Line, Arrow, PointRef, VGroup, ...)
+
+    Returns:
+        The output mobject with its updater attached
+
+    Raises:
+        TypeError: If the expression does not evaluate to a mobject
+
+    Example:
+        >>> a, b = Dot(LEFT), Dot(RIGHT)
+        >>> link = live(rx.ln(rx.mid(a), rx.pt(0, 2))).set_color(YELLOW)
+        >>> self.add(a, b, link)
+        >>> self.play(a.animate.shift(UP))  # only the line through a is re-evaluated
+    """
+    if not isinstance(expr, Expr):
+        raise TypeError(f"live() needs an Expr (build one with rx.<helper>(...)), got {type(expr).__name__}")
+    expr.update()
+    output = expr.value
+    if not isinstance(output, Mobject):
+        raise TypeError(f"live() needs an expression that evaluates to a mobject, got {type(output).__name__}")
+    shown = [expr.version]
+
+    def refresh(mob):
+        if expr.update() != shown[0]:
+            shown[0] = expr.version
+            _assign(mob, expr.value)
+
+    output.add_updater(refresh)
+    return output
@@ -207,7 +207,14 @@ class RogebraScene(MovingCameraScene):
             self.zoom(text)              # Zoom with defaults
             self.zoom(text, 1.0)         # Zoom for 1 second
             self.zoom(text, 0.5, 1.5)    # Zoom for 0.5s with 1.5x width
+
+        Plots created with graph(..., lod=True) are re-sampled while the camera
+        moves, covering only the visible x-interval at the zoomed density.
         """
+        lod_plots = self._lod_plots()
+        for plot in lod_plots:
+            plot.add_updater(self._update_lod)
+
         self.camera.frame.save_state()
         self.play(
             self.camera.frame.animate
@@ -217,6 +224,21 @@ class RogebraScene(MovingCameraScene):
         self.wait(wait_time)
         self.play(Restore(self.camera.frame))
 
+        for plot in lod_plots:
+            plot.remove_updater(self._update_lod)
+            self._update_lod(plot)
+
+    def _lod_plots(self) -> list:
+        """Find plots in the scene that carry a level-of-detail sampler."""
+        return [
+            mob for top in self.mobjects for mob in top.get_family()
+            if getattr(mob, "lod", None) is not None
+        ]
+
+    def _update_lod(self, plot):
+        """Updater re-sampling a level-of-detail plot for the current camera frame."""
+        plot.lod.update(plot, self.camera.frame)
+
     def text(self, mathtext, *args):
         """
         Extract a part from MathTex or create MathTex from string with flexible indexing.
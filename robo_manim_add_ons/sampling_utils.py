@@ -0,0 +1,306 @@
+"""
+Sampling utilities for numeric plots.
+
+Provides vectorized evaluation of lambdified functions, an adaptive,
+asymptote-aware sampler for explicit plots y = f(x), a shared-grid sampler
+for families of explicit plots, and a curvature- and arc-length-adaptive
+sampler for parametric plots.
+"""
+
+import numpy as np
+from typing import List
+
+
+def evaluate(func, *coords) -> np.ndarray:
+    """
+    Evaluate a vectorized function, always returning a float array of the input shape.
+
+    Constant expressions (which lambdify returns as scalars) are broadcast, and
+    complex or undefined results become NaN.
+
+    Args:
+        func: Vectorized callable taking one array per coordinate
+        *coords: Coordinate arrays (all with the same shape)
+
+    Returns:
+        Float array with the same shape as the first coordinate array
+
+    Example:
+        >>> evaluate(lambda x: 2, np.array([0.0, 1.0]))  # array([2., 2.])
+        >>> evaluate(lambda x, y: x * y, xs, ys)
+    """
+    with np.errstate(all="ignore"):
+        values = func(*coords)
+    return _as_real(values, np.shape(coords[0]))
+
+
+def evaluate_components(func, ts):
+    """
+    Evaluate a vector-valued function of one parameter in a single call.
+
+    Args:
+        func: Callable returning a tuple of components, e.g. the result of
+            sympy.lambdify(t, (x_expr, y_expr))
+        ts: Parameter array
+
+    Returns:
+        Tuple of float arrays, one per component, each with the shape of ts
+
+    Example:
+        >>> xs, ys = evaluate_components(lambda t: (np.cos(t), np.sin(t)), ts)
+    """
+    with np.errstate(all="ignore"):
+        values = func(ts)
+    return tuple(_as_real(component, np.shape(ts)) for component in values)
+
+
+def _as_real(values, shape) -> np.ndarray:
+    """Convert lambdify output to a real float array of the given shape (NaN where complex)."""
+    values = np.asarray(values)
+    if np.iscomplexobj(values):
+        values = np.where(np.abs(values.imag) < 1e-12, values.real, np.nan)
+    return np.broadcast_to(values.astype(float, copy=False), shape)
+
+
+def split_runs(xs: np.ndarray, ys: np.ndarray, connect: np.ndarray) -> List[np.ndarray]:
+    """
+    Split samples into polylines wherever consecutive samples are not connected.
+
+    Args:
+        xs: Sample x-coordinates, shape (N,)
+        ys: Sample y-coordinates, shape (N,)
+        connect: Boolean array of shape (N - 1,); connect[i] joins samples i and i + 1
+
+    Returns:
+        List of (M, 2) polylines with at least two samples each
+    """
+    breaks = np.flatnonzero(~connect) + 1
+    pieces = np.split(np.arange(len(xs)), breaks)
+    return [np.column_stack([xs[p], ys[p]]) for p in pieces if len(p) >= 2]
+
+
+def sample_explicit(func, x_range, y_range=None, samples=65, tolerance=1e-3, max_depth=10, jump_threshold=0.05) -> List[np.ndarray]:
+    """
+    Adaptively sample y = f(x), splitting at asymptotes, jumps and undefined regions.
+
+    The function is evaluated on a uniform grid in one vectorized call, then
+    intervals are bisected (again vectorized, one call per level) only where the
+    midpoint deviates from the chord by more than `tolerance`, or where the
+    function becomes undefined. Smooth regions therefore keep the coarse
+    spacing while asymptotes are resolved down to the finest level.
+
+    Samples are split into separate polylines:
+        - around non-finite values (poles, log of negatives, ...)
+        - across finest-level intervals whose jump exceeds `jump_threshold`
+          (sign-flip asymptotes like tan(x), step discontinuities)
+        - where the curve leaves the view band (one y-span above/below y_range)
+
+    Args:
+        func: Vectorized callable f(x)
+        x_range: [x_min, x_max]
+        y_range: Optional [y_min, y_max] of the view; used to scale the
+            tolerance and to drop parts of the curve far outside the view
+        samples: Initial uniform sample count (default 65)
+        tolerance: Allowed midpoint-to-chord deviation as a fraction of the
+            y-span of the view (default 1e-3)
+        max_depth: Maximum number of bisection levels (default 10)
+        jump_threshold: Jump across a finest-level interval, as a fraction of
+            the y-span, treated as a discontinuity (default 0.05)
+
+    Returns:
+        List of (N, 2) arrays of (x, y) samples, one per continuous piece
+
+    Example:
+        >>> pieces = sample_explicit(np.tan, [-5, 5], [-5, 5])
+        >>> len(pieces)  # 4 branches between the asymptotes
+    """
+    x_min, x_max = float(x_range[0]), float(x_range[1])
+    xs = np.linspace(x_min, x_max, max(int(samples), 2))
+    ys = evaluate(func, xs).copy()
+
+    y_scale, band_lo, band_hi = _view_scale(ys, y_range)
+    min_step = (xs[1] - xs[0]) / 2 ** int(max_depth)
+
+    # Bisect active intervals one level at a time
+    active = np.arange(len(xs) - 1)
+    for _ in range(int(max_depth)):
+        if len(active) == 0:
+            break
+        x0, x1 = xs[active], xs[active + 1]
+        y0, y1 = ys[active], ys[active + 1]
+        xm = (x0 + x1) / 2
+        ym = evaluate(func, xm)
+
+        f0, f1, fm = np.isfinite(y0), np.isfinite(y1), np.isfinite(ym)
+        all_finite = f0 & f1 & fm
+        mixed = (f0 != f1) | (fm != f0) | (fm != f1)
+        with np.errstate(invalid="ignore"):
+            deviation = np.abs(ym - (y0 + y1) / 2) / y_scale
+            # Parts of the curve entirely above or below the view band are invisible
+            hidden = ((y0 > band_hi) & (y1 > band_hi) & (ym > band_hi)) | \
+                     ((y0 < band_lo) & (y1 < band_lo) & (ym < band_lo))
+        need = mixed | (all_finite & ~hidden & (deviation > tolerance))
+
+        split = active[need]
+        if len(split) == 0:
+            break
+        xs = np.insert(xs, split + 1, xm[need])
+        ys = np.insert(ys, split + 1, ym[need])
+        # Inserted samples land at split + 1 + k; both halves stay active
+        inserted = split + 1 + np.arange(len(split))
+        active = np.concatenate([inserted - 1, inserted])
+        active.sort()
+
+    # Decide which consecutive samples are joined
+    finite = np.isfinite(ys)
+    with np.errstate(invalid="ignore"):
+        in_band = finite & (ys >= band_lo) & (ys <= band_hi)
+        finest = np.diff(xs) <= min_step * 1.5
+        jump = finest & (np.abs(np.diff(ys)) > jump_threshold * y_scale)
+
+    return split_runs(xs, ys, _connect_mask(finite, in_band, jump))
+
+
+def sample_shared_grid(func, x_range, y_range=None, samples=257) -> List[List[np.ndarray]]:
+    """
+    Sample several explicit functions over one shared uniform x-grid.
+
+    `func` returns all curves at once (e.g. sympy.lambdify(x, [f1, f2, ...])),
+    so the whole family is evaluated in a single vectorized call. Each curve
+    is split around undefined values and where it leaves the view band.
+
+    Args:
+        func: Callable x -> sequence of y arrays (one per curve)
+        x_range: [x_min, x_max]
+        y_range: Optional [y_min, y_max] of the view
+        samples: Number of grid points (default 257)
+
+    Returns:
+        One list of (N, 2) polylines per curve
+
+    Example:
+        >>> sin_pieces, cos_pieces = sample_shared_grid(lambda x: (np.sin(x), np.cos(x)), [-4, 4])
+    """
+    xs = np.linspace(float(x_range[0]), float(x_range[1]), max(int(samples), 2))
+    no_jump = np.zeros(len(xs) - 1, dtype=bool)
+    curves = []
+    for ys in evaluate_components(func, xs):
+        _, band_lo, band_hi = _view_scale(ys, y_range)
+        finite = np.isfinite(ys)
+        with np.errstate(invalid="ignore"):
+            in_band = finite & (ys >= band_lo) & (ys <= band_hi)
+        curves.append(split_runs(xs, ys, _connect_mask(finite, in_band, no_jump)))
+    return curves
+
+
+def _connect_mask(finite: np.ndarray, in_band: np.ndarray, jump: np.ndarray) -> np.ndarray:
+    """
+    Decide which consecutive samples are joined by a segment.
+
+    Samples inside the view band are kept, plus one finite sample beyond the
+    band on each side so the curve runs off view. Segments across jumps and
+    between two samples outside the band are dropped.
+    """
+    keep = in_band.copy()
+    keep[1:] |= in_band[:-1] & finite[1:]
+    keep[:-1] |= in_band[1:] & finite[:-1]
+    return keep[:-1] & keep[1:] & (in_band[:-1] | in_band[1:]) & ~jump
+
+
+def _view_scale(values: np.ndarray, view_range):
+    """Get (scale, band_lo, band_hi) for one coordinate from the view range or the samples."""
+    if view_range is not None:
+        lo, hi = float(view_range[0]), float(view_range[1])
+        scale = max(hi - lo, 1e-12)
+        return scale, lo - scale, hi + scale
+    finite = values[np.isfinite(values)]
+    if len(finite) > 1:
+        lo, hi = np.percentile(finite, [5, 95])
+        return max(hi - lo, 1.0), -np.inf, np.inf
+    return 1.0, -np.inf, np.inf
+
+
+def sample_parametric(func, t_range, x_range=None, y_range=None, samples=65, tolerance=1e-3, max_chord=0.1,
+                      max_depth=10, jump_threshold=0.05) -> List[np.ndarray]:
+    """
+    Adaptively sample a parametric curve (x(t), y(t)) by curvature and arc length.
+
+    Both components are evaluated together over one NumPy t array per
+    refinement level. An interval is bisected when its midpoint strays from the
+    chord midpoint by more than `tolerance` (curvature, or uneven parameter
+    speed) or when its chord is longer than `max_chord` (arc length), both
+    measured in view units where the x- and y-span each have length 1. Tight
+    spirals and Lissajous figures therefore get dense samples only where they
+    bend, without a globally tiny t step.
+
+    Args:
+        func: Callable t -> (x, y), e.g. sympy.lambdify(t, (x_expr, y_expr))
+        t_range: [t_min, t_max]
+        x_range: Optional [x_min, x_max] of the view (scales tolerance, culls off-view parts)
+        y_range: Optional [y_min, y_max] of the view
+        samples: Initial uniform sample count (default 65)
+        tolerance: Allowed midpoint deviation in view units (default 1e-3)
+        max_chord: Longest allowed segment in view units (default 0.1)
+        max_depth: Maximum number of bisection levels (default 10)
+        jump_threshold: Finest-level jump, in view units, treated as a
+            discontinuity (default 0.05)
+
+    Returns:
+        List of (N, 2) arrays of (x, y) samples, one per continuous piece
+
+    Example:
+        >>> func = lambda t: (np.cos(3 * t), np.sin(2 * t))
+        >>> pieces = sample_parametric(func, [0, 2 * np.pi], [-1, 1], [-1, 1])
+    """
+    t_min, t_max = float(t_range[0]), float(t_range[1])
+    ts = np.linspace(t_min, t_max, max(int(samples), 2))
+    xs, ys = evaluate_components(func, ts)
+    xs, ys = xs.copy(), ys.copy()
+
+    x_scale, x_lo, x_hi = _view_scale(xs, x_range)
+    y_scale, y_lo, y_hi = _view_scale(ys, y_range)
+    min_step = (ts[1] - ts[0]) / 2 ** int(max_depth)
+
+    def outside(px, py):
+        # Per-point side of the view band: 1/2 left/right, 4/8 below/above
+        return ((px < x_lo) * 1 + (px > x_hi) * 2 + (py < y_lo) * 4 + (py > y_hi) * 8)
+
+    active = np.arange(len(ts) - 1)
+    for _ in range(int(max_depth)):
+        if len(active) == 0:
+            break
+        tm = (ts[active] + ts[active + 1]) / 2
+        xm, ym = evaluate_components(func, tm)
+        x0, x1 = xs[active], xs[active + 1]
+        y0, y1 = ys[active], ys[active + 1]
+
+        f0 = np.isfinite(x0) & np.isfinite(y0)
+        f1 = np.isfinite(x1) & np.isfinite(y1)
+        fm = np.isfinite(xm) & np.isfinite(ym)
+        all_finite = f0 & f1 & fm
+        mixed = (f0 != f1) | (fm != f0) | (fm != f1)
+        with np.errstate(invalid="ignore"):
+            deviation = np.hypot((xm - (x0 + x1) / 2) / x_scale, (ym - (y0 + y1) / 2) / y_scale)
+            chord = np.hypot((x1 - x0) / x_scale, (y1 - y0) / y_scale)
+            # Intervals whose three points all lie beyond the same side of the band are invisible
+            hidden = (outside(x0, y0) & outside(x1, y1) & outside(xm, ym)) != 0
+        need = mixed | (all_finite & ~hidden & ((deviation > tolerance) | (chord > max_chord)))
+
+        split = active[need]
+        if len(split) == 0:
+            break
+        ts = np.insert(ts, split + 1, tm[need])
+        xs = np.insert(xs, split + 1, xm[need])
+        ys = np.insert(ys, split + 1, ym[need])
+        inserted = split + 1 + np.arange(len(split))
+        active = np.concatenate([inserted - 1, inserted])
+        active.sort()
+
+    finite = np.isfinite(xs) & np.isfinite(ys)
+    with np.errstate(invalid="ignore"):
+        in_band = finite & (xs >= x_lo) & (xs <= x_hi) & (ys >= y_lo) & (ys <= y_hi)
+        finest = np.diff(ts) <= min_step * 1.5
+        step = np.hypot(np.diff(xs) / x_scale, np.diff(ys) / y_scale)
+        jump = finest & (step > jump_threshold)
+
+    return split_runs(xs, ys, _connect_mask(finite, in_band, jump))
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the position coercion in exp_utils.
+
+Times x(), mag() and ln() on Dots, numpy arrays and lists, and the
+get_start() dispatch behind st() on a Line, against the previous
+implementation (each helper with its own chain of hasattr/isinstance
+checks), and prints the per-call time of each. The shared layer runs the
+same checks behind one extra function call, so on bare arrays it is a call
+slower; on Mobjects their own get_center() dominates either way.
+
+Usage:
+    python scripts/bench_exp_coercion.py [--number 20000]
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+from manim import Dot, Line, RED
+
+from robo_manim_add_ons.exp_utils import x, mag, ln, _coords
+
+
+# Previous implementation, kept here only for comparison
+
+def _legacy_x(obj):
+    if hasattr(obj, 'get_center'):
+        return obj.get_center()[0]
+    elif isinstance(obj, np.ndarray):
+        return float(obj[0])
+    elif isinstance(obj, (list, tuple)):
+        return float(obj[0])
+    raise TypeError(type(obj).__name__)
+
+
+def _legacy_start(obj):
+    # The coordinate extraction of the old st(); both versions then wrap the
+    # point (a Dot before, a lazy PointRef now), which is left out of the timing
+    if hasattr(obj, 'get_start'):
+        return obj.get_start()
+    elif isinstance(obj, np.ndarray):
+        return obj
+    elif isinstance(obj, (list, tuple)):
+        return np.array(obj)
+    raise TypeError(type(obj).__name__)
+
+
+def _start(obj):
+    return _coords(obj, "get_start")
+
+
+def _legacy_mag(*args):
+    def _extract_position(obj):
+        if hasattr(obj, 'get_center'):
+            return obj.get_center()
+        elif isinstance(obj, np.ndarray):
+            return obj
+        elif isinstance(obj, (list, tuple)):
+            return np.array(obj)
+        raise TypeError(type(obj).__name__)
+
+    if len(args) == 1:
+        obj = args[0]
+        if hasattr(obj, 'get_length'):
+            return obj.get_length()
+        elif isinstance(obj, np.ndarray):
+            return float(np.linalg.norm(obj))
+        elif isinstance(obj, (list, tuple)):
+            return float(np.linalg.norm(np.array(obj)))
+        raise TypeError(type(obj).__name__)
+    return float(np.linalg.norm(_extract_position(args[1]) - _extract_position(args[0])))
+
+
+def _legacy_ln(*args):
+    def _is_object(arg):
+        return hasattr(arg, 'get_center') or isinstance(arg, np.ndarray)
+
+    def _is_number(arg):
+        return isinstance(arg, (int, float))
+
+    def _extract_position(obj):
+        if hasattr(obj, 'get_center'):
+            return obj.get_center()
+        elif isinstance(obj, np.ndarray):
+            return obj
+        raise TypeError(type(obj).__name__)
+
+    if len(args) == 3 and _is_object(args[0]) and _is_number(args[1]) and _is_number(args[2]):
+        return Line(_extract_position(args[0]), np.array([args[1], args[2], 0]), color=RED)
+    return Line(_extract_position(args[0]), _extract_position(args[1]), color=RED)
+
+
+class _Point:
+    """Minimal object with get_center(), so the timing shows the dispatch rather than Manim's bookkeeping."""
+
+    def __init__(self, center):
+        self.center = center
+
+    def get_center(self):
+        return self.center
+
+
+def _time(func, args, number):
+    """Best per-call time in nanoseconds over seven runs."""
+    return min(timeit.repeat(lambda: func(*args), number=number, repeat=7)) / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20000, help="calls per timing run")
+    options = parser.parse_args()
+
+    dot = Dot(np.array([1.0, 2.0, 0.0]))
+    line = Line(np.array([0.0, 0.0, 0.0]), np.array([3.0, 4.0, 0.0]))
+    array = np.array([1.0, 2.0, 0.0])
+    cases = [
+        ("x(Dot)", _legacy_x, x, (dot,)),
+        ("x(plain object)", _legacy_x, x, (_Point(array),)),
+        ("x(ndarray)", _legacy_x, x, (array,)),
+        ("x(list)", _legacy_x, x, ([1.0, 2.0, 0.0],)),
+        ("st(Line) dispatch", _legacy_start, _start, (line,)),
+        ("mag(ndarray)", _legacy_mag, mag, (array,)),
+        ("mag(Dot, ndarray)", _legacy_mag, mag, (dot, array)),
+        ("mag(list, list)", _legacy_mag, mag, ([0.0, 0.0, 0.0], [3.0, 4.0, 0.0])),
+        ("ln(Dot, x, y)", _legacy_ln, ln, (dot, 1.0, 2.0)),
+    ]
+
+    print(f"{'call':<22}{'before (ns)':>13}{'after (ns)':>13}{'speedup':>10}")
+    for name, before, after, args in cases:
+        t_before = _time(before, args, options.number)
+        t_after = _time(after, args, options.number)
+        print(f"{name:<22}{t_before:>13.0f}{t_after:>13.0f}{t_before / t_after:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -398,3 +398,60 @@ class TestDistanceMarkerIntegration:
 
         # Both should have same number of elements
         assert len(marker1) == len(marker2)
+
+
+class TestHatchedRegion:
+    """Tests for hatched_region function"""
+
+    def test_single_vmobject(self):
+        """Test that the hatch pattern is one VMobject with a subpath per segment"""
+        from manim import Axes
+        from robo_manim_add_ons.annotation_utils import hatched_region
+        from robo_manim_add_ons.hatch_utils import hatch_segments
+
+        axes = Axes(x_range=[0, 10, 1], y_range=[0, 10, 1])
+        vertices = [(2, 2), (8, 2), (8, 6), (2, 6)]
+        hatched, boundary = hatched_region(axes, vertices, spacing=0.5, direction="|")
+
+        segments = hatch_segments([vertices], spacing=0.5, direction="|", anchor=(0, 0))
+        assert len(hatched.submobjects) == 0
+        assert len(hatched.points) == 4 * len(segments)
+
+        # Straight Bézier segments mapped through the axes
+        quads = hatched.points.reshape(-1, 4, 3)
+        np.testing.assert_allclose(quads[0, 0], axes.c2p(*segments[0, 0]))
+        np.testing.assert_allclose(quads[0, 3], axes.c2p(*segments[0, 1]))
+        np.testing.assert_allclose(quads[:, 1], quads[:, 0] + (quads[:, 3] - quads[:, 0]) / 3)
+
+    def test_translated_and_scaled_regions_share_cache(self):
+        """Test that moved and enlarged copies of a region reuse the hatch cache"""
+        from manim import Axes
+        from robo_manim_add_ons.annotation_utils import hatched_region
+        from robo_manim_add_ons.hatch_utils import clear_hatch_cache, hatch_cache_info
+
+        axes = Axes(x_range=[0, 10, 1], y_range=[0, 10, 1])
+        clear_hatch_cache()
+        hatched_region(axes, [(1, 1), (3, 1), (2, 3)], spacing=0.3)
+        hatched_region(axes, [(5.5, 2), (7.5, 2), (6.5, 4)], spacing=0.3)
+        hatched_region(axes, [(1, 4), (5, 4), (3, 8)], spacing=0.3)
+
+        assert hatch_cache_info()["hits"] == 2
+
+    def test_holes(self):
+        """Test that holes are cut out of the pattern and outlined on the boundary"""
+        from manim import Axes
+        from robo_manim_add_ons.annotation_utils import hatched_region
+
+        axes = Axes(x_range=[0, 10, 1], y_range=[0, 10, 1])
+        outer = [(2, 2), (8, 2), (8, 8), (2, 8)]
+        hole = [(4.2, 4.2), (5.8, 4.2), (5.8, 5.8), (4.2, 5.8)]
+        with patch('robo_manim_add_ons.annotation_utils.Polygon') as mock_polygon:
+            solid, _ = hatched_region(axes, outer, spacing=0.5, direction="-")
+            framed, boundary = hatched_region(axes, outer, spacing=0.5, direction="-", holes=[hole])
+
+            # The outline's Polygon gets the hole's outline added to it
+            boundary.add.assert_called_once()
+            assert mock_polygon.call_count == 3
+
+        # Lines at y = 4.5, 5 and 5.5 are split in two
+        assert len(framed.points) == len(solid.points) + 4 * 3
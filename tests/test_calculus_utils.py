@@ -0,0 +1,136 @@
+"""
+Tests for calculus_utils module.
+"""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from robo_manim_add_ons.calculus_utils import CalculusUtils, brent, roots, extrema, derivative, tangent, area
+from robo_manim_add_ons.graph_utils import GraphUtils
+
+
+class TestBrent:
+    """Tests for the vectorized Brent solver"""
+
+    def test_many_brackets_at_once(self):
+        """Test that every bracket converges to its own root"""
+        a = np.array([3.0, 6.0, -0.5])
+        b = np.array([3.5, 6.5, 0.5])
+        np.testing.assert_allclose(brent(np.sin, a, b), [np.pi, 2 * np.pi, 0.0], atol=1e-12)
+
+    def test_known_endpoint_values(self):
+        """Test that passing fa/fb gives the same result without re-evaluating the ends"""
+        calls = []
+
+        def func(x):
+            calls.append(len(x))
+            return x ** 2 - 2
+
+        root = brent(func, [1.0], [2.0], fa=[-1.0], fb=[2.0])
+        assert root[0] == pytest.approx(np.sqrt(2), abs=1e-12)
+        assert all(n == 1 for n in calls)
+
+
+class TestRoots:
+    """Tests for roots()"""
+
+    def test_cubic_roots_from_plot_samples(self):
+        """Test roots of a cubic plotted by graph()"""
+        _, plot = GraphUtils.graph("x**3 - x", sampling="adaptive")
+        np.testing.assert_allclose(roots(plot), [-1.0, 0.0, 1.0], atol=1e-10)
+
+    def test_poles_are_not_roots(self):
+        """Test that sign changes across poles of tan(x) are discarded"""
+        found = roots(np.tan, x_range=[-2, 2], samples=400)
+        np.testing.assert_allclose(found, [0.0], atol=1e-10)
+
+    def test_x_range_restricts_search(self):
+        """Test that only roots inside x_range are returned"""
+        found = roots(np.sin, x_range=[1, 7])
+        np.testing.assert_allclose(found, [np.pi, 2 * np.pi], atol=1e-10)
+
+    def test_no_roots(self):
+        """Test that a function without sign changes returns an empty array"""
+        assert len(roots(lambda x: x ** 2 + 1, x_range=[-3, 3])) == 0
+
+    def test_requires_range_without_samples(self):
+        """Test that a bare callable needs an x_range"""
+        with pytest.raises(ValueError):
+            roots(np.sin)
+
+    def test_rejects_non_callable(self):
+        """Test that objects without a function raise TypeError"""
+        with pytest.raises(TypeError):
+            roots(SimpleNamespace(), x_range=[0, 1])
+
+
+class TestExtrema:
+    """Tests for extrema()"""
+
+    def test_cubic_extrema(self):
+        """Test the local max and min of x**3 - 3x"""
+        found = extrema(lambda x: x ** 3 - 3 * x, x_range=[-3, 3])
+        assert [kind for _, _, kind in found] == ["max", "min"]
+        np.testing.assert_allclose([x for x, _, _ in found], [-1.0, 1.0], atol=1e-6)
+        np.testing.assert_allclose([y for _, y, _ in found], [2.0, -2.0], atol=1e-9)
+
+    def test_cosine_extrema(self):
+        """Test that extrema of cos(x) alternate between max and min"""
+        found = extrema(np.cos, x_range=[-1, 7])
+        np.testing.assert_allclose([x for x, _, _ in found], [0.0, np.pi, 2 * np.pi], atol=1e-6)
+        assert [kind for _, _, kind in found] == ["max", "min", "max"]
+
+    def test_monotonic_has_no_extrema(self):
+        """Test that a monotonic function has no extrema"""
+        assert extrema(np.exp, x_range=[-2, 2]) == []
+
+
+class TestDerivative:
+    """Tests for derivative()"""
+
+    def test_central_difference(self):
+        """Test first derivative of sin by central differences"""
+        xs = np.linspace(-3, 3, 7)
+        np.testing.assert_allclose(derivative(np.sin, xs), np.cos(xs), atol=1e-9)
+
+    def test_complex_step(self):
+        """Test that the complex-step derivative is exact to rounding"""
+        xs = np.linspace(-3, 3, 7)
+        np.testing.assert_allclose(derivative(np.sin, xs, method="complex"), np.cos(xs), atol=1e-15)
+
+    def test_second_derivative(self):
+        """Test the second derivative of x**3"""
+        assert derivative(lambda x: x ** 3, 2.0, order=2) == pytest.approx(12.0, rel=1e-5)
+
+    def test_scalar_in_scalar_out(self):
+        """Test that a scalar x gives a scalar result"""
+        assert np.ndim(derivative(np.sin, 0.0)) == 0
+
+    def test_invalid_arguments(self):
+        """Test that unknown methods and orders raise ValueError"""
+        with pytest.raises(ValueError):
+            derivative(np.sin, 0.0, method="forward")
+        with pytest.raises(ValueError):
+            derivative(np.sin, 0.0, order=3)
+        with pytest.raises(ValueError):
+            derivative(np.sin, 0.0, order=2, method="complex")
+
+
+class TestTangentAndArea:
+    """Tests for tangent() and area()"""
+
+    def test_tangent_line(self):
+        """Test the tangent of x**2 at x = 1"""
+        slope, intercept = tangent(lambda x: x ** 2, 1.0)
+        assert slope == pytest.approx(2.0)
+        assert intercept == pytest.approx(-1.0)
+
+    def test_simpson_area(self):
+        """Test that Simpson's rule integrates polynomials up to degree 3 exactly"""
+        assert area(lambda x: x ** 2, 0, 3) == pytest.approx(9.0, abs=1e-12)
+        assert area(lambda x: x ** 3, -1, 2, intervals=2) == pytest.approx(3.75, abs=1e-12)
+
+    def test_area_of_plot(self):
+        """Test area under a plot from graph()"""
+        _, plot = GraphUtils.graph("sin(x)", x_range=[0, 4])
+        assert CalculusUtils.area(plot, 0, np.pi) == pytest.approx(2.0, abs=1e-10)
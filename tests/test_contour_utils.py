@@ -0,0 +1,149 @@
+"""
+Tests for contour_utils module.
+"""
+
+import pytest
+import numpy as np
+from robo_manim_add_ons.contour_utils import marching_squares, stitch_segments, tile_ranges
+
+
+class TestMarchingSquares:
+    """Tests for marching_squares function"""
+
+    def test_circle_is_single_closed_loop(self):
+        """Test that a circle is traced as one closed polyline"""
+        polylines = marching_squares(lambda x, y: x**2 + y**2 - 4, [-5, 5], [-5, 5])
+
+        assert len(polylines) == 1
+        loop = polylines[0]
+        np.testing.assert_allclose(loop[0], loop[-1])
+
+    def test_circle_points_on_curve(self):
+        """Test that traced points lie on the curve"""
+        polylines = marching_squares(lambda x, y: x**2 + y**2 - 4, [-5, 5], [-5, 5])
+
+        radii = np.hypot(polylines[0][:, 0], polylines[0][:, 1])
+        np.testing.assert_allclose(radii, 2.0, atol=1e-3)
+
+    def test_hyperbola_has_two_open_branches(self):
+        """Test that curves leaving the domain become open polylines"""
+        polylines = marching_squares(lambda x, y: x**2 - y**2 - 1, [-5, 5], [-5, 5])
+
+        assert len(polylines) == 2
+        for branch in polylines:
+            assert not np.allclose(branch[0], branch[-1])
+            assert np.isclose(abs(branch[0][0]), 5.0)
+
+    def test_refinement_increases_density(self):
+        """Test that deeper refinement yields more samples"""
+        func = lambda x, y: x**2 + y**2 - 4
+        coarse = marching_squares(func, [-5, 5], [-5, 5], resolution=32, refine_depth=0)
+        fine = marching_squares(func, [-5, 5], [-5, 5], resolution=32, refine_depth=3)
+
+        assert len(fine[0]) > 4 * len(coarse[0])
+
+    def test_no_curve_in_domain(self):
+        """Test that a curve outside the domain yields no polylines"""
+        polylines = marching_squares(lambda x, y: x**2 + y**2 + 1, [-5, 5], [-5, 5])
+        assert polylines == []
+
+    def test_constant_function(self):
+        """Test that scalar results from lambdify are broadcast"""
+        polylines = marching_squares(lambda x, y: 1, [-5, 5], [-5, 5])
+        assert polylines == []
+
+    def test_undefined_region_skipped(self):
+        """Test that NaN regions do not produce segments"""
+        polylines = marching_squares(lambda x, y: np.sqrt(x) - y, [-5, 5], [-5, 5])
+
+        assert len(polylines) == 1
+        assert polylines[0][:, 0].min() >= 0
+
+    def test_poles_are_not_traced(self):
+        """Test that sign changes through the poles of tan(x) give no vertical segments"""
+        polylines = marching_squares(lambda x, y: y - np.tan(x), [-3, 3], [-3, 3])
+
+        assert len(polylines) == 3
+        for branch in polylines:
+            np.testing.assert_allclose(branch[:, 1], np.tan(branch[:, 0]), atol=1e-2)
+            assert np.all(np.abs(np.abs(branch[:, 0]) - np.pi / 2) > 1e-3)
+
+    def test_pole_of_hyperbola_skipped(self):
+        """Test that 1/x - y keeps both branches and drops the jump at x = 0"""
+        polylines = marching_squares(lambda x, y: 1 / x - y, [-3, 3], [-3, 3])
+
+        assert len(polylines) == 2
+        for branch in polylines:
+            assert np.all(np.sign(branch[:, 0]) == np.sign(branch[0, 0]))
+
+    def test_invalid_resolution(self):
+        """Test that a non-positive resolution raises ValueError"""
+        with pytest.raises(ValueError):
+            marching_squares(lambda x, y: x + y, [-1, 1], [-1, 1], resolution=0)
+
+
+class TestStitchSegments:
+    """Tests for stitch_segments function"""
+
+    def test_chain_is_joined_in_order(self):
+        """Test that shuffled segments are joined into one polyline"""
+        ids = np.array([[1, 2], [0, 1], [2, 3]])
+        points = np.array([
+            [[1, 0], [2, 0]],
+            [[0, 0], [1, 0]],
+            [[2, 0], [3, 0]],
+        ], dtype=float)
+
+        polylines = stitch_segments(ids, points)
+
+        assert len(polylines) == 1
+        xs = polylines[0][:, 0]
+        assert list(xs) in ([0, 1, 2, 3], [3, 2, 1, 0])
+
+    def test_empty(self):
+        """Test that no segments give no polylines"""
+        assert stitch_segments(np.zeros((0, 2), dtype=int), np.zeros((0, 2, 2))) == []
+
+
+class TestTiledContouring:
+    """Tests for tiled and chunked contouring"""
+
+    def test_tiles_cover_grid(self):
+        """Test that tiles partition the coarse grid"""
+        ranges = tile_ranges((10, 7), (3, 2))
+
+        assert len(ranges) == 6
+        covered = np.zeros((10, 7), dtype=int)
+        for i0, i1, j0, j1 in ranges:
+            covered[i0:i1, j0:j1] += 1
+        assert (covered == 1).all()
+
+    def test_tiled_matches_untiled(self):
+        """Test that tile seams merge into the same polylines as one pass"""
+        func = lambda x, y: x**4 + y**4 - 3 * x * y - 1
+        whole = marching_squares(func, [-3, 3], [-3, 3], resolution=32)
+        tiled = marching_squares(func, [-3, 3], [-3, 3], resolution=32, tiles=(3, 4))
+
+        assert len(tiled) == len(whole)
+        assert sorted(len(p) for p in tiled) == sorted(len(p) for p in whole)
+        np.testing.assert_array_equal(np.unique(np.vstack(tiled), axis=0), np.unique(np.vstack(whole), axis=0))
+
+    def test_circle_across_seams_stays_closed(self):
+        """Test that a circle crossing every tile is a single closed loop"""
+        polylines = marching_squares(lambda x, y: x**2 + y**2 - 4, [-3, 3], [-3, 3], tiles=4)
+
+        assert len(polylines) == 1
+        np.testing.assert_array_equal(polylines[0][0], polylines[0][-1])
+
+    def test_chunked_evaluation_bounded(self):
+        """Test that chunk_size limits the points per call without changing the result"""
+        sizes = []
+
+        def func(x, y):
+            sizes.append(np.size(x))
+            return x**2 + y**2 - 4
+        chunked = marching_squares(func, [-3, 3], [-3, 3], chunk_size=500)
+        whole = marching_squares(lambda x, y: x**2 + y**2 - 4, [-3, 3], [-3, 3])
+
+        assert max(sizes) <= 500
+        np.testing.assert_array_equal(chunked[0], whole[0])
@@ -0,0 +1,179 @@
+"""
+Tests for disk_cache_utils module.
+"""
+
+import os
+import time
+import pytest
+import numpy as np
+from unittest.mock import patch
+from robo_manim_add_ons.disk_cache_utils import DiskSampleCache, pack_polylines, unpack_polylines
+from robo_manim_add_ons.graph_utils import GraphUtils
+
+
+class TestPackPolylines:
+    """Tests for pack_polylines and unpack_polylines"""
+
+    def test_round_trip(self):
+        """Test that polylines survive packing and unpacking"""
+        lines = [np.array([[0.0, 0.0], [1.0, 1.0]]), np.array([[2.0, 0.0], [3.0, 1.0], [4.0, 0.0]])]
+        unpacked = unpack_polylines(pack_polylines(lines))
+
+        assert len(unpacked) == 2
+        for original, restored in zip(lines, unpacked):
+            np.testing.assert_array_equal(original, restored)
+
+    def test_empty(self):
+        """Test that an empty plot round-trips"""
+        assert unpack_polylines(pack_polylines([])) == []
+
+
+class TestDiskSampleCache:
+    """Tests for DiskSampleCache"""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Test that stored polylines are returned from a memory-mapped file"""
+        cache = DiskSampleCache(tmp_path)
+        key = ("explicit", ("sin(x)",), (-5.0, 5.0))
+        assert cache.get(key) is None
+
+        cache.put(key, [np.array([[0.0, 1.0], [2.0, 3.0]])])
+        lines = cache.get(key)
+
+        np.testing.assert_array_equal(lines[0], [[0.0, 1.0], [2.0, 3.0]])
+        assert isinstance(lines[0], np.memmap)
+        info = cache.info()
+        assert (info["hits"], info["misses"], info["writes"], info["entries"]) == (1, 1, 1, 1)
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test that a new cache object sees entries written by another"""
+        DiskSampleCache(tmp_path).put("key", [np.zeros((3, 2))])
+        assert DiskSampleCache(tmp_path).get("key") is not None
+
+    def test_size_cap_evicts_oldest(self, tmp_path):
+        """Test that least recently used entries are deleted beyond max_bytes"""
+        line = [np.zeros((100, 2))]
+        cache = DiskSampleCache(tmp_path, max_bytes=10**9)
+        cache.put("a", line)
+        entry_size = cache.info()["bytes"]
+
+        cache.max_bytes = 2 * entry_size
+        os.utime(cache._path("a"), (time.time() - 100, time.time() - 100))
+        cache.put("b", line)
+        cache.put("c", line)
+
+        assert cache.info()["entries"] == 2
+        assert cache.info()["evictions"] == 1
+        assert cache.get("a") is None
+
+    def test_resize_evicts_down_to_new_cap(self, tmp_path):
+        """Test that lowering the cap with resize() evicts old entries right away"""
+        cache = DiskSampleCache(tmp_path)
+        cache.put("a", [np.zeros((100, 2))])
+        os.utime(cache._path("a"), (time.time() - 100, time.time() - 100))
+        cache.put("b", [np.zeros((100, 2))])
+
+        cache.resize(cache.info()["bytes"] // 2)
+        assert cache.info()["entries"] == 1
+        assert cache.get("b") is not None
+        with pytest.raises(ValueError):
+            cache.resize(-1)
+
+    def test_disabled_does_nothing(self, tmp_path):
+        """Test that a disabled cache neither reads nor writes"""
+        cache = DiskSampleCache(tmp_path, enabled=False)
+        cache.put("key", [np.zeros((2, 2))])
+
+        assert cache.get("key") is None
+        assert cache.info()["entries"] == 0
+
+    def test_clear_and_report(self, tmp_path):
+        """Test clear() and the one-line report"""
+        cache = DiskSampleCache(tmp_path)
+        cache.put("key", [np.zeros((2, 2))])
+        cache.get("key")
+        assert "1 hits" in cache.report()
+
+        cache.clear()
+        assert cache.info()["entries"] == 0
+        assert cache.info()["hits"] == 0
+
+
+class _GridAxes:
+    """Axes stand-in whose plot() evaluates the function on a fixed grid, like axes.plot()."""
+
+    x_range = [-1.0, 1.0, 0.5]
+
+    def plot(self, function, x_range, **kwargs):
+        xs = np.linspace(x_range[0], x_range[1], 9)
+        return [(x, function(x)) for x in xs]
+
+
+class TestGraphDiskCache:
+    """Tests for the persistent cache in GraphUtils"""
+
+    @pytest.fixture(autouse=True)
+    def disk_cache(self, tmp_path):
+        """Enable the disk cache in a temporary directory for each test."""
+        GraphUtils.configure_disk_cache(enabled=True, directory=tmp_path)
+        GraphUtils.clear_disk_cache()
+        GraphUtils.clear_expression_cache()
+        yield
+        GraphUtils.clear_disk_cache()
+        GraphUtils.configure_disk_cache(enabled=False)
+
+    def test_warm_cache_skips_sympy_and_sampling(self):
+        """Test that a second identical implicit plot is served from disk"""
+        _, cold = GraphUtils.graph("x**2 + y**2 = 4", engine="native", coords=False)
+
+        with patch.object(GraphUtils, "_compile_implicit", side_effect=AssertionError("parsed")), \
+                patch("robo_manim_add_ons.graph_utils.marching_squares", side_effect=AssertionError("sampled")):
+            _, warm = GraphUtils.graph("x**2  +  y**2 = 4", engine="native", coords=False)
+
+        assert warm.sample_count == cold.sample_count
+        np.testing.assert_array_equal(warm.points, cold.points)
+        assert GraphUtils.disk_cache_info()["hits"] == 1
+
+    def test_uniform_explicit_cached(self):
+        """Test that a second default graph("sin(x)") is a disk hit that skips sympy"""
+        _, cold = GraphUtils.graph("sin(x)", coords=False)
+        GraphUtils.clear_expression_cache()
+
+        with patch.object(GraphUtils, "_compile_explicit", side_effect=AssertionError("parsed")):
+            _, warm = GraphUtils.graph("sin(x)", coords=False)
+
+        assert GraphUtils.disk_cache_info()["hits"] == 1
+        assert warm.underlying_function(0.5) == pytest.approx(np.sin(0.5))
+
+    def test_uniform_plot_replays_recorded_grid(self):
+        """Test that a warm axes.plot() reads its whole grid from disk without compiling"""
+        cold = GraphUtils._create_uniform_plot(_GridAxes(), "x**2", lambda: np.square, [-1, 1])
+        compiled = []
+        warm = GraphUtils._create_uniform_plot(_GridAxes(), "x**2", lambda: compiled.append(1) or np.square, [-1, 1])
+
+        assert warm == cold
+        assert not compiled
+        assert GraphUtils.disk_cache_info()["hits"] == 1
+
+    def test_settings_are_part_of_key(self):
+        """Test that different sampling settings are stored separately"""
+        GraphUtils.graph("tan(x)", sampling="adaptive", coords=False)
+        GraphUtils.graph("tan(x)", sampling="adaptive", tolerance=1e-4, coords=False)
+        GraphUtils.graph("tan(x)", sampling="adaptive", x_range=[-3, 3], coords=False)
+
+        assert GraphUtils.disk_cache_info()["entries"] == 3
+
+    def test_underlying_function_compiled_lazily(self):
+        """Test that a plot served from disk still evaluates its function"""
+        GraphUtils.graph("x**2", sampling="adaptive", coords=False)
+        GraphUtils.clear_expression_cache()
+        _, plot = GraphUtils.graph("x**2", sampling="adaptive", coords=False)
+
+        assert GraphUtils.expression_cache_info()["misses"] == 0
+        assert plot.underlying_function(3.0) == 9.0
+
+    def test_parametric_cached(self):
+        """Test that adaptive parametric samples are cached"""
+        GraphUtils.graph("cos(t)", "sin(t)", sampling="adaptive", coords=False)
+        GraphUtils.graph("cos(t)", "sin(t)", sampling="adaptive", coords=False)
+        assert GraphUtils.disk_cache_info()["hits"] == 1
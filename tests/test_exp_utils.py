@@ -0,0 +1,190 @@
+"""
+Tests for exp_utils module.
+"""
+
+import pytest
+import numpy as np
+from manim import Dot, Line
+from robo_manim_add_ons.exp_utils import x, y, st, ed, mid, vec, mag, uv, ang, val, ln, pt
+from robo_manim_add_ons.point_utils import PointRef, addp
+
+
+class _Point:
+    """Plain object exposing get_center(), like any Mobject."""
+
+    def __init__(self, *coords):
+        self.center = np.array(coords, dtype=float)
+
+    def get_center(self):
+        return self.center
+
+
+class _Delegating:
+    """Object that only provides get_center() through __getattr__."""
+
+    def __getattr__(self, name):
+        if name == "get_center":
+            return lambda: np.array([7.0, 8.0, 0.0])
+        raise AttributeError(name)
+
+
+class TestCoercion:
+    """Tests for the shared coercion layer"""
+
+    def test_x_y_accept_every_input_kind(self):
+        """Test that objects, arrays, lists and tuples give the same coordinates"""
+        for obj in (Dot(np.array([1.5, -2.0, 0.0])), _Point(1.5, -2.0, 0.0),
+                    np.array([1.5, -2.0, 0.0]), [1.5, -2.0], (1.5, -2.0)):
+            assert x(obj) == pytest.approx(1.5)
+            assert y(obj) == pytest.approx(-2.0)
+
+    def test_sequences_give_python_floats(self):
+        """Test that integer lists and arrays are returned as floats"""
+        assert isinstance(x([3, 4]), float)
+        assert isinstance(y(np.array([3, 4])), float)
+
+    def test_dynamic_attributes(self):
+        """Test objects whose method is only reachable through __getattr__"""
+        obj = _Delegating()
+        assert x(obj) == 7.0
+        assert y(obj) == 8.0
+
+    def test_unsupported_type(self):
+        """Test that unsupported types raise TypeError naming the type"""
+        with pytest.raises(TypeError, match="Unsupported type str"):
+            x("1, 2")
+        with pytest.raises(TypeError):
+            mag(1.0, 2.0)
+
+    def test_instance_overrides_are_honored(self):
+        """Test that an instance attribute shadowing the class method is called"""
+        dot = Dot(np.array([1.0, 2.0, 0.0]))
+        dot.get_center = lambda: np.array([5.0, 6.0, 0.0])
+        assert (x(dot), y(dot)) == (5.0, 6.0)
+        assert mag(dot, [5.0, 9.0, 0.0]) == pytest.approx(3.0)
+
+        line = Line(np.array([0.0, 0.0, 0.0]), np.array([1.0, 0.0, 0.0]))
+        line.get_start = lambda: np.array([-2.0, 0.0, 0.0])
+        np.testing.assert_allclose(st(line).get_center(), [-2, 0, 0])
+
+    def test_array_subclasses_are_coordinates(self):
+        """Test that ndarray subclasses are read like plain arrays"""
+        class Vector(np.ndarray):
+            pass
+
+        vector = np.array([3.0, 4.0, 0.0]).view(Vector)
+        assert (x(vector), y(vector)) == (3.0, 4.0)
+        assert mag(vector) == pytest.approx(5.0)
+        np.testing.assert_allclose(st(vector).get_center(), [3, 4, 0])
+
+
+class TestHelpers:
+    """Tests for the helpers built on the coercion layer"""
+
+    def test_start_end_of_line_and_points(self):
+        """Test st()/ed() on a Line and on raw coordinates"""
+        line = Line(np.array([0.0, 0.0, 0.0]), np.array([3.0, 4.0, 0.0]))
+        np.testing.assert_allclose(st(line).get_center(), [0, 0, 0])
+        np.testing.assert_allclose(ed(line).get_center(), [3, 4, 0])
+        np.testing.assert_allclose(st([1.0, 2.0, 0.0]).get_center(), [1, 2, 0])
+
+    def test_mid_rejects_coordinates(self):
+        """Test that mid() needs an object with a midpoint"""
+        with pytest.raises(TypeError):
+            mid([1.0, 2.0, 0.0])
+        with pytest.raises(TypeError):
+            mid(np.zeros(3))
+
+    def test_vec_and_mag(self):
+        """Test vec() on arrays and mag() on vectors and point pairs"""
+        np.testing.assert_allclose(vec([3.0, 4.0, 0.0]), [3, 4, 0])
+        assert mag(np.array([3.0, 4.0, 0.0])) == pytest.approx(5.0)
+        assert mag([3.0, 4.0, 0.0]) == pytest.approx(5.0)
+        assert mag(_Point(0, 0, 0), [3.0, 4.0, 0.0]) == pytest.approx(5.0)
+
+    def test_val_of_numbers(self):
+        """Test that val() passes numbers through"""
+        assert val(2.5) == 2.5
+        assert val(3) == 3
+
+    def test_ln_from_point_and_numbers(self):
+        """Test ln(dot, x, y) and ln(x, y, dot)"""
+        dot = Dot(np.array([1.0, 1.0, 0.0]))
+        np.testing.assert_allclose(ln(dot, 4.0, 5.0).get_end(), [4, 5, 0])
+        np.testing.assert_allclose(ln(4.0, 5.0, dot).get_start(), [4, 5, 0])
+        with pytest.raises(TypeError):
+            ln([1.0, 1.0], 4.0, 5.0)
+
+
+class TestPointRef:
+    """Tests for the lazy point references returned by the helpers"""
+
+    def test_helpers_return_lazy_points(self):
+        """Test that st/ed/mid/pt return PointRefs without building a Dot"""
+        line = Line(np.array([0.0, 0.0, 0.0]), np.array([4.0, 2.0, 0.0]))
+        for point in (st(line), ed(line), mid(line), pt(1, 2)):
+            assert isinstance(point, PointRef)
+            assert isinstance(point, Dot)
+            assert not point.materialized
+
+    def test_chaining_never_materializes(self):
+        """Test that feeding points into other helpers keeps them lazy"""
+        line = Line(np.array([0.0, 0.0, 0.0]), np.array([4.0, 2.0, 0.0]))
+        start, center = st(line), mid(line)
+        np.testing.assert_allclose(vec(start, center), [2, 1, 0])
+        assert mag(start, center) == pytest.approx(np.sqrt(5))
+        assert x(center) == 2.0
+        ln(start, center)
+        addp(center, np.array([0.0, 1.0, 0.0]))
+        assert not start.materialized and not center.materialized
+
+    def test_array_behaviour(self):
+        """Test that a PointRef can be used like its coordinate array"""
+        point = pt(1, 2)
+        np.testing.assert_allclose(np.asarray(point), [1, 2, 0])
+        assert point[1] == 2.0
+        np.testing.assert_allclose(point + np.array([1.0, 0.0, 0.0]), [2, 2, 0])
+        np.testing.assert_allclose(np.array([0.0, 0.0, 1.0]) - point, [-1, -2, 1])
+        np.testing.assert_allclose(2 * point, [2, 4, 0])
+        assert type(point - pt(1, 1)) is np.ndarray
+        assert not point.materialized
+
+    def test_unpacking_and_length(self):
+        """Test that a PointRef unpacks into its coordinates and has length 3"""
+        line = Line(np.array([0.0, 0.0, 0.0]), np.array([4.0, 2.0, 0.0]))
+        x0, y0, z0 = mid(line)
+        assert (x0, y0, z0) == (2.0, 1.0, 0.0)
+        assert list(pt(1, 2)) == [1.0, 2.0, 0.0]
+        point = pt(1, 2)
+        assert len(point) == 3
+        assert not point.materialized
+
+    def test_single_argument_helpers_use_coordinates(self):
+        """Test that mag/vec/uv/ang treat a PointRef as its coordinate array"""
+        point = pt(3, 4)
+        assert mag(point) == pytest.approx(5.0)
+        np.testing.assert_allclose(vec(point), [3, 4, 0])
+        np.testing.assert_allclose(uv(point), [0.6, 0.8, 0])
+        assert ang(pt(0, 2)) == pytest.approx(np.pi / 2)
+        np.testing.assert_allclose(mid(point).get_center(), [3, 4, 0])
+        assert not point.materialized
+
+        built = pt(3, 4)
+        built.set_color("red")
+        assert mag(built) == pytest.approx(5.0)
+
+    def test_mobject_use_materializes_in_place(self):
+        """Test that the first mobject attribute access builds the Dot in place"""
+        point = pt(3, 4)
+        assert point.set_color("red") is point
+        assert point.materialized
+        assert type(point) is PointRef
+        np.testing.assert_allclose(point.get_center(), [3, 4, 0])
+        assert len(point.points) > 0
+
+    def test_start_and_end_of_a_point(self):
+        """Test that a point starts and ends at itself"""
+        point = pt(1, -1)
+        np.testing.assert_allclose(st(point), [1, -1, 0])
+        np.testing.assert_allclose(ed(point), [1, -1, 0])
+        assert not point.materialized
@@ -0,0 +1,393 @@
+"""
+Tests for graph_utils module.
+"""
+
+import pytest
+import numpy as np
+from unittest.mock import patch, MagicMock
+from robo_manim_add_ons.graph_utils import GraphUtils
+from robo_manim_add_ons.path_utils import SampledPlot
+
+
+@pytest.fixture(autouse=True)
+def fresh_expression_cache():
+    """Start every test with an empty, enabled expression cache."""
+    GraphUtils.configure_expression_cache(enabled=True)
+    GraphUtils.clear_expression_cache()
+    GraphUtils.configure_axes_cache(enabled=True)
+    GraphUtils.clear_axes_cache()
+    GraphUtils.clear_pi_label_cache()
+    yield
+    GraphUtils.configure_expression_cache(enabled=True)
+    GraphUtils.clear_expression_cache()
+    GraphUtils.configure_axes_cache(enabled=True)
+    GraphUtils.clear_axes_cache()
+
+
+class TestExpressionCache:
+    """Tests for the compiled-expression cache"""
+
+    def test_repeated_explicit_expression_hits_cache(self):
+        """Test that the second compile of the same expression is a cache hit"""
+        first = GraphUtils._compile_explicit("sin(x)")
+        second = GraphUtils._compile_explicit("sin(x)")
+
+        assert first[2] is second[2], "Should return the same numpy callable"
+        info = GraphUtils.expression_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_whitespace_and_function_notation_normalized(self):
+        """Test that equivalent spellings share a cache entry"""
+        GraphUtils._compile_explicit("x**2 +  1")
+        GraphUtils._compile_explicit("y = x**2 + 1")
+
+        assert GraphUtils.expression_cache_info()["hits"] == 1
+
+    def test_plot_kind_is_part_of_key(self):
+        """Test that explicit and implicit compiles do not collide"""
+        GraphUtils._compile_implicit("x**2 + y**2 = 4")
+        GraphUtils._compile_parametric("cos(t)", "sin(t)")
+
+        info = GraphUtils.expression_cache_info()
+        assert info["misses"] == 2
+        assert info["size"] == 2
+
+    def test_cached_callable_evaluates(self):
+        """Test that the cached callable still evaluates correctly"""
+        GraphUtils._compile_explicit("x**2")
+        _, _, func = GraphUtils._compile_explicit("x**2")
+
+        np.testing.assert_allclose(func(np.array([1.0, 2.0, 3.0])), [1.0, 4.0, 9.0])
+
+    def test_lru_eviction(self):
+        """Test that the oldest entry is evicted when the cache is full"""
+        GraphUtils.configure_expression_cache(maxsize=2)
+        try:
+            GraphUtils._compile_explicit("x")
+            GraphUtils._compile_explicit("x**2")
+            GraphUtils._compile_explicit("x**3")
+            GraphUtils._compile_explicit("x")
+
+            info = GraphUtils.expression_cache_info()
+            assert info["size"] == 2
+            assert info["hits"] == 0, "'x' should have been evicted"
+        finally:
+            GraphUtils.configure_expression_cache(maxsize=256)
+
+    def test_opt_out_per_call(self):
+        """Test that cache=False bypasses the cache"""
+        first = GraphUtils._compile_explicit("cos(x)", cache=False)
+        second = GraphUtils._compile_explicit("cos(x)", cache=False)
+
+        assert first[2] is not second[2]
+        assert GraphUtils.expression_cache_info()["size"] == 0
+
+    def test_disabled_cache_stores_nothing(self):
+        """Test that a disabled cache always re-parses"""
+        GraphUtils.configure_expression_cache(enabled=False)
+        GraphUtils._compile_explicit("tan(x)")
+        GraphUtils._compile_explicit("tan(x)")
+
+        info = GraphUtils.expression_cache_info()
+        assert info["size"] == 0
+        assert info["hits"] == 0
+
+    def test_invalid_expression_not_cached(self):
+        """Test that expressions raising errors are not stored"""
+        with pytest.raises(ValueError):
+            GraphUtils._compile_explicit("x*y")
+
+        assert GraphUtils.expression_cache_info()["size"] == 0
+
+
+class TestAxesCache:
+    """Tests for the axes template cache"""
+
+    def test_same_configuration_reuses_template(self):
+        """Test that a second graph with the same axes setup copies the template"""
+        axes_a, _ = GraphUtils.graph("x**2")
+        axes_b, _ = GraphUtils.graph("x**3")
+
+        assert axes_a is not axes_b, "Each graph should get its own copy"
+        info = GraphUtils.axes_cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 1
+
+    def test_configuration_is_part_of_key(self):
+        """Test that ranges, lengths and tick modes select different templates"""
+        GraphUtils.graph("x**2", coords=False)
+        GraphUtils.graph("x**2", x_range=[-3, 3], coords=False)
+        GraphUtils.graph("x**2", x_length=4, coords=False)
+        GraphUtils.graph("x**2", axis_config={"include_tip": False}, coords=False)
+        GraphUtils.graph("sin(x)", coords=False)
+
+        info = GraphUtils.axes_cache_info()
+        assert info["hits"] == 0
+        assert info["size"] == 5
+
+    def test_copies_are_independent(self):
+        """Test that modifying a returned axes does not change later copies"""
+        axes_a, plot = GraphUtils.graph("x**2")
+        axes_a.add(plot)
+        axes_b, _ = GraphUtils.graph("x**2")
+
+        assert len(axes_b.submobjects) == len(axes_a.submobjects) - 1
+
+    def test_provided_axes_not_cached(self):
+        """Test that explicitly passed axes bypass the cache"""
+        axes, _ = GraphUtils.graph("x**2")
+        same, _ = GraphUtils.graph("x**3", axes=axes)
+
+        assert same is axes
+        assert GraphUtils.axes_cache_info()["misses"] == 1
+
+    def test_clear_and_size_limit(self):
+        """Test clear_axes_cache() and LRU eviction"""
+        GraphUtils.configure_axes_cache(maxsize=2)
+        try:
+            for low in (-1, -2, -3):
+                GraphUtils.graph("x", x_range=[low, 1], coords=False)
+            assert GraphUtils.axes_cache_info()["size"] == 2
+
+            GraphUtils.clear_axes_cache()
+            assert GraphUtils.axes_cache_info()["size"] == 0
+        finally:
+            GraphUtils.configure_axes_cache(maxsize=32)
+
+    def test_opt_out_per_call(self):
+        """Test that cache=False builds fresh axes"""
+        GraphUtils.graph("x**2", cache=False)
+        assert GraphUtils.axes_cache_info()["size"] == 0
+
+
+class TestPiTicks:
+    """Tests for π tick generation and the rendered label cache"""
+
+    def test_label_reduced_to_lowest_terms(self):
+        """Test LaTeX labels for multiples of π/n"""
+        assert GraphUtils.pi_tick_label(0) == "0"
+        assert GraphUtils.pi_tick_label(1) == r"\pi"
+        assert GraphUtils.pi_tick_label(-2) == r"-2\pi"
+        assert GraphUtils.pi_tick_label(2, 4) == r"\frac{\pi}{2}"
+        assert GraphUtils.pi_tick_label(-3, 2) == r"-\frac{3\pi}{2}"
+        assert GraphUtils.pi_tick_label(5, 6) == r"\frac{5\pi}{6}"
+
+    def test_builtin_modes(self):
+        """Test that "pi", "pi/2" and "2pi" produce the expected spacing"""
+        assert [label for _, label in GraphUtils.pi_ticks("pi", [0, 7])] == ["0", r"\pi", r"2\pi"]
+        assert len(GraphUtils.pi_ticks("pi/2", [-5, 5])) == 7
+        assert [label for _, label in GraphUtils.pi_ticks("2pi", [-7, 7])] == [r"-2\pi", "0", r"2\pi"]
+
+    def test_arbitrary_fraction_of_pi(self):
+        """Test that any pi/n spacing is generated without a lookup table"""
+        ticks = GraphUtils.pi_ticks("pi/6", [0, np.pi])
+
+        assert len(ticks) == 7
+        np.testing.assert_allclose([v for v, _ in ticks], np.arange(7) * np.pi / 6)
+        assert ticks[3][1] == r"\frac{\pi}{2}"
+
+    def test_range_endpoints_included(self):
+        """Test that ticks exactly at the range ends are kept"""
+        ticks = GraphUtils.pi_ticks("pi", [-np.pi, np.pi])
+        assert len(ticks) == 3
+
+    def test_labels_rendered_once(self):
+        """Test that repeated π ticks reuse the rendered MathTex"""
+        with patch('robo_manim_add_ons.graph_utils.MathTex') as mock_tex:
+            axes = MagicMock()
+            GraphUtils._add_pi_ticks(axes, 'x', "pi", [0, 7])
+            GraphUtils._add_pi_ticks(axes, 'y', "pi", [0, 7])
+
+            assert mock_tex.call_count == 3
+            info = GraphUtils.pi_label_cache_info()
+            assert info["hits"] == 3
+            assert info["size"] == 3
+
+    def test_font_size_is_part_of_key(self):
+        """Test that the same label at another font size is rendered separately"""
+        with patch('robo_manim_add_ons.graph_utils.MathTex') as mock_tex:
+            axes = MagicMock()
+            GraphUtils._add_pi_ticks(axes, 'x', "pi", [1, 4])
+            GraphUtils._add_pi_ticks(axes, 'x', "pi", [1, 4], font_size=36)
+
+            assert mock_tex.call_count == 2
+            mock_tex.assert_any_call(r"\pi", font_size=36)
+
+
+class TestGraphMany:
+    """Tests for graph_many"""
+
+    def test_returns_one_plot_per_expression(self):
+        """Test that every expression becomes a plot on the shared axes"""
+        axes, plots = GraphUtils.graph_many(["sin(x)", "cos(x)", "x/4"], x_range=[-4, 4], y_range=[-2, 2])
+
+        assert len(plots) == 3
+        for plot in plots:
+            assert plot.get_axes_affine() is not None
+            np.testing.assert_allclose(plot.polylines[0][[0, -1], 0], [-4, 4])
+
+    def test_single_vectorized_evaluation(self):
+        """Test that all curves come from one callable evaluated on one grid"""
+        compiled, func = GraphUtils._compile_explicit_many(["sin(x)", "2", "t**2"])
+        xs = np.linspace(0, 1, 5)
+        values = func(xs)
+
+        assert len(compiled) == 3
+        np.testing.assert_allclose(values[0], np.sin(xs))
+        assert values[1] == 2
+        np.testing.assert_allclose(values[2], xs ** 2)
+
+    def test_curves_share_grid(self):
+        """Test that all curves are sampled at the same x-values"""
+        _, plots = GraphUtils.graph_many(["x", "x**2"], x_range=[-1, 1], y_range=[-1, 1], samples=11)
+
+        np.testing.assert_array_equal(plots[0].polylines[0][:, 0], plots[1].polylines[0][:, 0])
+        assert plots[0].sample_count == 11
+
+    def test_undefined_regions_split(self):
+        """Test that curves are split where they are undefined"""
+        _, plots = GraphUtils.graph_many(["1/x", "log(x)"], x_range=[-2, 2], y_range=[-5, 5], samples=41)
+
+        assert len(plots[0].polylines) == 2
+        assert plots[1].polylines[0][:, 0].min() > 0
+
+    def test_underlying_function_attached(self):
+        """Test that each plot keeps its own function for axes.i2gp()"""
+        _, plots = GraphUtils.graph_many(["x**2", "x**3"])
+        assert plots[1].underlying_function(2.0) == 8.0
+
+    def test_equation_rejected(self):
+        """Test that implicit equations raise ValueError"""
+        with pytest.raises(ValueError):
+            GraphUtils.graph_many(["x**2", "x**2 + y**2 = 4"])
+
+    def test_empty_rejected(self):
+        """Test that an empty list raises ValueError"""
+        with pytest.raises(ValueError):
+            GraphUtils.graph_many([])
+
+
+class TestBoundParams:
+    """Tests for parameter-bound explicit plots"""
+
+    def test_params_are_extra_arguments(self):
+        """Test that parameters become positional arguments after x"""
+        _, _, func = GraphUtils._compile_explicit("a*sin(b*x)", params=("a", "b"))
+        assert func(np.pi / 2, 3.0, 1.0) == pytest.approx(3.0)
+
+    def test_multi_letter_params_not_split(self):
+        """Test that parameter names survive implicit multiplication"""
+        var, expr, func = GraphUtils._compile_explicit("amp*sin(freq x)", params=("amp", "freq"))
+
+        assert str(var) == "x"
+        assert func(np.pi / 2, 2.0, 1.0) == pytest.approx(2.0)
+
+    def test_param_names_are_part_of_key(self):
+        """Test that bound and unbound compiles of the same text do not collide"""
+        GraphUtils._compile_explicit("a*x", params=("a",))
+        with pytest.raises(ValueError):
+            GraphUtils._compile_explicit("a*x")
+
+    def test_updater_overwrites_points_in_place(self):
+        """Test that changing a tracker re-evaluates without replacing arrays"""
+        from manim import ValueTracker
+        a = ValueTracker(1)
+        _, plot = GraphUtils.graph("a*x**2", params={"a": a}, x_range=[-2, 2], y_range=[-8, 8], coords=False)
+        points, line = plot.points, plot.polylines[0]
+
+        a.set_value(2)
+        for updater in plot.updaters:
+            updater(plot)
+
+        assert plot.points is points
+        assert plot.polylines[0] is line
+        np.testing.assert_allclose(line[:, 1], 2 * line[:, 0] ** 2)
+
+    def test_plain_numbers_accepted(self):
+        """Test that parameters may be fixed numbers"""
+        _, plot = GraphUtils.graph("k*x", params={"k": 3}, samples=5, coords=False)
+        np.testing.assert_allclose(plot.polylines[0][:, 1], 3 * np.linspace(-5, 5, 5))
+
+    def test_undefined_values_rebuild_pieces(self):
+        """Test that values becoming undefined split the plot"""
+        from manim import ValueTracker
+        a = ValueTracker(1)
+        _, plot = GraphUtils.graph("sqrt(x - a)", params={"a": a}, x_range=[0, 4], coords=False)
+        assert plot.polylines[0][:, 0].min() >= 1
+
+        a.set_value(-1)
+        for updater in plot.updaters:
+            updater(plot)
+        assert plot.polylines[0][0, 0] == 0
+
+    def test_lod_rejected_for_implicit(self):
+        """Test that lod raises ValueError for non-explicit plots"""
+        with pytest.raises(ValueError):
+            GraphUtils.graph("x**2 + y**2 = 4", lod=True)
+
+    def test_params_rejected_for_implicit(self):
+        """Test that params raise ValueError for non-explicit plots"""
+        with pytest.raises(ValueError):
+            GraphUtils.graph("x**2 + y**2 = r", params={"r": 4})
+
+
+class TestImplicitWorkers:
+    """Tests for multi-process implicit plots"""
+
+    def test_default_engine_is_manim(self):
+        """Test that implicit plots stay Manim ImplicitFunctions unless engine="native" is asked for"""
+        _, plot = GraphUtils.graph("x**2 + y**2 = 4", coords=False)
+        _, native = GraphUtils.graph("x**2 + y**2 = 4", engine="native", coords=False)
+
+        assert not isinstance(plot, SampledPlot)
+        assert isinstance(native, SampledPlot)
+
+    def test_native_engine_skips_poles(self):
+        """Test that y = tan(x) as an equation has no segments across its asymptotes"""
+        _, plot = GraphUtils.graph("y = tan(x)", engine="native", x_range=[-3, 3], y_range=[-3, 3], coords=False)
+
+        assert len(plot.polylines) == 3
+
+    def test_worker_processes_match_single_process(self):
+        """Test that tiles contoured in worker processes merge into the same curve"""
+        _, single = GraphUtils.graph("x**2 + y**2 = 4", engine="native", resolution=32, coords=False)
+        _, pooled = GraphUtils.graph("x**2 + y**2 = 4", engine="native", resolution=32, workers=2, coords=False)
+
+        assert len(pooled.polylines) == 1
+        assert pooled.sample_count == single.sample_count
+
+
+class TestParametricPlot:
+    """Tests for parametric plots"""
+
+    def test_compiles_to_single_callable(self):
+        """Test that both components are lambdified into one callable"""
+        _, _, _, func = GraphUtils._compile_parametric("cos(t)", "2")
+        xs, ys = func(np.array([0.0, np.pi]))
+
+        np.testing.assert_allclose(xs, [1.0, -1.0])
+        assert ys == 2
+
+    def test_default_is_parametric_function(self):
+        """Test that parametric plots stay ParametricFunctions unless sampling="adaptive" is asked for"""
+        with patch("robo_manim_add_ons.graph_utils.ParametricFunction") as parametric:
+            _, plot = GraphUtils.graph("cos(t)", "sin(t)", coords=False)
+
+        assert plot is parametric.return_value
+        assert not isinstance(plot, SampledPlot)
+
+    def test_adaptive_plot_reports_sample_count(self):
+        """Test that an adaptive parametric plot reports its samples"""
+        _, plot = GraphUtils.graph("cos(t)", "sin(t)", x_range=[-2, 2], y_range=[-2, 2], coords=False,
+                                   sampling="adaptive")
+        _, finer = GraphUtils.graph("cos(t)", "sin(t)", x_range=[-2, 2], y_range=[-2, 2], coords=False,
+                                    sampling="adaptive", tolerance=1e-5)
+
+        assert plot.sample_count == sum(len(line) for line in plot.polylines)
+        assert finer.sample_count > plot.sample_count
+
+    def test_unknown_sampling_mode(self):
+        """Test that an unknown sampling mode raises ValueError"""
+        with pytest.raises(ValueError):
+            GraphUtils.graph("cos(t)", "sin(t)", sampling="bogus")
@@ -0,0 +1,181 @@
+"""
+Tests for hatch_utils module.
+"""
+
+import pytest
+import numpy as np
+from robo_manim_add_ons.hatch_utils import (
+    hatch_angle, hatch_segments, cached_hatch_segments, hatch_cache_info, clear_hatch_cache, configure_hatch_cache
+)
+
+SQUARE = [(0, 0), (4, 0), (4, 4), (0, 4)]
+TRIANGLE = [(0.3, 0.1), (2.7, 0.4), (1.2, 2.9)]
+
+
+@pytest.fixture(autouse=True)
+def reset_hatch_cache():
+    """Start every test with an empty, enabled hatch cache."""
+    configure_hatch_cache(enabled=True)
+    clear_hatch_cache()
+    yield
+    configure_hatch_cache(enabled=True)
+    clear_hatch_cache()
+
+
+class TestHatchAngle:
+    """Tests for hatch_angle()"""
+
+    def test_named_directions(self):
+        """Test the four named directions"""
+        assert hatch_angle("-") == (0.0, 1.0)
+        assert hatch_angle("|")[0] == pytest.approx(np.pi / 2)
+        assert hatch_angle("/")[0] == pytest.approx(np.pi / 4)
+        assert hatch_angle("\\")[0] == pytest.approx(3 * np.pi / 4)
+
+    def test_numeric_angle(self):
+        """Test that numbers are angles in degrees with perpendicular spacing"""
+        angle, factor = hatch_angle(30)
+        assert angle == pytest.approx(np.pi / 6)
+        assert factor == 1.0
+
+    def test_unknown_direction(self):
+        """Test that unknown strings raise ValueError"""
+        with pytest.raises(ValueError):
+            hatch_angle("x")
+
+
+class TestHatchSegments:
+    """Tests for hatch_segments()"""
+
+    def test_horizontal_square(self):
+        """Test horizontal hatching of a square spans its full width"""
+        segments = hatch_segments([SQUARE], spacing=1, direction="-", anchor=(0, 0.5))
+        np.testing.assert_allclose(segments[:, 0, 1], [0.5, 1.5, 2.5, 3.5])
+        np.testing.assert_allclose(segments[:, :, 0], [[0, 4]] * 4)
+
+    def test_vertical_square(self):
+        """Test vertical hatching places lines at the anchor's phase"""
+        segments = hatch_segments([SQUARE], spacing=1, direction="|", anchor=(0.5, 0))
+        np.testing.assert_allclose(np.sort(segments[:, 0, 0]), [0.5, 1.5, 2.5, 3.5])
+        np.testing.assert_allclose(np.sort(segments[:, :, 1], axis=1), [[0, 4]] * 4, atol=1e-12)
+
+    def test_diagonal_spacing_is_vertical(self):
+        """Test that '/' keeps the historical spacing measured vertically"""
+        segments = hatch_segments([SQUARE], spacing=1, direction="/", anchor=(0, 0.5))
+        # Lines y = x + b for b = ..., -0.5, 0.5, 1.5, ...
+        intercepts = np.sort(segments[:, 0, 1] - segments[:, 0, 0])
+        np.testing.assert_allclose(np.diff(intercepts), 1.0)
+        np.testing.assert_allclose(segments[:, 1, 1] - segments[:, 1, 0], segments[:, 0, 1] - segments[:, 0, 0])
+
+    def test_segments_stay_inside(self):
+        """Test that arbitrary-angle segments end on the boundary of the polygon"""
+        segments = hatch_segments([SQUARE], spacing=0.3, direction=30)
+        assert len(segments) > 0
+        ends = segments.reshape(-1, 2)
+        on_boundary = np.isclose(ends, 0) | np.isclose(ends, 4)
+        assert on_boundary.any(axis=1).all()
+        assert ((ends >= -1e-9) & (ends <= 4 + 1e-9)).all()
+
+    def test_concave_polygon_splits_lines(self):
+        """Test that a U shape yields two segments on lines crossing both arms"""
+        u_shape = [(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)]
+        segments = hatch_segments([u_shape], spacing=1, direction="-", anchor=(0, 0.5))
+        np.testing.assert_allclose(segments[:, :, 0], [[0, 3], [0, 1], [2, 3], [0, 1], [2, 3]])
+
+    def test_vertex_on_hatch_line(self):
+        """Test that a vertex exactly on a hatch line is counted once"""
+        diamond = [(0, -1), (1, 0), (0, 1), (-1, 0)]
+        segments = hatch_segments([diamond], spacing=1, direction="-")
+        np.testing.assert_allclose(segments, [[[-1, 0], [1, 0]]])
+
+    def test_empty_when_no_line_crosses(self):
+        """Test that a polygon thinner than the spacing may have no hatch lines"""
+        sliver = [(0, 0.1), (4, 0.1), (4, 0.2), (0, 0.2)]
+        assert hatch_segments([sliver], spacing=1, direction="-").shape == (0, 2, 2)
+
+    def test_invalid_arguments(self):
+        """Test that bad spacing and degenerate rings raise ValueError"""
+        with pytest.raises(ValueError):
+            hatch_segments([SQUARE], spacing=0)
+        with pytest.raises(ValueError):
+            hatch_segments([[(0, 0), (1, 1)]])
+
+    def test_hole_is_left_blank(self):
+        """Test that an inner ring cuts each crossing line into two segments"""
+        outer = [(-2, -2), (2, -2), (2, 2), (-2, 2)]
+        inner = [(-1, -1), (1, -1), (1, 1), (-1, 1)]
+        segments = hatch_segments([outer, inner], spacing=1, direction="-", anchor=(0, 0.5))
+        np.testing.assert_allclose(segments[:, :, 0], [[-2, 2], [-2, -1], [1, 2], [-2, -1], [1, 2], [-2, 2]])
+
+
+class TestHatchCache:
+    """Tests for cached_hatch_segments()"""
+
+    def test_translated_copy_hits(self):
+        """Test that a shifted copy is served from the cache"""
+        first = cached_hatch_segments([TRIANGLE], 0.25, "-")
+        shifted = [(x + 1.3, y + 0.75) for x, y in TRIANGLE]
+        second = cached_hatch_segments([shifted], 0.25, "-")
+
+        assert hatch_cache_info()["hits"] == 1
+        np.testing.assert_allclose(second, first + [1.3, 0.75], atol=1e-12)
+
+    def test_scaled_copy_with_scaled_spacing_hits(self):
+        """Test that a scaled copy with proportionally scaled spacing hits"""
+        cached_hatch_segments([TRIANGLE], 0.2, 30, anchor=(0.3, 0.1))
+        scaled = [(3 * x, 3 * y) for x, y in TRIANGLE]
+        result = cached_hatch_segments([scaled], 0.6, 30, anchor=(0.9, 0.3))
+
+        assert hatch_cache_info()["hits"] == 1
+        np.testing.assert_allclose(result, hatch_segments([scaled], 0.6, 30, anchor=(0.9, 0.3)), atol=1e-9)
+
+    @pytest.mark.parametrize("direction", ["/", "\\", "|", "-", 30, -70])
+    def test_matches_uncached(self, direction):
+        """Test that hits and misses agree with hatch_segments() at other phases and scales"""
+        for shift, scale, spacing in [(0, 1, 0.2), (1.37, 1, 0.2), (5, 2.5, 0.5), (0.1, 0.5, 0.1)]:
+            ring = [(x * scale + shift, y * scale - shift) for x, y in TRIANGLE]
+            cached = cached_hatch_segments([ring], spacing, direction, anchor=(-1, -2))
+            direct = hatch_segments([ring], spacing, direction, anchor=(-1, -2))
+            np.testing.assert_allclose(cached, direct, atol=1e-9)
+
+    @pytest.mark.parametrize("ring, spacing", [
+        ([(-0.5, -0.5), (-2.5, 0.0), (2.0, 2.0)], 0.1),
+        ([(2.0, -2.5), (2.5, -0.5), (2.5, -2.0)], 0.25),
+        ([(-1.5, 0.5), (-1.0, -1.0), (0.5, 2.5)], 0.5),
+        ([(0.0, 1.5), (0.5, -1.0), (2.0, 0.5)], 0.25),
+    ])
+    def test_vertices_on_hatch_lines_match_uncached(self, ring, spacing):
+        """Test that vertices lying exactly on a hatch line are counted as in hatch_segments()"""
+        cached = cached_hatch_segments([ring], spacing, "/")
+        direct = hatch_segments([ring], spacing, "/")
+
+        assert len(cached) == len(direct)
+        np.testing.assert_allclose(cached, direct, atol=1e-9)
+
+    def test_copies_with_fixed_spacing_and_anchor_hit(self):
+        """Test that translated and scaled copies hit with the same absolute spacing and anchor"""
+        anchor = (-5.0, -5.0)
+        cached_hatch_segments([TRIANGLE], 0.2, "/", anchor=anchor)
+        shifted = [(x + 0.37, y - 1.1) for x, y in TRIANGLE]
+        scaled = [(2.5 * x, 2.5 * y) for x, y in TRIANGLE]
+        for ring in (shifted, scaled):
+            result = cached_hatch_segments([ring], 0.2, "/", anchor=anchor)
+            np.testing.assert_allclose(result, hatch_segments([ring], 0.2, "/", anchor=anchor), atol=1e-9)
+
+        assert hatch_cache_info()["hits"] == 2
+        assert hatch_cache_info()["misses"] == 1
+
+    def test_different_direction_misses(self):
+        """Test that the direction is part of the key"""
+        cached_hatch_segments([SQUARE], 0.2, "/")
+        cached_hatch_segments([SQUARE], 0.3, "/")
+        cached_hatch_segments([SQUARE], 0.2, "\\")
+        assert hatch_cache_info()["misses"] == 2
+
+    def test_disabled_cache(self):
+        """Test that a disabled cache stores nothing"""
+        configure_hatch_cache(enabled=False)
+        cached_hatch_segments([SQUARE], 0.2, "/")
+        cached_hatch_segments([SQUARE], 0.2, "/")
+        assert hatch_cache_info()["size"] == 0
+        assert hatch_cache_info()["hits"] == 0
@@ -359,3 +359,555 @@ def test_intersect_line_circle_near_tangent():
     points = [dot.get_center() for dot in result]
     distance_between = np.linalg.norm(points[0] - points[1])
     assert distance_between < 2, "Intersection points should be closer than diameter"
+
+
+def test_line_intersections_batch_matches_scalar():
+    """Test that the batched line kernel agrees with intersect_lines() pair by pair."""
+    from robo_manim_add_ons.intersection_utils import line_intersections
+
+    rng = np.random.default_rng(0)
+    segments1 = rng.normal(size=(200, 2, 3))
+    segments2 = rng.normal(size=(200, 2, 3))
+    segments1[..., 2] = segments2[..., 2] = 0
+
+    points, valid = line_intersections(segments1, segments2)
+
+    assert points.shape == (200, 3) and valid.all()
+    # Every point lies on both lines
+    for segments in (segments1, segments2):
+        d = segments[:, 1] - segments[:, 0]
+        r = points - segments[:, 0]
+        assert np.allclose(d[:, 0] * r[:, 1] - d[:, 1] * r[:, 0], 0, atol=1e-8)
+
+
+def test_line_intersections_batch_parallel_and_bounded():
+    """Test the validity mask for parallel lines and for hits outside the segments."""
+    from robo_manim_add_ons.intersection_utils import line_intersections
+
+    segments1 = np.array([[[-1, 0, 0], [1, 0, 0]]] * 3, dtype=float)
+    segments2 = np.array([
+        [[0, -1, 0], [0, 1, 0]],   # crosses inside both
+        [[-1, 1, 0], [1, 1, 0]],   # parallel
+        [[3, -1, 0], [3, 1, 0]],   # crosses the extension of the first segment
+    ], dtype=float)
+
+    points, valid = line_intersections(segments1, segments2)
+    assert list(valid) == [True, False, True]
+    assert np.allclose(points[2], [3, 0, 0])
+    assert np.isnan(points[1]).all()
+
+    _, valid = line_intersections(segments1, segments2, bounded=True)
+    assert list(valid) == [True, False, False]
+
+
+def test_line_intersections_broadcasts_single_segment():
+    """Test that one segment is intersected with many."""
+    from robo_manim_add_ons.intersection_utils import line_intersections
+
+    verticals = np.array([[[x, -1, 0], [x, 1, 0]] for x in range(5)], dtype=float)
+    points, valid = line_intersections(np.array([[0, 0, 0], [1, 0, 0]], dtype=float), verticals)
+    assert valid.all()
+    assert np.allclose(points[:, 0], range(5))
+
+
+def test_line_circle_intersections_batch():
+    """Test secant, tangent, miss and bounded cases in one call."""
+    from robo_manim_add_ons.intersection_utils import line_circle_intersections
+
+    segments = np.array([
+        [[-3, 0, 0], [3, 0, 0]],    # secant through the center
+        [[-3, 2, 0], [3, 2, 0]],    # tangent at the top
+        [[-3, 5, 0], [3, 5, 0]],    # miss
+        [[-3, 0, 0], [-2.5, 0, 0]], # secant only when extended
+    ], dtype=float)
+
+    points, valid = line_circle_intersections(segments, ORIGIN, 2.0)
+    assert valid.tolist() == [[True, True], [True, False], [False, False], [True, True]]
+    assert np.allclose(points[0], [[-2, 0, 0], [2, 0, 0]])
+    assert np.allclose(points[1, 0], [0, 2, 0])
+
+    _, valid = line_circle_intersections(segments, ORIGIN, 2.0, bounded=True)
+    assert valid.tolist() == [[True, True], [True, False], [False, False], [False, False]]
+
+
+def test_intersection_points_compacts_valid_hits():
+    """Test that raw-array output drops invalid entries."""
+    from robo_manim_add_ons.intersection_utils import line_circle_intersections, intersection_points
+
+    segments = np.array([[[-3, 0, 0], [3, 0, 0]], [[-3, 5, 0], [3, 5, 0]]], dtype=float)
+    points = intersection_points(*line_circle_intersections(segments, [[0, 0, 0], [0, 0, 0]], [1.0, 1.0]))
+    assert points.shape == (2, 3)
+    assert np.allclose(points[:, 0], [-1, 1])
+
+
+def _brute_force_pairs(segments):
+    """All crossing pairs (i, j) of non-parallel segments, by direct pairwise solve."""
+    from robo_manim_add_ons.intersection_utils import line_intersections
+
+    n = len(segments)
+    i, j = np.triu_indices(n, 1)
+    _, valid = line_intersections(segments[i], segments[j], bounded=True)
+    return set(zip(i[valid].tolist(), j[valid].tolist()))
+
+
+def test_segment_intersections_matches_brute_force():
+    """Test that the grid broad phase finds exactly the pairwise hits."""
+    from robo_manim_add_ons.intersection_utils import segment_intersections
+
+    rng = np.random.default_rng(3)
+    starts = rng.uniform(-7, 7, size=(300, 2))
+    segments = np.zeros((300, 2, 3))
+    segments[:, 0, :2] = starts
+    segments[:, 1, :2] = starts + rng.normal(scale=0.8, size=(300, 2))
+
+    points, pairs = segment_intersections(segments)
+
+    assert set(map(tuple, pairs.tolist())) == _brute_force_pairs(segments)
+    assert np.all(pairs[:, 0] < pairs[:, 1])
+    # Each point lies on both of its segments
+    for (i, j), point in zip(pairs, points):
+        for k in (i, j):
+            start, end = segments[k]
+            assert np.linalg.norm(np.cross(end - start, point - start)) < 1e-9
+
+
+def test_segment_intersections_cell_size_does_not_change_result():
+    """Test that a tiny grid, a single-cell grid and the default agree."""
+    from robo_manim_add_ons.intersection_utils import segment_intersections
+
+    rng = np.random.default_rng(4)
+    segments = rng.uniform(-3, 3, size=(120, 2, 3))
+    segments[..., 2] = 0
+
+    _, default = segment_intersections(segments)
+    _, fine = segment_intersections(segments, cell_size=0.05)
+    _, coarse = segment_intersections(segments, cell_size=100)
+    assert np.array_equal(default, fine) and np.array_equal(default, coarse)
+
+
+def test_segment_intersections_touching_and_collinear():
+    """Test endpoint touches, T-junctions, collinear overlaps and disjoint collinear segments."""
+    from robo_manim_add_ons.intersection_utils import segment_intersections
+
+    segments = np.array([
+        [[0, 0, 0], [2, 0, 0]],  # 0
+        [[1, 0, 0], [3, 0, 0]],  # 1: overlaps 0 on [1, 2]
+        [[3, 0, 0], [4, 0, 0]],  # 2: meets 1 end to end
+        [[2, 0, 0], [2, 1, 0]],  # 3: T-junction on 1, shares endpoint with 0
+        [[5, 0, 0], [6, 0, 0]],  # 4: collinear but disjoint
+        [[0, 0, 0], [0, 1, 0]],  # 5: shares the start of 0
+    ], dtype=float)
+
+    points, pairs, pieces = segment_intersections(segments, overlaps=True)
+
+    assert pairs.tolist() == [[0, 1], [0, 3], [0, 5], [1, 2], [1, 3]]
+    assert np.allclose(pieces[0], [[1, 0, 0], [2, 0, 0]])
+    assert np.allclose(points[0], [1.5, 0, 0])
+    assert np.allclose(points[1:], [[2, 0, 0], [0, 0, 0], [3, 0, 0], [2, 0, 0]])
+    assert np.allclose(pieces[1:, 0], pieces[1:, 1])
+
+
+def test_segment_intersections_accepts_few_segments():
+    """Test empty results for fewer than two segments and for zero-length segments."""
+    from robo_manim_add_ons.intersection_utils import segment_intersections
+
+    points, pairs = segment_intersections(np.zeros((1, 2, 3)))
+    assert points.shape == (0, 3) and pairs.shape == (0, 2)
+
+    points, pairs = segment_intersections(np.zeros((3, 2, 3)))
+    assert len(points) == 0
+
+
+def _circle_cubics(center=(0, 0), radius=1.0, count=8, stretch=(1, 1)):
+    """Control points of a (stretched) circle made of cubic Bézier arcs, shape (count, 4, 3)."""
+    angles = np.linspace(0, 2 * np.pi, count + 1)
+    k = 4 / 3 * np.tan(np.pi / (2 * count))
+    cubics = []
+    for a0, a1 in zip(angles[:-1], angles[1:]):
+        p0, p3 = np.array([np.cos(a0), np.sin(a0)]), np.array([np.cos(a1), np.sin(a1)])
+        cubics.append([p0, p0 + k * np.array([-p0[1], p0[0]]), p3 - k * np.array([-p3[1], p3[0]]), p3])
+    cubics = np.array(cubics) * radius * np.array(stretch) + center
+    return np.concatenate([cubics, np.zeros((count, 4, 1))], axis=2)
+
+
+def _polyline_cubics(vertices):
+    """Control points of a polyline as straight cubic Bézier segments, shape (N - 1, 4, 3)."""
+    vertices = np.column_stack([np.asarray(vertices, dtype=float), np.zeros(len(vertices))])
+    starts, ends = vertices[:-1], vertices[1:]
+    return np.stack([starts, starts + (ends - starts) / 3, starts + 2 * (ends - starts) / 3, ends], axis=1)
+
+
+def test_bezier_intersections_circle_and_line():
+    """Test a secant line through a circle away from the cubic joints."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections
+
+    points = bezier_intersections(_circle_cubics(), _polyline_cubics([(0.5, -2), (0.5, 2)]))
+
+    assert points.shape == (2, 3)
+    assert np.allclose(points[:, 0], 0.5)
+    # Cubic arcs approximate the circle to about 1e-5
+    assert np.allclose(np.sort(points[:, 1]), [-np.sqrt(0.75), np.sqrt(0.75)], atol=1e-4)
+
+
+def test_bezier_intersections_stretched_circle():
+    """Test that an ellipse (a stretched circle) uses its real shape, not width / 2."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections
+
+    ellipse = _circle_cubics(stretch=(2, 1))
+    points = bezier_intersections(ellipse, _polyline_cubics([(-3, 0.5), (3, 0.5)]))
+
+    expected_x = 2 * np.sqrt(0.75)
+    assert np.allclose(np.sort(points[:, 0]), [-expected_x, expected_x], atol=1e-4)
+
+
+def test_bezier_intersections_two_circles_with_parameters():
+    """Test circle-circle hits and that the parameters map back to the points."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections, bezier_array, _evaluate
+
+    circle1, circle2 = _circle_cubics(), _circle_cubics(center=(1, 0))
+    points, params = bezier_intersections(circle1, circle2, parameters=True)
+
+    assert len(points) == 2
+    assert np.allclose(points[:, 0], 0.5, atol=1e-4)
+    for curve, column in ((circle1, 0), (circle2, 1)):
+        cubics = bezier_array(curve)
+        index = np.floor(params[:, column]).astype(int)
+        on_curve, _ = _evaluate(cubics[index], params[:, column] - index)
+        assert np.allclose(on_curve, points, atol=1e-7)
+
+
+def test_bezier_intersections_polygon_corners_and_overlap():
+    """Test hits at shared vertices and that collinear overlaps report only their ends."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections
+
+    square = _polyline_cubics([(-1, -1), (1, -1), (1, 1), (-1, 1), (-1, -1)])
+
+    diagonal = bezier_intersections(square, _polyline_cubics([(-2, -2), (2, 2)]))
+    assert np.allclose(diagonal, [[-1, -1, 0], [1, 1, 0]])
+
+    along_bottom = bezier_intersections(square, _polyline_cubics([(-2, -1), (2, -1)]))
+    assert np.allclose(np.sort(along_bottom[:, 0]), [-1, 1])
+
+
+def test_bezier_intersections_tangent():
+    """Test that a tangent line touching a circle gives one point."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections
+
+    points = bezier_intersections(_circle_cubics(), _polyline_cubics([(-2, 1), (2, 1)]))
+    assert np.allclose(points, [[0, 1, 0]], atol=1e-6)
+
+
+def test_bezier_intersections_matches_polyline_kernel_on_long_curves():
+    """Test hundreds of segments against the pairwise segment kernel."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections, line_intersections
+
+    xs = np.linspace(-7, 7, 401)
+    curve1 = np.column_stack([xs, np.sin(3 * xs), np.zeros_like(xs)])
+    curve2 = np.column_stack([xs, np.cos(2 * xs), np.zeros_like(xs)])
+
+    i, j = np.meshgrid(np.arange(400), np.arange(400), indexing="ij")
+    segments1 = np.stack([curve1[:-1], curve1[1:]], axis=1)[i.ravel()]
+    segments2 = np.stack([curve2[:-1], curve2[1:]], axis=1)[j.ravel()]
+    expected, valid = line_intersections(segments1, segments2, bounded=True)
+    expected = np.unique(np.round(expected[valid], 9), axis=0)
+
+    points = bezier_intersections(_polyline_cubics(curve1[:, :2]), _polyline_cubics(curve2[:, :2]))
+    assert np.allclose(points, expected, atol=1e-8)
+
+
+def test_bezier_intersections_disjoint_and_empty():
+    """Test curves that do not meet and empty inputs."""
+    from robo_manim_add_ons.intersection_utils import bezier_intersections
+
+    assert bezier_intersections(_circle_cubics(), _circle_cubics(center=(5, 0))).shape == (0, 3)
+    points, params = bezier_intersections(np.zeros((0, 3)), _circle_cubics(), parameters=True)
+    assert points.shape == (0, 3) and params.shape == (0, 2)
+
+
+def _curve(kind, cubics):
+    """A VMobject with the given control points, registered as the given geometric kind."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import register_geometry_kind
+
+    cls = type(f"Test{kind.title()}", (VMobject,), {})
+    register_geometry_kind(cls, kind)
+    mobject = cls()
+    mobject.set_points(np.asarray(cubics, dtype=float).reshape(-1, 3))
+    return mobject
+
+
+def test_intersect_straight_kinds():
+    """Test that lines, rays and segments keep to their own parameter ranges."""
+    from robo_manim_add_ons.intersection_utils import intersect, InfiniteLine, Ray
+
+    segment = Line(np.array([0.0, 1, 0]), np.array([1.0, -1, 0]))
+    assert np.allclose(intersect(InfiniteLine(LEFT, RIGHT), segment), [[0.5, 0, 0]])
+    assert np.allclose(intersect(Ray(ORIGIN, RIGHT), segment), [[0.5, 0, 0]])
+    assert len(intersect(Ray(ORIGIN, LEFT), segment)) == 0
+    assert len(intersect(Line(2 * RIGHT, 3 * RIGHT), segment)) == 0
+    # Collinear segments meeting end to end
+    assert np.allclose(intersect(Line(ORIGIN, RIGHT), Line(RIGHT, 2 * RIGHT)), [[1, 0, 0]])
+
+
+def test_intersect_line_and_circle_kinds():
+    """Test closed-form hits on a circle, an arc and a stretched circle."""
+    from robo_manim_add_ons.intersection_utils import intersect, InfiniteLine, Ray
+
+    circle = _curve("circle", _circle_cubics(radius=2))
+    assert np.allclose(intersect(Ray(ORIGIN, np.array([1.0, 1, 0])), circle), [[np.sqrt(2), np.sqrt(2), 0]])
+    points = intersect(InfiniteLine(np.array([-5.0, 0.5, 0]), np.array([5.0, 0.5, 0])), circle)
+    assert np.allclose(np.sort(points[:, 0]), [-np.sqrt(3.75), np.sqrt(3.75)])
+
+    upper_half = _curve("arc", _circle_cubics(radius=2)[:4])
+    assert np.allclose(intersect(InfiniteLine(DOWN, UP), upper_half), [[0, 2, 0]])
+
+    # A stretched circle is fitted as an ellipse, not as width / 2
+    ellipse = _curve("circle", _circle_cubics(stretch=(2, 1)))
+    points = intersect(InfiniteLine(np.array([-5.0, 0.5, 0]), np.array([5.0, 0.5, 0])), ellipse)
+    assert np.allclose(np.sort(points[:, 0]), [-np.sqrt(3), np.sqrt(3)], atol=1e-4)
+
+
+def test_intersect_polygonal_kinds():
+    """Test polygons and point-array polylines against each other and against circles."""
+    from robo_manim_add_ons.intersection_utils import intersect
+
+    square = _curve("polygon", _polyline_cubics([(-1, -1), (1, -1), (1, 1), (-1, 1), (-1, -1)]))
+    polyline = np.array([[-2, -2, 0], [2, 2, 0], [2, -2, 0]], dtype=float)
+    assert np.allclose(intersect(square, polyline), [[-1, -1, 0], [1, 1, 0]])
+
+    points = intersect(square, _curve("circle", _circle_cubics(radius=1.2)))
+    assert len(points) == 8
+    assert np.allclose(np.linalg.norm(points, axis=1), 1.2)
+
+
+def test_intersect_two_circles_and_arc():
+    """Test the closed-form circle-circle kernel and its arc filter."""
+    from robo_manim_add_ons.intersection_utils import intersect
+
+    circle1 = _curve("circle", _circle_cubics(radius=2))
+    circle2 = _curve("circle", _circle_cubics(center=(2, 0), radius=2))
+    points = intersect(circle1, circle2)
+    assert np.allclose(points[np.argsort(points[:, 1])], [[1, -np.sqrt(3), 0], [1, np.sqrt(3), 0]])
+
+    upper_half = _curve("arc", _circle_cubics(radius=2)[:4])
+    assert np.allclose(intersect(upper_half, circle2), [[1, np.sqrt(3), 0]])
+
+
+def test_intersect_falls_back_to_bezier():
+    """Test that generic curves and infinite lines go through the Bézier fallback."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import intersect, intersection_handler, InfiniteLine, _bezier_fallback
+
+    curve = VMobject()
+    curve.set_points(_circle_cubics(stretch=(3, 1), count=5).reshape(-1, 3))
+    line = InfiniteLine(DOWN, UP)
+
+    assert intersection_handler(line, curve) == (_bezier_fallback, False)
+    points = intersect(line, curve)
+    assert np.allclose(np.sort(points[:, 1]), [-1, 1], atol=1e-3)
+
+
+def test_register_intersection_for_new_kind():
+    """Test that third-party kinds get dispatched to their handlers, in either order."""
+    from robo_manim_add_ons.intersection_utils import (intersect, intersection_handler, register_geometry_kind,
+                                                       register_intersection, InfiniteLine)
+
+    class Parabola:
+        """y = x²"""
+
+    def line_parabola(line, parabola):
+        start, end = line.get_start(), line.get_end()
+        slope = (end[1] - start[1]) / (end[0] - start[0])
+        xs = np.roots([1, -slope, slope * start[0] - start[1]])
+        return np.array([[x, x * x, 0] for x in np.real(xs)])
+
+    register_geometry_kind(Parabola, "parabola")
+    register_intersection("line", "parabola", line_parabola)
+
+    line = InfiniteLine(np.array([0.0, 1, 0]), np.array([1.0, 1, 0]))
+    assert intersection_handler(Parabola(), line) == (line_parabola, True)
+    assert np.allclose(np.sort(intersect(Parabola(), line)[:, 0]), [-1, 1])
+
+
+def test_intersect_rejects_unknown_types():
+    """Test that objects without a geometric kind raise TypeError."""
+    from robo_manim_add_ons.intersection_utils import intersect
+
+    with pytest.raises(TypeError):
+        intersect(object(), Line(LEFT, RIGHT))
+
+
+def test_intersect_dispatch_overhead_is_small():
+    """Test that resolving a handler is a couple of dict lookups, not a search."""
+    import timeit
+    from robo_manim_add_ons.intersection_utils import intersection_handler
+
+    segment = Line(LEFT, RIGHT)
+    polyline = np.zeros((3, 3))
+    intersection_handler(segment, polyline)
+    per_call = min(timeit.repeat(lambda: intersection_handler(segment, polyline), number=2000, repeat=5)) / 2000
+    assert per_call < 20e-6
+
+
+def _moving_line(y):
+    """A horizontal InfiniteLine at height y."""
+    from robo_manim_add_ons.intersection_utils import InfiniteLine
+
+    return InfiniteLine(np.array([-2.0, y, 0]), np.array([2.0, y, 0]))
+
+
+def _set_height(line, y):
+    """Move a horizontal InfiniteLine in place."""
+    line.start[1] = line.end[1] = y
+
+
+def test_intersection_markers_follow_roots_with_warm_starts():
+    """Test that markers keep their identity and mostly skip full solves."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import IntersectionMarkers
+
+    circle = VMobject()
+    circle.set_points(_circle_cubics().reshape(-1, 3))
+    line = _moving_line(0.0)
+    markers = IntersectionMarkers(circle, line, full_every=10)
+
+    assert len(markers) == 2
+    right_id = markers.root_ids[np.argmax(markers.root_points[:, 0])]
+    right_dot = markers.get_marker(right_id)
+
+    for frame in range(1, 20):
+        _set_height(line, 0.02 * frame)
+        markers.refresh(1 / 30)
+        assert len(markers) == 2
+        right = markers.root_ids == right_id
+        assert markers.root_points[right, 0] > 0
+        assert np.allclose(np.abs(markers.root_points[:, 1]), 0.02 * frame)
+        assert markers.get_marker(right_id) is right_dot
+
+    assert markers.full_solves < 5
+
+
+def test_intersection_markers_match_after_full_solve():
+    """Test that a full solve hands each root back its own Dot."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import IntersectionMarkers
+
+    circle = VMobject()
+    circle.set_points(_circle_cubics().reshape(-1, 3))
+    line = _moving_line(0.1)
+    markers = IntersectionMarkers(circle, line, full_every=1)
+    ids = dict(zip(np.sign(markers.root_points[:, 0]).tolist(), markers.root_ids.tolist()))
+
+    _set_height(line, 0.3)
+    markers.refresh(1 / 30)
+    assert markers.full_solves == 2
+    assert dict(zip(np.sign(markers.root_points[:, 0]).tolist(), markers.root_ids.tolist())) == ids
+
+
+def test_intersection_markers_fade_and_revive():
+    """Test that vanished roots fade out, and a root coming back revives its Dot."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import IntersectionMarkers
+
+    circle = VMobject()
+    circle.set_points(_circle_cubics().reshape(-1, 3))
+    line = _moving_line(0.9)
+    markers = IntersectionMarkers(circle, line, fade_time=0.2, match_distance=1.0, full_every=1)
+    ids = set(markers.root_ids.tolist())
+
+    _set_height(line, 1.1)
+    markers.refresh(0.1)
+    assert len(markers.root_ids) == 0
+    assert len(markers) == 2  # still fading
+
+    _set_height(line, 0.9)
+    markers.refresh(0.1)
+    assert set(markers.root_ids.tolist()) == ids
+
+    _set_height(line, 1.1)
+    markers.refresh(0.1)
+    markers.refresh(0.15)
+    assert len(markers) == 0
+
+
+def test_intersection_markers_hide_immediately_without_fade():
+    """Test that fade_time=0 removes Dots as soon as their root is gone."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import IntersectionMarkers
+
+    circle = VMobject()
+    circle.set_points(_circle_cubics().reshape(-1, 3))
+    line = _moving_line(0.5)
+    markers = IntersectionMarkers(circle, line, fade_time=0)
+
+    _set_height(line, 3.0)
+    markers.refresh(1 / 30)
+    assert len(markers) == 0
+    assert len(markers.updaters) == 1
+
+
+def test_intersection_markers_pick_up_new_overlap_right_away():
+    """Test that circles moving into each other get markers on the first overlapping frame."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import IntersectionMarkers
+
+    fixed, moving = VMobject(), VMobject()
+    fixed.set_points(_circle_cubics().reshape(-1, 3))
+    moving.set_points(_circle_cubics(center=(3.0, 0)).reshape(-1, 3))
+    markers = IntersectionMarkers(fixed, moving, full_every=10)
+    assert len(markers.root_ids) == 0
+
+    for frame in range(1, 6):
+        moving.set_points(_circle_cubics(center=(3.0 - 0.3 * frame, 0)).reshape(-1, 3))
+        markers.refresh(1 / 30)
+        assert len(markers.root_ids) == (2 if 3.0 - 0.3 * frame < 2 else 0)
+    assert markers.full_solves < 5
+
+
+def test_intersection_markers_catch_tangent_turning_secant():
+    """Test that a second root appearing next to a live one is found before the next full solve."""
+    from manim import VMobject
+    from robo_manim_add_ons.intersection_utils import IntersectionMarkers
+
+    circle = VMobject()
+    circle.set_points(_circle_cubics().reshape(-1, 3))
+    line = _moving_line(1.0)
+    markers = IntersectionMarkers(circle, line, full_every=10)
+    assert len(markers.root_ids) == 1
+
+    _set_height(line, 0.99)
+    markers.refresh(1 / 30)
+    assert len(markers.root_ids) == 2
+    assert np.allclose(markers.root_points[:, 1], 0.99)
+
+
+def test_infinite_line_follows_its_line():
+    """Test that InfiniteLine(line) reads the line's endpoints on every call."""
+    from manim import Line, UP
+    from robo_manim_add_ons.intersection_utils import intersect, InfiniteLine
+
+    line = Line(np.array([-1.0, 0, 0]), np.array([1.0, 0, 0]))
+    extension = InfiniteLine(line)
+    wall = Line(np.array([3.0, -2, 0]), np.array([3.0, 2, 0]))
+    line.shift(UP)
+
+    assert np.allclose(extension.get_start(), [-1, 1, 0])
+    assert np.allclose(intersect(extension, wall), [[3, 1, 0]])
+
+
+def test_intersection_markers_track_moving_line_extensions():
+    """Test that extend=True follows the crossing of two Lines' extensions as a Line moves."""
+    from manim import Line
+    from robo_manim_add_ons.intersection_utils import live_intersections
+
+    line = Line(np.array([-1.0, 0, 0]), np.array([1.0, 0, 0]))
+    wall = Line(np.array([3.0, -1, 0]), np.array([3.0, 1, 0]))
+    markers = live_intersections(line, wall, extend=True)
+    assert np.allclose(markers.root_points, [[3, 0, 0]])
+    root_id = markers.root_ids[0]
+
+    for frame in range(1, 6):
+        line.shift(np.array([0.0, 0.1, 0]))
+        markers.refresh(1 / 30)
+        assert np.allclose(markers.root_points, [[3, 0.1 * frame, 0]])
+        assert np.allclose(markers.get_marker(root_id).get_center(), [3, 0.1 * frame, 0])
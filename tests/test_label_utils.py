@@ -5,7 +5,19 @@ Tests for label_utils module.
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
-from robo_manim_add_ons.label_utils import vertex_labels, edge_labels
+from manim import VMobject
+from robo_manim_add_ons.label_utils import (
+    vertex_labels, edge_labels, label_cache_info, clear_label_cache, configure_label_cache
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_labels():
+    """Build every label from the patched MathTex, so layout tests see the mock instances."""
+    configure_label_cache(enabled=False)
+    yield
+    configure_label_cache(enabled=True)
+    clear_label_cache()
 
 
 class TestVertexLabels:
@@ -172,6 +184,135 @@ class TestEdgeLabels:
             assert len(labels) == 3
 
 
+class TestLabelPlacement:
+    """Tests for collision-aware label placement"""
+
+    def make_label(self):
+        """Build a mock MathTex with a fixed size."""
+        label = MagicMock()
+        label.width, label.height = 0.4, 0.4
+        return label
+
+    def test_avoid_overlap_moves_labels(self):
+        """Test that avoid_overlap positions labels with move_to instead of next_to"""
+        polygon = MagicMock()
+        polygon.get_vertices.return_value = np.array([[0, 0, 0], [3, 0, 0], [1.5, 2.6, 0]])
+        polygon.get_center.return_value = np.array([1.5, 0.87, 0])
+
+        with patch('robo_manim_add_ons.label_utils.MathTex') as mock_tex:
+            mock_labels = [self.make_label() for _ in range(3)]
+            mock_tex.side_effect = mock_labels
+
+            vertex_labels(polygon, ['A', 'B', 'C'], avoid_overlap=True)
+
+            for mock_label in mock_labels:
+                mock_label.scale.assert_called_once_with(0.7)
+                mock_label.next_to.assert_not_called()
+                mock_label.move_to.assert_called_once()
+
+    def test_shared_placer_separates_calls(self):
+        """Test that vertex and edge labels sharing a placer do not overlap"""
+        from robo_manim_add_ons.placement_utils import LabelPlacer
+
+        # A very flat triangle: edge midpoints sit close to the vertices
+        polygon = MagicMock()
+        vertices = np.array([[0, 0, 0], [0.6, 0, 0], [0.3, 0.1, 0]])
+        polygon.get_vertices.return_value = vertices
+        polygon.get_center.return_value = vertices.mean(axis=0)
+
+        placer = LabelPlacer()
+        placer.add_polygon(vertices)
+        with patch('robo_manim_add_ons.label_utils.MathTex') as mock_tex:
+            mock_labels = [self.make_label() for _ in range(6)]
+            mock_tex.side_effect = mock_labels
+
+            vertex_labels(polygon, ['A', 'B', 'C'], placer=placer)
+            edge_labels(polygon, ['a', 'b', 'c'], placer=placer)
+
+        centers = np.array([label.move_to.call_args[0][0][:2] for label in mock_labels])
+        gaps = np.abs(centers[:, None, :] - centers[None, :, :]).max(axis=2)
+        assert (gaps[~np.eye(6, dtype=bool)] >= 0.4 - 1e-9).all()
+
+
+class TestLabelCache:
+    """Tests for the label template cache"""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        """Start every test with an empty, enabled label cache."""
+        configure_label_cache(enabled=True)
+        clear_label_cache()
+        yield
+        clear_label_cache()
+
+    def make_polygon(self):
+        """Build a mock triangle."""
+        polygon = MagicMock()
+        polygon.get_vertices.return_value = np.array([[0, 0, 0], [3, 0, 0], [1.5, 2.6, 0]])
+        polygon.get_center.return_value = np.array([1.5, 0.87, 0])
+        return polygon
+
+    def test_no_tex_after_warm_up(self):
+        """Test that repeated calls only copy cached templates"""
+        def make_template(text):
+            template = MagicMock()
+            template.copy.side_effect = MagicMock
+            return template
+
+        polygon = self.make_polygon()
+        with patch('robo_manim_add_ons.label_utils.MathTex', side_effect=make_template) as mock_tex:
+            vertex_labels(polygon, ['A', 'B', 'C'], cache=True)
+            assert mock_tex.call_count == 3
+
+            for _ in range(5):
+                labels = vertex_labels(polygon, ['A', 'B', 'C'], cache=True)
+            assert mock_tex.call_count == 3
+
+        info = label_cache_info()
+        assert info["misses"] == 3
+        assert info["hits"] == 15
+        # Each label is a copy, positioned on its own
+        for label in labels:
+            label.next_to.assert_called_once()
+
+    def test_key_includes_scale_and_color(self):
+        """Test that a different scale or color builds a new template"""
+        polygon = self.make_polygon()
+        with patch('robo_manim_add_ons.label_utils.MathTex') as mock_tex:
+            vertex_labels(polygon, ['A'], cache=True)
+            vertex_labels(polygon, ['A'], scale=0.5, cache=True)
+            vertex_labels(polygon, ['A'], color="#ff0000", cache=True)
+            edge_labels(polygon, ['A'], cache=True)
+            assert mock_tex.call_count == 4
+
+    def test_enabled_by_default(self):
+        """Test that labels come from the template cache unless cache=False"""
+        polygon = self.make_polygon()
+        with patch('robo_manim_add_ons.label_utils.MathTex') as mock_tex:
+            vertex_labels(polygon, ['A', 'B', 'C'])
+            vertex_labels(polygon, ['A', 'B', 'C'])
+            assert mock_tex.call_count == 3
+        assert label_cache_info()["hits"] == 3
+
+    def test_cache_false_builds_fresh(self):
+        """Test that cache=False builds a new MathTex every call"""
+        polygon = self.make_polygon()
+        with patch('robo_manim_add_ons.label_utils.MathTex') as mock_tex:
+            vertex_labels(polygon, ['A', 'B', 'C'], cache=False)
+            vertex_labels(polygon, ['A', 'B', 'C'], cache=False)
+            assert mock_tex.call_count == 6
+        assert label_cache_info()["size"] == 0
+
+    def test_disabled_cache_builds_fresh(self):
+        """Test that a disabled cache builds labels directly instead of copying templates"""
+        configure_label_cache(enabled=False)
+        polygon = self.make_polygon()
+        with patch('robo_manim_add_ons.label_utils.MathTex') as mock_tex:
+            labels = vertex_labels(polygon, ['A'])
+            assert labels[0] is mock_tex.return_value
+        assert label_cache_info()["misses"] == 0
+
+
 class TestLabelUtilsIntegration:
     """Integration tests for label utilities"""
 
@@ -195,3 +336,80 @@ class TestLabelUtilsIntegration:
             assert len(e_labels) == 3
             # 3 vertex + 3 edge = 6 total
             assert mock_tex.call_count == 6
+
+
+class TestTrackingLabels:
+    """Tests for tracking_vertex_labels and tracking_edge_labels"""
+
+    def make_polygon(self, vertices):
+        """Build a mock polygon whose vertices can be changed later."""
+        polygon = MagicMock()
+        polygon.vertices = np.array(vertices, dtype=float)
+        polygon.get_vertices.side_effect = lambda: polygon.vertices
+        polygon.get_center.side_effect = lambda: polygon.vertices.mean(axis=0)
+        return polygon
+
+    @staticmethod
+    def make_label(text):
+        """Build a real VMobject label whose next_to calls are recorded."""
+        label = VMobject()
+        label.text = text
+        label.next_to = MagicMock(wraps=label.next_to)
+        return label
+
+    def test_builds_once_and_moves(self):
+        """Test that updates move the same label objects instead of creating new ones"""
+        from robo_manim_add_ons.label_utils import tracking_vertex_labels
+
+        polygon = self.make_polygon([[0, 0, 0], [3, 0, 0], [1.5, 2.6, 0]])
+        with patch('robo_manim_add_ons.label_utils.MathTex', side_effect=self.make_label) as mock_tex:
+            group = tracking_vertex_labels(polygon, ['A', 'B', 'C'])
+            labels = list(group.submobjects)
+            assert mock_tex.call_count == 3
+            assert len(group.updaters) == 1
+
+            polygon.vertices = polygon.vertices + [1, 0, 0]
+            group.updaters[0](group)
+
+            assert mock_tex.call_count == 3
+            assert group.submobjects == labels
+            # Moved to the shifted vertex
+            assert labels[1].next_to.call_count == 2
+            np.testing.assert_allclose(labels[1].next_to.call_args[0][0], [4, 0, 0])
+
+    def test_vertex_count_changes(self):
+        """Test that only the affected labels are added or removed"""
+        from robo_manim_add_ons.label_utils import tracking_vertex_labels
+
+        polygon = self.make_polygon([[0, 0, 0], [2, 0, 0], [2, 2, 0]])
+        with patch('robo_manim_add_ons.label_utils.MathTex', side_effect=self.make_label) as mock_tex:
+            group = tracking_vertex_labels(polygon, ['A', 'B', 'C', 'D'])
+            first = list(group.submobjects)
+
+            polygon.vertices = np.array([[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0]], dtype=float)
+            group.reposition()
+            assert mock_tex.call_count == 4
+            assert group.submobjects[:3] == first
+            assert group.submobjects[3].text == 'D'
+
+            polygon.vertices = polygon.vertices[:3]
+            group.reposition()
+            assert group.submobjects == first
+
+    def test_edge_labels_with_callable(self):
+        """Test edge tracking with generated label names"""
+        from robo_manim_add_ons.label_utils import tracking_edge_labels
+
+        polygon = self.make_polygon([[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0]])
+        with patch('robo_manim_add_ons.label_utils.MathTex', side_effect=self.make_label):
+            group = tracking_edge_labels(polygon, lambda i: f"e_{i}")
+
+        assert [label.text for label in group.submobjects] == ["e_0", "e_1", "e_2", "e_3"]
+        np.testing.assert_allclose(group.submobjects[0].next_to.call_args[0][0], [1, 0, 0])
+
+    def test_invalid_kind(self):
+        """Test that an unknown kind raises ValueError"""
+        from robo_manim_add_ons.label_utils import TrackingLabels
+
+        with pytest.raises(ValueError):
+            TrackingLabels(self.make_polygon([[0, 0, 0], [1, 0, 0], [0, 1, 0]]), ['A'], kind="face")
@@ -0,0 +1,94 @@
+"""
+Tests for lod_utils module.
+"""
+
+import pytest
+import numpy as np
+from types import SimpleNamespace
+from robo_manim_add_ons.lod_utils import LODSampler
+from robo_manim_add_ons.sampling_utils import sample_explicit
+
+
+def make_frame(center, width, aspect=16 / 9):
+    """Build a stand-in camera frame with a center and a size."""
+    return SimpleNamespace(width=width, height=width / aspect, get_center=lambda: np.array([*center, 0.0]))
+
+
+# Axes coordinates map to scene points as x -> x, y -> y
+IDENTITY = np.array([[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+
+
+class TestLODSampler:
+    """Tests for LODSampler"""
+
+    def test_level_zero_matches_static_sampling(self):
+        """Test that level 0 over the whole domain equals a normal adaptive plot"""
+        sampler = LODSampler(np.sin, [-5, 5], [-2, 2])
+        pieces = sampler.sample(-5, 5, 0)
+        expected = sample_explicit(np.sin, [-5, 5], [-2, 2])
+
+        np.testing.assert_array_equal(pieces[0], expected[0])
+
+    def test_higher_level_samples_visible_tiles_only(self):
+        """Test that zoomed sampling covers the visible interval densely"""
+        sampler = LODSampler(np.sin, [-8, 8], [-2, 2])
+        pieces = sampler.sample(-0.5, 0.5, 4)
+
+        xs = pieces[0][:, 0]
+        assert xs.min() >= -3 and xs.max() <= 3, "only nearby tiles are sampled"
+        assert np.diff(xs).max() <= 1.0 / 64 + 1e-12
+
+    def test_tiles_joined_into_one_polyline(self):
+        """Test that a continuous function is not split at tile borders"""
+        sampler = LODSampler(np.cos, [-4, 4], [-2, 2])
+        pieces = sampler.sample(-4, 4, 3)
+
+        assert len(pieces) == 1
+        assert len(np.unique(pieces[0][:, 0])) == len(pieces[0])
+
+    def test_tiles_cached_per_level(self):
+        """Test that revisiting a level reuses the sampled tiles"""
+        calls = []
+
+        def func(x):
+            calls.append(1)
+            return np.sin(x)
+        sampler = LODSampler(func, [-4, 4], [-2, 2])
+        sampler.sample(-1, 1, 2)
+        count = len(calls)
+        sampler.sample(-1, 1, 2)
+
+        assert len(calls) == count
+        assert sampler.cache.info()["hits"] > 0
+
+    def test_level_matches_pixels_per_unit(self):
+        """Test that zooming in raises the level"""
+        sampler = LODSampler(np.sin, [-8, 8], [-2, 2], pixel_width=1920)
+        full = sampler.view(IDENTITY, make_frame([0, 0], 16))
+        zoomed = sampler.view(IDENTITY, make_frame([1, 0], 2))
+
+        assert zoomed[2] == full[2] + 3
+        assert zoomed[:2] == pytest.approx((0, 2))
+
+    def test_view_outside_domain(self):
+        """Test that a frame beside the plot reports nothing visible"""
+        sampler = LODSampler(np.sin, [-1, 1], pixel_width=1920)
+        assert sampler.view(IDENTITY, make_frame([10, 0], 2)) is None
+
+    def test_level_clamped(self):
+        """Test that density requests beyond max_level are clamped"""
+        sampler = LODSampler(np.sin, [0, 1], max_level=3)
+        assert sampler.level_for(1e9) == 3
+        assert sampler.level_for(0) == 0
+
+    def test_update_only_when_view_changes(self):
+        """Test that update() rebuilds the plot only on a new level or tile range"""
+        from robo_manim_add_ons.graph_utils import GraphUtils
+        _, plot = GraphUtils.graph("sin(x)", lod=True, coords=False)
+        plot.lod.pixel_width = 1920
+        affine = plot.get_axes_affine()
+        center = affine[0][:2]
+
+        assert plot.lod.update(plot, make_frame(center, 2)) is True
+        assert plot.lod.update(plot, make_frame(center + 1e-3, 2)) is False
+        assert plot.lod.update(plot, make_frame(center, 14)) is True
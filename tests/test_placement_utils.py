@@ -0,0 +1,107 @@
+"""
+Tests for placement_utils module.
+"""
+
+import pytest
+import numpy as np
+from robo_manim_add_ons.placement_utils import SpatialHash, LabelPlacer, segments_cross_boxes, overlap_areas
+
+
+def regular_polygon(n, radius):
+    """Vertices of a regular n-gon centered at the origin."""
+    angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    return np.column_stack([radius * np.cos(angles), radius * np.sin(angles), np.zeros(n)])
+
+
+class TestSpatialHash:
+    """Tests for SpatialHash"""
+
+    def test_query_only_returns_nearby_items(self):
+        """Test that items in far-away cells are not returned"""
+        grid = SpatialHash(cell_size=1.0)
+        grid.add_box([0.1, 0.1, 0.4, 0.4])
+        grid.add_box([10.1, 10.1, 10.4, 10.4])
+        grid.add_segment([0, -1], [0, 1])
+
+        boxes, segments = grid.query([0.0, 0.0, 0.5, 0.5])
+        np.testing.assert_allclose(boxes, [[0.1, 0.1, 0.4, 0.4]])
+        assert segments.shape == (1, 4)
+
+    def test_is_free(self):
+        """Test free checks against boxes and segments"""
+        grid = SpatialHash(cell_size=0.5)
+        grid.add_box([0, 0, 1, 1])
+        grid.add_segment([2, -1], [2, 1])
+
+        assert not grid.is_free([0.5, 0.5, 1.5, 1.5])
+        assert not grid.is_free([1.8, -0.2, 2.2, 0.2])
+        assert grid.is_free([1.0, 0.0, 1.5, 0.5])  # touching edges do not overlap
+        assert grid.is_free([2.5, 2.5, 3.0, 3.0])
+
+    def test_invalid_cell_size(self):
+        """Test that a non-positive cell size raises ValueError"""
+        with pytest.raises(ValueError):
+            SpatialHash(0)
+
+
+class TestGeometryKernels:
+    """Tests for the vectorized box tests"""
+
+    def test_segments_cross_boxes(self):
+        """Test crossing, passing-by and bounding-box-only cases"""
+        boxes = np.array([[0.0, 0.0, 1.0, 1.0]])
+        segments = np.array([
+            [-1.0, 0.5, 2.0, 0.5],   # straight through
+            [-1.0, 2.0, 2.0, 2.0],   # above
+            [0.9, 2.0, 2.0, 0.9],    # bounding boxes overlap, misses the corner
+            [0.5, 0.5, 0.6, 0.6],    # fully inside
+        ])
+        np.testing.assert_array_equal(segments_cross_boxes(boxes, segments), [[True, False, False, True]])
+
+    def test_overlap_areas(self):
+        """Test summed overlap areas"""
+        boxes = np.array([[0.0, 0.0, 2.0, 2.0]])
+        others = np.array([[1.0, 1.0, 3.0, 3.0], [5.0, 5.0, 6.0, 6.0], [0.0, 0.0, 1.0, 0.5]])
+        np.testing.assert_allclose(overlap_areas(boxes, others), [1.5])
+
+
+class TestLabelPlacer:
+    """Tests for LabelPlacer"""
+
+    def test_free_spot_matches_next_to(self):
+        """Test that an unobstructed label sits where next_to() would put it"""
+        placer = LabelPlacer()
+        center = placer.place([1.0, 1.0, 0.0], [1.0, 0.0, 0.0], 0.4, 0.3, buff=0.2)
+        np.testing.assert_allclose(center, [1.4, 1.0, 0.0])
+
+        diagonal = placer.place([-3.0, -3.0, 0.0], [-1.0, -1.0, 0.0], 0.4, 0.3, buff=0.2)
+        offset = 0.2 / np.sqrt(2)
+        np.testing.assert_allclose(diagonal, [-3.0 - offset - 0.2, -3.0 - offset - 0.15, 0.0])
+
+    def test_second_label_moves_aside(self):
+        """Test that a label at the same anchor avoids the first one"""
+        placer = LabelPlacer()
+        first = placer.place([0, 0, 0], [1, 0, 0], 0.4, 0.3, buff=0.2)
+        second = placer.place([0, 0, 0], [1, 0, 0], 0.4, 0.3, buff=0.2)
+        assert not np.allclose(first, second)
+        boxes = np.array([[c[0] - 0.2, c[1] - 0.15, c[0] + 0.2, c[1] + 0.15] for c in (first, second)])
+        assert overlap_areas(boxes[:1], boxes[1:])[0] == pytest.approx(0.0)
+
+    def test_dense_polygon_has_no_overlaps(self):
+        """Test that labels on a crowded 60-gon overlap neither each other nor the edges"""
+        vertices = regular_polygon(60, 3.0)
+        placer = LabelPlacer()
+        placer.add_polygon(vertices)
+        centers = np.array([placer.place(v, v, 0.3, 0.35, buff=0.3) for v in vertices])
+
+        boxes = np.hstack([centers[:, :2] - [0.15, 0.175], centers[:, :2] + [0.15, 0.175]])
+        np.testing.assert_allclose(overlap_areas(boxes, boxes), 0.3 * 0.35, atol=1e-12)
+        edges = np.hstack([vertices[:, :2], np.roll(vertices, -1, axis=0)[:, :2]])
+        assert not segments_cross_boxes(boxes, edges).any()
+
+    def test_blocked_everywhere_still_places(self):
+        """Test that a label is placed even when every candidate is blocked"""
+        placer = LabelPlacer()
+        placer.grid.add_box([-5, -5, 5, 5])
+        center = placer.place([0, 0, 0], [1, 0, 0], 0.4, 0.3, buff=0.2)
+        assert center.shape == (3,)
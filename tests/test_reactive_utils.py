@@ -0,0 +1,157 @@
+"""
+Tests for reactive_utils module.
+"""
+
+import pytest
+import numpy as np
+from manim import Dot, Line, Mobject, ValueTracker
+from robo_manim_add_ons import reactive_utils
+from robo_manim_add_ons.reactive_utils import Expr, rx, reactive, live
+from robo_manim_add_ons.point_utils import PointRef
+
+
+def _run_updaters(mob):
+    """Call the mobject's updaters once, like a rendered frame."""
+    for updater in mob.updaters:
+        updater(mob)
+
+
+class TestExpr:
+    """Tests for building and updating expression DAGs"""
+
+    def test_rx_mirrors_exp(self):
+        """Test that every Exp helper exists in reactive form and builds an Expr"""
+        for name in ("x", "y", "st", "ed", "mid", "mag", "vec", "val", "pt", "ln", "vt", "tri", "cr"):
+            assert callable(getattr(rx, name))
+        assert isinstance(rx.pt(1, 2), Expr)
+
+    def test_value_matches_eager_call(self):
+        """Test that an expression evaluates to what the helper returns"""
+        a, b = Dot(np.array([0.0, 0.0, 0.0])), Dot(np.array([3.0, 4.0, 0.0]))
+        assert rx.mag(a, b).get_value() == pytest.approx(5.0)
+        np.testing.assert_allclose(rx.mid(rx.ln(a, b)).get_value().get_center(), [1.5, 2, 0])
+
+    def test_only_changed_branches_reevaluate(self):
+        """Test that moving one source leaves the other branch cached"""
+        a, b = Dot(np.array([-1.0, 0.0, 0.0])), Dot(np.array([1.0, 0.0, 0.0]))
+        t = ValueTracker(1.0)
+        middle = rx.mid(rx.ln(a, b))
+        target = rx.pt(rx.val(t), 2.0)
+        seg = rx.ln(middle, target)
+        seg.update()
+        seg.update()
+        assert (middle.evaluations, target.evaluations, seg.evaluations) == (1, 1, 1)
+
+        t.set_value(3.0)
+        seg.update()
+        assert (middle.evaluations, target.evaluations, seg.evaluations) == (1, 2, 2)
+
+        a.shift(np.array([0.0, 2.0, 0.0]))
+        seg.update()
+        assert (middle.evaluations, target.evaluations, seg.evaluations) == (2, 2, 3)
+
+    def test_shared_sources_and_nodes(self):
+        """Test that a mobject used twice is one source and shared nodes update once per pass"""
+        a = Dot(np.array([1.0, 1.0, 0.0]))
+        shared = rx.x(a)
+        total = reactive(lambda u, v: u + v)(shared, shared)
+        assert total.inputs[0] is total.inputs[1]
+        assert rx.y(a).inputs[0] is shared.inputs[0]
+        assert total.get_value() == 2.0
+        assert shared.evaluations == 1
+
+    def test_checksum_of_number_mobjects_uses_points(self):
+        """Test that only ValueTrackers are summarized by get_value()"""
+        class Readout(Mobject):
+            def get_value(self):
+                return 1.0
+
+        readout = Readout()
+        readout.set_points(np.zeros((4, 3)))
+        before = reactive_utils._checksum(readout)
+        readout.shift(np.array([1.0, 0.0, 0.0]))
+        assert reactive_utils._checksum(readout) != before
+        assert reactive_utils._checksum(ValueTracker(2.5)) == 2.5
+
+    def test_custom_functions(self):
+        """Test reactive() on a plain function with keyword arguments"""
+        t = ValueTracker(2.0)
+        scaled = reactive(lambda value, factor=1.0: value.get_value() * factor)(t, factor=3.0)
+        assert scaled.get_value() == 6.0
+        t.set_value(4.0)
+        assert scaled.get_value() == 12.0
+
+
+class TestLive:
+    """Tests for live() outputs"""
+
+    def test_updates_in_place(self):
+        """Test that the output keeps its identity and follows its sources"""
+        a, b = Dot(np.array([0.0, 0.0, 0.0])), Dot(np.array([2.0, 0.0, 0.0]))
+        seg = rx.ln(a, b)
+        line = live(seg)
+        assert isinstance(line, Line)
+        assert len(line.updaters) == 1
+
+        b.shift(np.array([0.0, 1.0, 0.0]))
+        _run_updaters(line)
+        np.testing.assert_allclose(line.points[-1], [2, 1, 0])
+        assert seg.value is not line
+
+    def test_idle_frames_skip_evaluation(self):
+        """Test that frames without changes do not re-evaluate"""
+        a, b = Dot(np.array([0.0, 0.0, 0.0])), Dot(np.array([2.0, 0.0, 0.0]))
+        seg = rx.ln(a, b)
+        line = live(seg)
+        for _ in range(5):
+            _run_updaters(line)
+        assert seg.evaluations == 1
+
+    def test_sources_moved_by_earlier_updaters(self):
+        """Test that an output sees a source moved earlier in the same frame, and shared nodes evaluate once per change"""
+        a, b, t = Dot(np.array([0.0, 0.0, 0.0])), Dot(np.array([4.0, 0.0, 0.0])), ValueTracker(0.0)
+        follower = Dot(np.array([0.0, 1.0, 0.0]))
+        follower.add_updater(lambda m: m.move_to(np.array([t.get_value(), 1.0, 0.0])))
+        seg = rx.ln(a, follower)
+        first = live(rx.mid(seg))
+        second = live(rx.ln(rx.ed(seg), b))
+
+        for frame in range(1, 4):
+            t.set_value(float(frame))
+            # Scene order: first, then the follower, then second
+            for mob in (first, follower, second):
+                _run_updaters(mob)
+            np.testing.assert_allclose(second.points[0], [frame, 1, 0])
+            assert seg.evaluations == frame + 1
+
+        _run_updaters(first)
+        np.testing.assert_allclose(first.get_center(), [1.5, 0.5, 0])
+
+    def test_new_output_sees_current_state(self):
+        """Test that an output created between frames polls its sources on its first frame"""
+        a, b = Dot(np.array([0.0, 0.0, 0.0])), Dot(np.array([2.0, 0.0, 0.0]))
+        first = live(rx.ln(a, b))
+        _run_updaters(first)
+        second = live(rx.ln(b, a))
+        b.shift(np.array([0.0, 1.0, 0.0]))
+        _run_updaters(second)
+        _run_updaters(first)
+        np.testing.assert_allclose(second.points[0], [2, 1, 0])
+        np.testing.assert_allclose(first.points[-1], [2, 1, 0])
+
+    def test_point_outputs_move(self):
+        """Test that a PointRef output is moved to the new point"""
+        a, b = Dot(np.array([0.0, 0.0, 0.0])), Dot(np.array([2.0, 0.0, 0.0]))
+        center = live(rx.mid(rx.ln(a, b)))
+        assert isinstance(center, PointRef)
+        b.shift(np.array([2.0, 2.0, 0.0]))
+        _run_updaters(center)
+        np.testing.assert_allclose(center.get_center(), [2, 1, 0])
+
+    def test_rejects_non_mobject_values(self):
+        """Test that live() needs an Expr evaluating to a mobject"""
+        a = Dot(np.array([1.0, 0.0, 0.0]))
+        with pytest.raises(TypeError):
+            live(rx.x(a))
+        with pytest.raises(TypeError):
+            live(Line())
@@ -0,0 +1,146 @@
+"""
+Tests for sampling_utils module.
+"""
+
+import pytest
+import numpy as np
+from robo_manim_add_ons.sampling_utils import evaluate, evaluate_components, sample_explicit, sample_parametric
+
+
+class TestEvaluate:
+    """Tests for evaluate function"""
+
+    def test_constant_is_broadcast(self):
+        """Test that scalar results are broadcast to the input shape"""
+        values = evaluate(lambda x: 2, np.zeros(4))
+        np.testing.assert_array_equal(values, [2.0, 2.0, 2.0, 2.0])
+
+    def test_undefined_values_become_nan(self):
+        """Test that invalid results are NaN instead of raising"""
+        values = evaluate(np.log, np.array([-1.0, 1.0]))
+        assert np.isnan(values[0])
+        assert values[1] == 0.0
+
+    def test_components_evaluated_together(self):
+        """Test that a tuple-valued function yields one array per component"""
+        calls = []
+
+        def func(t):
+            calls.append(t)
+            return np.cos(t), 3
+        xs, ys = evaluate_components(func, np.zeros(3))
+
+        assert len(calls) == 1
+        np.testing.assert_array_equal(xs, [1.0, 1.0, 1.0])
+        np.testing.assert_array_equal(ys, [3.0, 3.0, 3.0])
+
+
+class TestSampleExplicit:
+    """Tests for sample_explicit function"""
+
+    def test_smooth_function_single_piece(self):
+        """Test that a smooth function is one polyline spanning the range"""
+        pieces = sample_explicit(np.sin, [-5, 5], [-2, 2])
+
+        assert len(pieces) == 1
+        assert pieces[0][0, 0] == -5
+        assert pieces[0][-1, 0] == 5
+
+    def test_smooth_function_stays_coarse(self):
+        """Test that smooth regions are not over-sampled"""
+        pieces = sample_explicit(np.sin, [-5, 5], [-2, 2], samples=65)
+        assert len(pieces[0]) < 200
+
+    def test_tan_split_at_asymptotes(self):
+        """Test that tan(x) is split into one piece per branch"""
+        pieces = sample_explicit(np.tan, [-5, 5], [-5, 5])
+
+        # Asymptotes at ±π/2 and ±3π/2 inside [-5, 5]
+        assert len(pieces) == 5
+        for asymptote in [-3 * np.pi / 2, -np.pi / 2, np.pi / 2, 3 * np.pi / 2]:
+            for piece in pieces:
+                assert not (piece[0, 0] < asymptote < piece[-1, 0])
+
+    def test_reciprocal_split_at_pole(self):
+        """Test that 1/x is split at x = 0"""
+        pieces = sample_explicit(lambda x: 1 / x, [-5, 5], [-5, 5])
+
+        assert len(pieces) == 2
+        assert pieces[0][-1, 0] < 0 < pieces[1][0, 0]
+
+    def test_step_discontinuity_split(self):
+        """Test that jumps of floor(x) are not joined by vertical strokes"""
+        pieces = sample_explicit(np.floor, [-2.5, 2.5], [-3, 3])
+        assert len(pieces) == 6
+
+    def test_undefined_region_dropped(self):
+        """Test that log(x) is only sampled where defined"""
+        pieces = sample_explicit(np.log, [-5, 5], [-5, 5])
+
+        assert len(pieces) == 1
+        assert pieces[0][:, 0].min() >= 0
+        assert np.isfinite(pieces[0]).all()
+
+    def test_refines_near_asymptote(self):
+        """Test that samples concentrate near the pole"""
+        pieces = sample_explicit(lambda x: 1 / x, [-5, 5], [-5, 5], samples=65)
+        right = pieces[1]
+
+        spacing_near = np.diff(right[:5, 0]).max()
+        spacing_far = np.diff(right[-5:, 0]).min()
+        assert spacing_near < spacing_far
+
+
+class TestSampleParametric:
+    """Tests for sample_parametric function"""
+
+    def test_circle_single_closed_piece(self):
+        """Test that a circle is one polyline that ends where it starts"""
+        pieces = sample_parametric(lambda t: (np.cos(t), np.sin(t)), [0, 2 * np.pi], [-2, 2], [-2, 2])
+
+        assert len(pieces) == 1
+        np.testing.assert_allclose(pieces[0][0], pieces[0][-1], atol=1e-12)
+
+    def test_one_call_per_level(self):
+        """Test that both components come from a single vectorized call per level"""
+        calls = []
+
+        def func(t):
+            calls.append(np.shape(t))
+            return np.cos(5 * t), np.sin(3 * t)
+        sample_parametric(func, [0, 2 * np.pi], [-1, 1], [-1, 1], max_depth=6)
+
+        assert 1 < len(calls) <= 7
+
+    def test_chord_deviation_within_tolerance(self):
+        """Test that a Lissajous figure is resolved to the requested tolerance"""
+        func = lambda t: (np.cos(7 * t), np.sin(11 * t))
+        tolerance = 1e-3
+        points = sample_parametric(func, [0, 2 * np.pi], [-1, 1], [-1, 1], tolerance=tolerance)[0]
+
+        # Re-evaluate the curve between samples and check it stays near the chords
+        ts = np.linspace(0, 2 * np.pi, 20001)
+        dense = np.column_stack(func(ts))
+        mids = (points[:-1] + points[1:]) / 2
+        nearest = np.min(np.linalg.norm(mids[:, None, :] - dense[None, ::10, :], axis=2), axis=1)
+        assert nearest.max() / 2 < 0.02
+
+    def test_samples_follow_curvature(self):
+        """Test that a tight spiral gets more samples than a large circle"""
+        spiral = sample_parametric(lambda t: (t * np.cos(t) / 60, t * np.sin(t) / 60), [0, 60], [-1, 1], [-1, 1])
+        circle = sample_parametric(lambda t: (np.cos(t), np.sin(t)), [0, 2 * np.pi], [-1, 1], [-1, 1])
+        assert sum(map(len, spiral)) > 2 * sum(map(len, circle))
+
+    def test_tolerance_controls_density(self):
+        """Test that a stricter tolerance produces more samples"""
+        func = lambda t: (np.cos(3 * t), np.sin(2 * t))
+        coarse = sample_parametric(func, [0, 2 * np.pi], [-1, 1], [-1, 1], tolerance=1e-2)
+        fine = sample_parametric(func, [0, 2 * np.pi], [-1, 1], [-1, 1], tolerance=1e-5)
+        assert len(fine[0]) > len(coarse[0])
+
+    def test_split_at_pole(self):
+        """Test that a component with a pole is split into separate pieces"""
+        pieces = sample_parametric(lambda t: (t, np.tan(t)), [-1, 4], [-1, 4], [-5, 5])
+
+        assert len(pieces) == 2
+        assert pieces[0][-1, 0] < np.pi / 2 < pieces[1][0, 0]